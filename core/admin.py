@@ -3,6 +3,7 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
 
 from core import models
+from core.attendance import set_latest_attendance
 
 
 # Register your models here.
@@ -44,5 +45,26 @@ class AttendanceAdmin(admin.ModelAdmin):
 
     username.short_description = "이름"
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if not change:
+            set_latest_attendance(obj)
+
 
 admin.site.register(models.Attendance, AttendanceAdmin)
+
+
+class SlackMessageAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "created_at",
+        "sent_at",
+    )
+    list_filter = ("status",)
+    readonly_fields = ("created_at", "sent_at")
+
+
+admin.site.register(models.SlackMessage, SlackMessageAdmin)
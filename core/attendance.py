@@ -0,0 +1,146 @@
+import datetime
+from typing import Iterable, Optional
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from core.models import Attendance, LatestAttendance
+
+# 마지막 퇴근 후 이 시간이 지나면 체크인이 없는 것으로 판단
+MIN_REST_TIME = datetime.timedelta(hours=8)
+# 마지막 출근 후 이 시간이 지나면 체크인이 없는 것으로 판단
+MAX_WORK_TIME = datetime.timedelta(days=1)
+
+NOT_CHECKED_IN_ERROR = "출근기록이 제출되지 않았습니다. 제출 시 출근을 선택해 주세요."
+
+
+class AttendanceError(Exception):
+    """
+    체크인/체크아웃할 수 없을 때 사용자에게 보여줄 메시지와 함께 냅니다.
+    """
+
+
+def get_latest_attendance(user: User, lock: bool = False) -> Optional[Attendance]:
+    """
+    사용자의 마지막 출근기록을 LatestAttendance의 기본키로 한 번에 찾습니다.
+    lock이면 트랜잭션이 끝날 때까지 같은 사용자의 체크인/체크아웃을 기다리게 합니다.
+    """
+    queryset = LatestAttendance.objects.select_related("attendance")
+    if lock:
+        queryset = queryset.select_for_update()
+    latest = queryset.filter(user=user).first()
+    if latest is not None:
+        return latest.attendance
+
+    # 마지막 기록이 삭제되었거나 아직 기록이 없는 경우
+    attendance = Attendance.objects.filter(user=user).order_by("date", "id").last()
+    if attendance is not None:
+        LatestAttendance.objects.get_or_create(
+            user=user, defaults={"attendance": attendance}
+        )
+    return attendance
+
+
+def set_latest_attendance(attendance: Attendance) -> None:
+    """
+    새 출근기록이 사용자의 마지막 기록보다 늦거나 같은 날이면 마지막 기록으로 가리킵니다.
+    check_in을 거치지 않고 추가한 기록(관리자 페이지 등)에 씁니다.
+    """
+    updated = LatestAttendance.objects.filter(
+        user_id=attendance.user_id, attendance__date__lte=attendance.date
+    ).update(attendance=attendance)
+    if not updated:
+        LatestAttendance.objects.get_or_create(
+            user_id=attendance.user_id, defaults={"attendance": attendance}
+        )
+
+
+def refresh_latest_attendances(user_ids: Iterable[int], batch_size: int = 500) -> int:
+    """
+    사용자들의 마지막 출근기록 포인터를 한 번에 다시 만듭니다. bulk_create로 출근기록을 넣은 뒤 호출합니다.
+    """
+    user_ids = list(user_ids)
+    latest_ids = (
+        Attendance.objects.filter(user_id=OuterRef("pk"))
+        .order_by("-date", "-id")
+        .values("id")[:1]
+    )
+
+    num_pointers = 0
+    for i in range(0, len(user_ids), batch_size):
+        batch = user_ids[i : i + batch_size]
+        rows = (
+            User.objects.filter(id__in=batch)
+            .annotate(latest_id=Subquery(latest_ids))
+            .filter(latest_id__isnull=False)
+            .values_list("id", "latest_id")
+        )
+        pointers = [
+            LatestAttendance(user_id=user_id, attendance_id=attendance_id)
+            for user_id, attendance_id in rows
+        ]
+        with transaction.atomic():
+            LatestAttendance.objects.filter(user_id__in=batch).delete()
+            LatestAttendance.objects.bulk_create(pointers)
+        num_pointers += len(pointers)
+    return num_pointers
+
+
+@transaction.atomic
+def check_in(user: User, ip_address: str, now: datetime.datetime = None) -> Attendance:
+    """
+    출근기록을 남깁니다. 오늘 이미 출근기록이 있으면 AttendanceError를 냅니다.
+    """
+    now = now or datetime.datetime.now()
+    attendance = get_latest_attendance(user, lock=True)
+
+    if attendance and now.date() == attendance.date:
+        start_date = attendance.date.strftime("%Y-%m-%d")
+        start_time = attendance.start_at.strftime("%H:%M:%S")
+        raise AttendanceError(
+            f"이미 출근기록이 있습니다({start_date} {start_time}). 기록을 남기시려면 퇴근을 선택해 주세요."
+        )
+
+    new_attendance = Attendance.objects.create(
+        user=user,
+        date=now.date(),
+        start_at=now.time().replace(microsecond=0),
+        created_by=user,
+        ip_address=ip_address,
+    )
+    # 위에서 잠근 포인터는 UPDATE 한 번으로 바꾸고, 포인터가 없으면(첫 출근) 새로 만듭니다.
+    if attendance is None:
+        LatestAttendance.objects.update_or_create(
+            user=user, defaults={"attendance": new_attendance}
+        )
+    else:
+        LatestAttendance.objects.filter(user=user).update(attendance=new_attendance)
+    return new_attendance
+
+
+@transaction.atomic
+def check_out(user: User, now: datetime.datetime = None) -> Attendance:
+    """
+    마지막 출근기록에 퇴근시간을 남깁니다. 이어지는 출근기록이 없으면 AttendanceError를 냅니다.
+    """
+    now = now or datetime.datetime.now()
+    attendance = get_latest_attendance(user, lock=True)
+    if attendance is None:
+        raise AttendanceError(NOT_CHECKED_IN_ERROR)
+
+    if attendance.end_at:
+        rest_time = now - datetime.datetime.combine(attendance.date, attendance.end_at)
+        if rest_time >= MIN_REST_TIME:
+            raise AttendanceError(NOT_CHECKED_IN_ERROR)
+    else:  # 마지막 항목에 체크아웃 시간이 없을 때
+        work_time = now - datetime.datetime.combine(
+            attendance.date, attendance.start_at
+        )
+        if work_time >= MAX_WORK_TIME:
+            raise AttendanceError(NOT_CHECKED_IN_ERROR)
+
+    attendance.end_at = now.time().replace(microsecond=0)
+    attendance.updated_by = user
+    attendance.save(update_fields=["end_at", "updated_by", "updated_at"])
+    return attendance
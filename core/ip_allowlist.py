@@ -0,0 +1,132 @@
+import ipaddress
+import os
+import threading
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Union
+
+from django.conf import settings
+
+from utils import logger
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_network(entry: str) -> List[Network]:
+    """
+    ALLOWED_CLIENT_IPS의 항목 하나를 네트워크로 바꿉니다.
+    "10.0.0.0/8", "2001:db8::/32" 같은 CIDR, "163.239.28.23" 같은 주소 외에
+    예전 형식인 "163.239." 또는 "10.1"은 옥텟 단위 prefix(163.239.0.0/16, 10.1.0.0/16)로 봅니다.
+    빈 문자열은 모든 주소를 허용합니다.
+    """
+    entry = entry.strip()
+    if not entry:
+        return [ipaddress.ip_network("0.0.0.0/0"), ipaddress.ip_network("::/0")]
+    if "/" in entry or ":" in entry:
+        return [ipaddress.ip_network(entry, strict=False)]
+
+    octets = entry.rstrip(".").split(".")
+    if len(octets) > 4 or not all(octets):
+        raise ValueError(f"Invalid IP prefix: {entry}")
+    address = ".".join(octets + ["0"] * (4 - len(octets)))
+    return [ipaddress.ip_network(f"{address}/{8 * len(octets)}")]
+
+
+class IPAllowList(object):
+    """
+    허용할 네트워크들을 IP 버전별로 겹치지 않는 정수 구간 [start, end]의 정렬된 배열로 만들어 둡니다.
+    주소 하나를 확인할 때는 이진 탐색 한 번이면 되므로 항목이 많아도 거의 일정한 시간이 걸립니다.
+    """
+
+    def __init__(self, entries: Iterable[str]):
+        networks = {4: [], 6: []}
+        for entry in entries:
+            try:
+                for network in parse_network(entry):
+                    networks[network.version].append(network)
+            except ValueError as e:
+                logger.error(f"ALLOWED_CLIENT_IPS 항목을 무시합니다: {e}")
+
+        self.intervals = {}
+        for version, version_networks in networks.items():
+            intervals = []
+            for network in ipaddress.collapse_addresses(version_networks):
+                start = int(network.network_address)
+                end = int(network.broadcast_address)
+                # 이어지는 구간은 하나로 합칩니다.
+                if intervals and start == intervals[-1][1] + 1:
+                    intervals[-1] = (intervals[-1][0], end)
+                else:
+                    intervals.append((start, end))
+            self.intervals[version] = (
+                [start for start, _ in intervals],
+                [end for _, end in intervals],
+            )
+
+    def __contains__(self, ip_str: Optional[str]) -> bool:
+        try:
+            address = ipaddress.ip_address(ip_str)
+        except ValueError:
+            return False
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+
+        starts, ends = self.intervals[address.version]
+        i = bisect_right(starts, int(address)) - 1
+        return i >= 0 and int(address) <= ends[i]
+
+
+_allowlist = None
+_allowlist_mtime = None
+_allowlist_lock = threading.Lock()
+
+
+def get_allowlist_mtime() -> Optional[float]:
+    """
+    ALLOWED_CLIENT_IPS_FILE이 바뀐 시각입니다. 바뀌면 허용 목록을 다시 만듭니다.
+    """
+    path = getattr(settings, "ALLOWED_CLIENT_IPS_FILE", None)
+    try:
+        return os.stat(path).st_mtime if path else None
+    except OSError:
+        return None
+
+
+def read_allowlist_file() -> List[str]:
+    path = getattr(settings, "ALLOWED_CLIENT_IPS_FILE", None)
+    if not path:
+        return []
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = [line.split("#", 1)[0].strip() for line in f]
+    except OSError as e:
+        logger.error(f"ALLOWED_CLIENT_IPS_FILE을 읽을 수 없습니다: {e}")
+        return []
+    return [line for line in lines if line]
+
+
+def get_allowlist() -> IPAllowList:
+    """
+    ALLOWED_CLIENT_IPS와 ALLOWED_CLIENT_IPS_FILE을 합친 허용 목록을 리턴합니다.
+    한 번 만든 목록은 파일이 바뀌거나 reset_allowlist()를 부를 때까지 다시 씁니다.
+    """
+    global _allowlist, _allowlist_mtime
+
+    mtime = get_allowlist_mtime()
+    if _allowlist is None or mtime != _allowlist_mtime:
+        with _allowlist_lock:
+            if _allowlist is None or mtime != _allowlist_mtime:
+                entries = list(getattr(settings, "ALLOWED_CLIENT_IPS", None) or [])
+                _allowlist = IPAllowList(entries + read_allowlist_file())
+                _allowlist_mtime = mtime
+    return _allowlist
+
+
+def reset_allowlist() -> None:
+    global _allowlist
+
+    with _allowlist_lock:
+        _allowlist = None
+
+
+def is_allowed_ip(ip_str: Optional[str]) -> bool:
+    return ip_str in get_allowlist()
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.slack import drain_outbox, get_delivery_stats
+
+
+class Command(BaseCommand):
+    help = "outbox에 쌓인 Slack 메시지를 보냅니다. 실패한 메시지는 backoff 후 다시 시도합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=100, help="한 번에 보낼 최대 메시지 수")
+        parser.add_argument(
+            "--workers", type=int, help="전송 스레드 수 (기본값: SLACK_OUTBOX_WORKERS)"
+        )
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 계속 보냅니다.")
+        parser.add_argument(
+            "--interval", type=float, default=5.0, help="--loop일 때 확인 간격(초)"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            started_at = time.monotonic()
+            results = drain_outbox(limit=options["limit"], workers=options["workers"])
+            if results or not options["loop"]:
+                summary = ", ".join(
+                    f"{key}: {count}" for key, count in sorted(results.items())
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Slack 메시지를 처리하였습니다. ({summary or '없음'}) "
+                        f"({time.monotonic() - started_at:.2f}s)"
+                    )
+                )
+                if options["verbosity"] > 1:
+                    stats = get_delivery_stats()
+                    self.stdout.write(
+                        ", ".join(
+                            f"{key}: {count}" for key, count in sorted(stats.items())
+                        )
+                    )
+            if not options["loop"]:
+                return
+            if sum(results.values()) < options["limit"]:
+                time.sleep(options["interval"])
@@ -0,0 +1,37 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.rollups import rebuild_rollups
+from core.statistics import bump_statistics_version
+
+
+class Command(BaseCommand):
+    help = "출근기록의 일별/월별 집계를 한 달씩 나눠 다시 만듭니다. 기간을 주지 않으면 전체를 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="시작 날짜 (YYYY-MM-DD)")
+        parser.add_argument("--end", help="끝 날짜 (YYYY-MM-DD)")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            start, end = (
+                datetime.date.fromisoformat(options[key]) if options[key] else None
+                for key in ("start", "end")
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        started_at = time.monotonic()
+        num_dailies, num_monthlies = rebuild_rollups(
+            start=start, end=end, batch_size=options["batch_size"]
+        )
+        bump_statistics_version()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"일별 집계 {num_dailies}건, 월별 집계 {num_monthlies}건을 만들었습니다. "
+                f"({time.monotonic() - started_at:.2f}s)"
+            )
+        )
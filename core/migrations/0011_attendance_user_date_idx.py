@@ -0,0 +1,19 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_profile_comp_days"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["user", "date"], name="attendance_user_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:13
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_attendance_user_date_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlackMessage",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("url", models.URLField(max_length=500, verbose_name="URL")),
+                ("payload", models.TextField(verbose_name="내용")),
+                (
+                    "status",
+                    model_utils.fields.StatusField(
+                        choices=[("PENDING", "대기"), ("SENT", "전송"), ("DEAD", "실패")],
+                        default="PENDING",
+                        max_length=100,
+                        no_check_for_status=True,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수"),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="다음 시도 시간"
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="마지막 오류")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="전송일"),
+                ),
+            ],
+            options={
+                "verbose_name": "Slack 메시지",
+                "verbose_name_plural": "Slack 메시지",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="slackmessage",
+            index=models.Index(
+                fields=["status", "next_attempt_at"], name="slack_status_next_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_slackmessage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="slackmessage",
+            name="digest_format",
+            field=models.CharField(
+                blank=True, max_length=200, verbose_name="묶음 메시지 형식"
+            ),
+        ),
+        migrations.AddField(
+            model_name="slackmessage",
+            name="digest_item",
+            field=models.CharField(blank=True, max_length=100, verbose_name="묶음 항목"),
+        ),
+        migrations.AddField(
+            model_name="slackmessage",
+            name="digest_key",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=200, verbose_name="묶음 키"
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:25
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_latest_attendance(apps, schema_editor):
+    Attendance = apps.get_model("core", "Attendance")
+    LatestAttendance = apps.get_model("core", "LatestAttendance")
+
+    latest = {}
+    for user_id, attendance_id in Attendance.objects.order_by(
+        "user_id", "date", "id"
+    ).values_list("user_id", "id"):
+        latest[user_id] = attendance_id
+    LatestAttendance.objects.bulk_create(
+        [
+            LatestAttendance(user_id=user_id, attendance_id=attendance_id)
+            for user_id, attendance_id in latest.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0011_update_proxy_permissions"),
+        ("core", "0013_slackmessage_digest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LatestAttendance",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="근무자",
+                    ),
+                ),
+                (
+                    "attendance",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="core.Attendance",
+                        verbose_name="마지막 출근기록",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "마지막 출근기록",
+                "verbose_name_plural": "마지막 출근기록",
+            },
+        ),
+        migrations.RunPython(fill_latest_attendance, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_latestattendance"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["date"], name="attendance_date_idx"),
+        ),
+    ]
@@ -0,0 +1,133 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:35
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_attendance_rollups(apps, schema_editor):
+    from core.rollups import rebuild_rollups
+
+    rebuild_rollups(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("core", "0015_attendance_date_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttendanceMonthly",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveSmallIntegerField(verbose_name="년도")),
+                ("month", models.PositiveSmallIntegerField(verbose_name="월")),
+                (
+                    "days",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="출근 일수"),
+                ),
+                (
+                    "worked_seconds",
+                    models.PositiveIntegerField(default=0, verbose_name="근무 시간(초)"),
+                ),
+                (
+                    "check_in_seconds",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="첫 출근 시각의 합(초)"
+                    ),
+                ),
+                (
+                    "late_days",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="지각 일수"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="근무자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "월별 출근 집계",
+                "verbose_name_plural": "월별 출근 집계",
+            },
+        ),
+        migrations.CreateModel(
+            name="AttendanceDaily",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "shifts",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="출근 횟수"),
+                ),
+                (
+                    "worked_seconds",
+                    models.PositiveIntegerField(default=0, verbose_name="근무 시간(초)"),
+                ),
+                (
+                    "check_in_seconds",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="첫 출근 시각(자정부터 초)"
+                    ),
+                ),
+                ("is_late", models.BooleanField(default=False, verbose_name="지각")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="근무자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 출근 집계",
+                "verbose_name_plural": "일별 출근 집계",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="attendancemonthly",
+            index=models.Index(
+                fields=["year", "month"], name="attendance_monthly_month_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="attendancemonthly",
+            constraint=models.UniqueConstraint(
+                fields=("user", "year", "month"), name="unique_user_year_month"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attendancedaily",
+            index=models.Index(fields=["date"], name="attendance_daily_date_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="attendancedaily",
+            constraint=models.UniqueConstraint(
+                fields=("user", "date"), name="unique_user_date"
+            ),
+        ),
+        migrations.RunPython(fill_attendance_rollups, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,7 @@
 # Create your models here.
 from django.contrib.auth.models import User
 from django.db import models
+from django.utils import timezone
 from model_utils import Choices
 from model_utils.fields import StatusField
 
@@ -57,3 +58,124 @@ class Attendance(models.Model):
     class Meta:
         verbose_name = "출근기록"
         verbose_name_plural = "출근기록"
+        indexes = [
+            # 사용자의 마지막 출근기록 조회 (AttendanceCreate)
+            models.Index(fields=["user", "date"], name="attendance_user_date_idx"),
+            # 년도별 출근 통계 (core.statistics)
+            models.Index(fields=["date"], name="attendance_date_idx"),
+        ]
+
+
+class LatestAttendance(models.Model):
+    """
+    사용자의 마지막 출근기록을 가리킵니다. 체크인/체크아웃 때 기본키 한 번으로 마지막 기록을 찾습니다.
+    """
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, verbose_name="근무자"
+    )
+    attendance = models.OneToOneField(
+        Attendance, on_delete=models.CASCADE, verbose_name="마지막 출근기록"
+    )
+
+    def __str__(self):
+        return str(self.attendance)
+
+    class Meta:
+        verbose_name = "마지막 출근기록"
+        verbose_name_plural = "마지막 출근기록"
+
+
+class AttendanceDaily(models.Model):
+    """
+    사용자의 하루 출근기록 집계입니다. 출근기록이 바뀔 때마다 다시 계산합니다. (core.rollups)
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="근무자")
+    date = models.DateField(verbose_name="날짜")
+    shifts = models.PositiveSmallIntegerField(default=0, verbose_name="출근 횟수")
+    worked_seconds = models.PositiveIntegerField(default=0, verbose_name="근무 시간(초)")
+    check_in_seconds = models.PositiveIntegerField(
+        default=0, verbose_name="첫 출근 시각(자정부터 초)"
+    )
+    is_late = models.BooleanField(default=False, verbose_name="지각")
+
+    class Meta:
+        verbose_name = "일별 출근 집계"
+        verbose_name_plural = "일별 출근 집계"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "date"], name="unique_user_date"),
+        ]
+        indexes = [
+            models.Index(fields=["date"], name="attendance_daily_date_idx"),
+        ]
+
+
+class AttendanceMonthly(models.Model):
+    """
+    사용자의 월별 출근 집계입니다. 일별 집계(AttendanceDaily)를 합쳐 만듭니다.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="근무자")
+    year = models.PositiveSmallIntegerField(verbose_name="년도")
+    month = models.PositiveSmallIntegerField(verbose_name="월")
+    days = models.PositiveSmallIntegerField(default=0, verbose_name="출근 일수")
+    worked_seconds = models.PositiveIntegerField(default=0, verbose_name="근무 시간(초)")
+    check_in_seconds = models.PositiveIntegerField(
+        default=0, verbose_name="첫 출근 시각의 합(초)"
+    )
+    late_days = models.PositiveSmallIntegerField(default=0, verbose_name="지각 일수")
+
+    class Meta:
+        verbose_name = "월별 출근 집계"
+        verbose_name_plural = "월별 출근 집계"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "year", "month"],
+                name="unique_user_year_month",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["year", "month"], name="attendance_monthly_month_idx"),
+        ]
+
+
+class SlackMessage(models.Model):
+    """
+    보내야 할 Slack 메시지 (outbox). 요청과 같은 트랜잭션에 저장하고, 커밋 후 백그라운드에서 보냅니다.
+    """
+
+    STATUS = Choices(
+        ("PENDING", "대기"), ("SENDING", "전송 중"), ("SENT", "전송"), ("DEAD", "실패")
+    )
+
+    url = models.URLField(max_length=500, verbose_name="URL")
+    payload = models.TextField(verbose_name="내용")
+    status = StatusField(choices_name="STATUS", verbose_name="상태")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수")
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name="다음 시도 시간"
+    )
+    last_error = models.TextField(blank=True, verbose_name="마지막 오류")
+    # 같은 digest_key의 메시지는 모아서 "A, B님이 ..." 한 건으로 보냅니다.
+    digest_key = models.CharField(
+        max_length=200, blank=True, db_index=True, verbose_name="묶음 키"
+    )
+    digest_item = models.CharField(max_length=100, blank=True, verbose_name="묶음 항목")
+    digest_format = models.CharField(
+        max_length=200, blank=True, verbose_name="묶음 메시지 형식"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="전송일")
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
+
+    class Meta:
+        verbose_name = "Slack 메시지"
+        verbose_name_plural = "Slack 메시지"
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="slack_status_next_idx"
+            ),
+        ]
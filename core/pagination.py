@@ -0,0 +1,233 @@
+import base64
+import json
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.db.models import Model, Q, QuerySet
+from django.http import Http404, QueryDict
+
+AFTER_PARAM = "after"
+BEFORE_PARAM = "before"
+PAGE_SIZE_PARAM = "page_size"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    정렬 기준 값들을 URL에 넣을 수 있는 커서 문자열로 바꿉니다.
+    """
+    data = json.dumps(
+        [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in values
+        ]
+    )
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model: Model, fields: Sequence[str]) -> List[Any]:
+    """
+    커서 문자열을 정렬 기준 필드 타입의 값들로 되돌립니다. 읽을 수 없는 커서면 ValueError를 냅니다.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    try:
+        return [
+            model._meta.get_field(field).to_python(value)
+            for field, value in zip(fields, values)
+        ]
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def get_keyset_filter(
+    ordering: Sequence[str], values: Sequence[Any], backwards: bool = False
+) -> Q:
+    """
+    (a, b, c) 순서로 정렬된 목록에서 커서 값 다음(backwards이면 이전)에 오는 행만 남기는 조건을 만듭니다.
+    a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z) 형태이므로 정렬 인덱스를 그대로 탈 수 있습니다.
+    """
+    query = Q()
+    equal = Q()
+    for order, value in zip(ordering, values):
+        field = order.lstrip("-")
+        descending = order.startswith("-") != backwards
+        query |= equal & Q(**{f"{field}__{'lt' if descending else 'gt'}": value})
+        equal &= Q(**{field: value})
+
+    if len(ordering) > 1:
+        # OR 조건만으로는 인덱스 범위를 좁히지 못하는 DB(SQLite 등)를 위해 첫 필드의 범위를 함께 겁니다.
+        field = ordering[0].lstrip("-")
+        descending = ordering[0].startswith("-") != backwards
+        query &= Q(**{f"{field}__{'lte' if descending else 'gte'}": values[0]})
+    return query
+
+
+def iter_keyset(
+    queryset: QuerySet, ordering: Sequence[str], chunk_size: int = 2000
+) -> Iterator[Dict[str, Any]]:
+    """
+    values() QuerySet을 커서로 chunk_size개씩 나눠 끝까지 읽습니다. 정렬 기준 필드는 values()에 포함되어야 합니다.
+    한 번에 chunk_size개만 메모리에 두므로, 결과 전체를 받아 두는 DB 드라이버(mysqlclient)에서도 메모리가 일정합니다.
+    """
+    fields = [order.lstrip("-") for order in ordering]
+    queryset = queryset.order_by(*ordering)
+    chunk_queryset = queryset
+    while True:
+        num_rows, row = 0, None
+        for row in chunk_queryset[:chunk_size].iterator(chunk_size=chunk_size):
+            num_rows += 1
+            yield row
+        if num_rows < chunk_size:
+            return
+        chunk_queryset = queryset.filter(
+            get_keyset_filter(ordering, [row[field] for field in fields])
+        )
+
+
+class KeysetPage(object):
+    """
+    COUNT(*)와 OFFSET 없이 커서로 나눈 한 페이지입니다.
+    """
+
+    def __init__(
+        self,
+        object_list: List[Any],
+        page_size: int,
+        next_cursor: Optional[str],
+        previous_cursor: Optional[str],
+        query_params: QueryDict,
+    ):
+        self.object_list = object_list
+        self.page_size = page_size
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.query_params = query_params
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+    def get_url(self, param: Optional[str] = None, cursor: str = None) -> str:
+        query_params = self.query_params.copy()
+        for key in (AFTER_PARAM, BEFORE_PARAM):
+            query_params.pop(key, None)
+        if param is not None:
+            query_params[param] = cursor
+        return f"?{query_params.urlencode()}"
+
+    @property
+    def next_url(self) -> Optional[str]:
+        return self.get_url(AFTER_PARAM, self.next_cursor) if self.has_next() else None
+
+    @property
+    def previous_url(self) -> Optional[str]:
+        return (
+            self.get_url(BEFORE_PARAM, self.previous_cursor)
+            if self.has_previous()
+            else None
+        )
+
+    @property
+    def first_url(self) -> str:
+        return self.get_url()
+
+    @property
+    def hidden_params(self) -> List[Tuple[str, str]]:
+        """
+        페이지 크기를 바꾸는 폼에서 유지할 검색 조건입니다. 커서는 버리고 첫 페이지부터 다시 봅니다.
+        """
+        return [
+            (key, value)
+            for key, values in self.query_params.lists()
+            if key not in (AFTER_PARAM, BEFORE_PARAM, PAGE_SIZE_PARAM)
+            for value in values
+        ]
+
+
+class KeysetPaginationMixin(object):
+    """
+    ListView에 (정렬 기준 필드..., id) 커서 기반 페이지 나누기를 붙입니다.
+    페이지마다 page_size + 1개만 읽어 다음 페이지가 있는지 확인하므로 COUNT(*)나 OFFSET이 필요 없습니다.
+    템플릿에서는 "core/pagination.html"을 include 하면 됩니다.
+    """
+
+    keyset_ordering = ("-id",)
+    page_size = 50
+    page_size_choices = (20, 50, 100, 200)
+
+    def get_keyset_ordering(self) -> Sequence[str]:
+        return self.keyset_ordering
+
+    def get_paginate_by(self, queryset: QuerySet) -> int:
+        try:
+            page_size = int(self.request.GET.get(PAGE_SIZE_PARAM, self.page_size))
+        except ValueError:
+            return self.page_size
+        return min(max(page_size, 1), max(self.page_size_choices))
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int):
+        ordering = self.get_keyset_ordering()
+        fields = [order.lstrip("-") for order in ordering]
+        after = self.request.GET.get(AFTER_PARAM)
+        before = self.request.GET.get(BEFORE_PARAM)
+        backwards = before is not None and after is None
+
+        cursor = before if backwards else after
+        if cursor is not None:
+            try:
+                values = decode_cursor(cursor, model=queryset.model, fields=fields)
+            except ValueError:
+                raise Http404("잘못된 페이지입니다.")
+            queryset = queryset.filter(
+                get_keyset_filter(ordering, values, backwards=backwards)
+            )
+
+        if backwards:
+            ordering = [
+                order[1:] if order.startswith("-") else f"-{order}"
+                for order in ordering
+            ]
+        object_list = list(queryset.order_by(*ordering)[: page_size + 1])
+        has_more = len(object_list) > page_size
+        object_list = object_list[:page_size]
+        if backwards:
+            object_list.reverse()
+
+        def get_cursor(obj: Any) -> str:
+            return encode_cursor([getattr(obj, field) for field in fields])
+
+        has_next = has_more if not backwards else True
+        has_previous = has_more if backwards else cursor is not None
+        page = KeysetPage(
+            object_list=object_list,
+            page_size=page_size,
+            next_cursor=get_cursor(object_list[-1])
+            if object_list and has_next
+            else None,
+            previous_cursor=get_cursor(object_list[0])
+            if object_list and has_previous
+            else None,
+            query_params=self.request.GET,
+        )
+        return None, page, object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["page_size_choices"] = self.page_size_choices
+        return context
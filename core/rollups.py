@@ -0,0 +1,210 @@
+import datetime
+from typing import Iterable, List, Tuple
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    Max,
+    Min,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import (
+    ExtractHour,
+    ExtractMinute,
+    ExtractMonth,
+    ExtractSecond,
+    ExtractYear,
+)
+
+
+def get_late_time() -> datetime.time:
+    return datetime.time.fromisoformat(
+        getattr(settings, "ATTENDANCE_LATE_TIME", "10:00")
+    )
+
+
+def get_late_seconds() -> int:
+    late_time = get_late_time()
+    return late_time.hour * 3600 + late_time.minute * 60 + late_time.second
+
+
+def get_seconds_of_day(field: str):
+    return ExtractHour(field) * 3600 + ExtractMinute(field) * 60 + ExtractSecond(field)
+
+
+def get_worked_seconds():
+    """
+    출근기록 한 건의 근무 시간(초)입니다. 자정을 넘겨 퇴근한 경우 하루를 더하고, 퇴근 기록이 없으면 0입니다.
+    """
+    worked = get_seconds_of_day("end_at") - get_seconds_of_day("start_at")
+    return Case(
+        When(end_at__isnull=True, then=Value(0)),
+        When(end_at__lt=F("start_at"), then=worked + 24 * 3600),
+        default=worked,
+        output_field=IntegerField(),
+    )
+
+
+def get_month_range(year: int, month: int) -> Tuple[datetime.date, datetime.date]:
+    """
+    [그 달의 1일, 다음 달의 1일)을 리턴합니다.
+    """
+    start = datetime.date(year, month, 1)
+    end = datetime.date(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+def get_rollup_models(apps=None) -> tuple:
+    """
+    (Attendance, AttendanceDaily, AttendanceMonthly). 마이그레이션에서는 그 시점의 모델을 넘깁니다.
+    """
+    apps = apps or django_apps
+    return (
+        apps.get_model("core", "Attendance"),
+        apps.get_model("core", "AttendanceDaily"),
+        apps.get_model("core", "AttendanceMonthly"),
+    )
+
+
+def build_daily_rollups(attendances, daily_model) -> List:
+    """
+    출근기록을 (사용자, 날짜)별로 DB에서 집계해 저장하지 않은 AttendanceDaily 목록을 만듭니다.
+    """
+    late_seconds = get_late_seconds()
+    rows = (
+        attendances.order_by()
+        .values("user_id", "date")
+        .annotate(
+            shifts=Count("id"),
+            worked_seconds=Sum(get_worked_seconds()),
+            check_in_seconds=Min(get_seconds_of_day("start_at")),
+        )
+    )
+    return [
+        daily_model(
+            user_id=row["user_id"],
+            date=row["date"],
+            shifts=row["shifts"],
+            worked_seconds=max(row["worked_seconds"] or 0, 0),
+            check_in_seconds=row["check_in_seconds"],
+            is_late=row["check_in_seconds"] > late_seconds,
+        )
+        for row in rows
+    ]
+
+
+def build_monthly_rollups(dailies, monthly_model) -> List:
+    """
+    일별 집계를 (사용자, 년도, 월)별로 합쳐 저장하지 않은 AttendanceMonthly 목록을 만듭니다.
+    """
+    rows = (
+        dailies.order_by()
+        .annotate(year=ExtractYear("date"), month=ExtractMonth("date"))
+        .values("user_id", "year", "month")
+        .annotate(
+            days=Count("id"),
+            total_worked_seconds=Sum("worked_seconds"),
+            total_check_in_seconds=Sum("check_in_seconds"),
+            late_days=Count("id", filter=Q(is_late=True)),
+        )
+    )
+    return [
+        monthly_model(
+            user_id=row["user_id"],
+            year=row["year"],
+            month=row["month"],
+            days=row["days"],
+            worked_seconds=row["total_worked_seconds"],
+            check_in_seconds=row["total_check_in_seconds"],
+            late_days=row["late_days"],
+        )
+        for row in rows
+    ]
+
+
+@transaction.atomic
+def update_rollups(user_id: int, day: datetime.date) -> None:
+    """
+    사용자의 하루 출근기록이 바뀌었을 때 그 날의 일별 집계와 그 달의 월별 집계만 다시 계산합니다.
+    """
+    Attendance, AttendanceDaily, AttendanceMonthly = get_rollup_models()
+
+    AttendanceDaily.objects.filter(user_id=user_id, date=day).delete()
+    AttendanceDaily.objects.bulk_create(
+        build_daily_rollups(
+            Attendance.objects.filter(user_id=user_id, date=day), AttendanceDaily
+        )
+    )
+
+    start, end = get_month_range(day.year, day.month)
+    AttendanceMonthly.objects.filter(
+        user_id=user_id, year=day.year, month=day.month
+    ).delete()
+    AttendanceMonthly.objects.bulk_create(
+        build_monthly_rollups(
+            AttendanceDaily.objects.filter(
+                user_id=user_id, date__gte=start, date__lt=end
+            ),
+            AttendanceMonthly,
+        )
+    )
+
+
+def iter_months(start: datetime.date, end: datetime.date) -> Iterable[Tuple[int, int]]:
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        year, month = year + month // 12, month % 12 + 1
+
+
+def rebuild_rollups(
+    start: datetime.date = None,
+    end: datetime.date = None,
+    batch_size: int = 500,
+    apps=None,
+) -> Tuple[int, int]:
+    """
+    start ~ end가 속한 달들의 일별/월별 집계를 한 달씩 나눠 다시 만들고 (일별, 월별) 집계 수를 리턴합니다.
+    기간을 주지 않으면 출근기록 전체를 다시 만듭니다.
+    """
+    Attendance, AttendanceDaily, AttendanceMonthly = get_rollup_models(apps)
+
+    if start is None or end is None:
+        dates = Attendance.objects.aggregate(first=Min("date"), last=Max("date"))
+        start = start or dates["first"]
+        end = end or dates["last"]
+        if start is None or end is None:
+            return 0, 0
+
+    num_dailies = num_monthlies = 0
+    for year, month in iter_months(start, end):
+        month_start, month_end = get_month_range(year, month)
+        with transaction.atomic():
+            AttendanceDaily.objects.filter(
+                date__gte=month_start, date__lt=month_end
+            ).delete()
+            dailies = build_daily_rollups(
+                Attendance.objects.filter(date__gte=month_start, date__lt=month_end),
+                AttendanceDaily,
+            )
+            AttendanceDaily.objects.bulk_create(dailies, batch_size=batch_size)
+
+            AttendanceMonthly.objects.filter(year=year, month=month).delete()
+            monthlies = build_monthly_rollups(
+                AttendanceDaily.objects.filter(
+                    date__gte=month_start, date__lt=month_end
+                ),
+                AttendanceMonthly,
+            )
+            AttendanceMonthly.objects.bulk_create(monthlies, batch_size=batch_size)
+        num_dailies += len(dailies)
+        num_monthlies += len(monthlies)
+    return num_dailies, num_monthlies
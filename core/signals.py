@@ -0,0 +1,57 @@
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.ip_allowlist import reset_allowlist
+from core.models import Attendance
+from core.rollups import update_rollups
+from core.statistics import bump_statistics_version
+
+
+@receiver(pre_save, sender=Attendance)
+def remember_previous_attendance(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """
+    저장 전 DB에 있던 출근기록의 사용자와 날짜를 기억해 둡니다. (관리자 페이지에서 날짜를 바꾼 경우)
+    update_fields에 사용자나 날짜가 없으면(퇴근시간 저장 등) 읽지 않습니다.
+    """
+    instance._previous_day = None
+    if raw or not instance.pk:
+        return
+    if update_fields is not None and not {"user", "date"} & set(update_fields):
+        return
+    instance._previous_day = (
+        Attendance.objects.filter(pk=instance.pk).values_list("user_id", "date").first()
+    )
+
+
+@receiver(post_save, sender=Attendance)
+def update_rollups_on_save(sender, instance, created, raw=False, **kwargs):
+    """
+    근무가 끝났거나(퇴근) 기록이 바뀌면 집계를 갱신합니다. 체크인으로 막 시작한 근무는 퇴근할 때 집계합니다.
+    """
+    if raw or (created and instance.end_at is None):
+        return
+
+    update_rollups(instance.user_id, instance.date)
+    days = [(instance.user_id, instance.date)]
+    previous = getattr(instance, "_previous_day", None)
+    if previous and previous != (instance.user_id, instance.date):
+        update_rollups(*previous)
+        days.append(previous)
+    bump_statistics_version(
+        user_ids=[user_id for user_id, _ in days], years=[day.year for _, day in days]
+    )
+
+
+@receiver(post_delete, sender=Attendance)
+def update_rollups_on_delete(sender, instance, **kwargs):
+    update_rollups(instance.user_id, instance.date)
+    bump_statistics_version(user_ids=[instance.user_id], years=[instance.date.year])
+
+
+@receiver(setting_changed)
+def reload_allowlist(sender, setting, **kwargs):
+    if setting in ("ALLOWED_CLIENT_IPS", "ALLOWED_CLIENT_IPS_FILE"):
+        reset_allowlist()
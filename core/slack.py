@@ -0,0 +1,557 @@
+import http.client
+import json
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import (
+    OperationalError,
+    close_old_connections,
+    connections,
+    transaction,
+)
+from django.db.models import Min, Q, QuerySet
+from django.http import QueryDict
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django_slack.app_settings import app_settings
+from django_slack.utils import Backend
+
+from core.models import SlackMessage
+from utils import logger
+
+SENT = "sent"
+RETRY = "retry"
+DEAD = "dead"
+
+# Slack 메시지에서 특수문자로 쓰이는 문자들입니다.
+SLACK_ESCAPES = {ord("&"): "&amp;", ord("<"): "&lt;", ord(">"): "&gt;"}
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_outbox_setting(name: str, default: Any) -> Any:
+    return getattr(settings, f"SLACK_OUTBOX_{name}", default)
+
+
+def record(**counts: int) -> None:
+    with _stats_lock:
+        _stats.update(counts)
+
+
+def get_delivery_stats() -> Dict[str, int]:
+    """
+    이 프로세스에서 outbox에 넣은 메시지 수(enqueued), 실제 API 호출 수(api_calls),
+    묶여서 호출을 줄인 메시지 수(coalesced), 결과별 메시지 수(sent, retry, dead)를 리턴합니다.
+    PooledHTTPBackend를 쓰면 HTTP 요청 수와 걸린 시간의 합(http_requests, http_latency_ms),
+    새로 맺은/다시 쓴/끊겨서 버린 연결 수(connections_opened, connections_reused, connection_resets)도 셉니다.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_delivery_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def get_channel(message_data: Dict[str, Any]) -> str:
+    if "payload" in message_data:
+        message_data = json.loads(message_data["payload"])
+    return message_data.get("channel", "")
+
+
+def replace_text(message_data: Dict[str, Any], text: str) -> Dict[str, Any]:
+    """
+    메시지 내용(text)만 바꿉니다. 사용자 지정 endpoint용으로 payload에 감싸진 경우도 처리합니다.
+    """
+    if "payload" in message_data:
+        payload = dict(json.loads(message_data["payload"]), text=text)
+        return dict(message_data, payload=json.dumps(payload))
+    return dict(message_data, text=text)
+
+
+class OutboxBackend(Backend):
+    """
+    django_slack backend. 메시지를 바로 보내지 않고 outbox(SlackMessage)에 저장한 뒤,
+    트랜잭션이 커밋되면 백그라운드 스레드에서 SLACK_BACKEND_FOR_QUEUE로 보냅니다.
+
+    slack_message()에 digest_key, digest_item, digest_format을 넘기면 같은 채널의 같은 digest_key
+    메시지를 SLACK_OUTBOX_DIGEST_WINDOW초 동안 모아 "A, B님이 ..." 한 건으로 보냅니다.
+    """
+
+    def send(
+        self,
+        url,
+        message_data,
+        digest_key: str = "",
+        digest_item: str = "",
+        digest_format: str = "",
+        **kwargs,
+    ):
+        record(enqueued=1)
+        if not digest_key:
+            message = SlackMessage.objects.create(
+                url=url, payload=json.dumps(message_data)
+            )
+            transaction.on_commit(lambda: dispatch(partial(deliver, message.pk)))
+            return message
+
+        digest_key = f"{digest_key}:{get_channel(message_data)}"
+        message = SlackMessage.objects.create(
+            url=url,
+            payload=json.dumps(message_data),
+            digest_key=digest_key,
+            digest_item=digest_item,
+            digest_format=digest_format,
+            next_attempt_at=timezone.now()
+            + timedelta(seconds=get_outbox_setting("DIGEST_WINDOW", 60)),
+        )
+        transaction.on_commit(lambda: schedule_digest(digest_key))
+        return message
+
+
+def get_http_setting(name: str, default: Any) -> Any:
+    return getattr(settings, f"SLACK_HTTP_{name}", default)
+
+
+# 재사용하던 연결을 서버가 먼저 끊었을 때 나는 오류들입니다. 새 연결로 다시 보냅니다.
+CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class ConnectionPool(object):
+    """
+    한 호스트에 대한 keep-alive http.client 연결 풀입니다. 동시에 최대 size개의 연결을 쓰고,
+    다 쓴 연결은 닫지 않고 다음 요청에 다시 씁니다.
+    """
+
+    def __init__(self, scheme: str, host: str, port: int, size: int, timeout: float):
+        self.connection_class = (
+            http.client.HTTPSConnection
+            if scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle = queue.LifoQueue()
+
+    def get(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        연결 하나와 재사용한 연결인지 여부를 리턴합니다. 풀이 가득 차면 timeout초까지 기다립니다.
+        """
+        if not self.slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"{self.host}:{self.port} 연결 풀이 가득 찼습니다.")
+        try:
+            connection = self.idle.get_nowait()
+        except queue.Empty:
+            record(connections_opened=1)
+            return (
+                self.connection_class(self.host, self.port, timeout=self.timeout),
+                False,
+            )
+        record(connections_reused=1)
+        return connection, True
+
+    def put(self, connection: http.client.HTTPConnection, reuse: bool) -> None:
+        if reuse:
+            self.idle.put(connection)
+        else:
+            connection.close()
+        self.slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class PooledHTTPBackend(Backend):
+    """
+    django_slack backend. UrllibBackend와 같은 요청을 보내지만 호스트별 연결 풀의 keep-alive 연결을 다시 써서
+    메시지마다 TCP/TLS 연결을 새로 맺지 않습니다. 여러 스레드에서 함께 써도 됩니다.
+    SLACK_HTTP_POOL_SIZE, SLACK_HTTP_TIMEOUT, SLACK_HTTP_RETRIES로 설정합니다.
+    """
+
+    def __init__(self):
+        self.pools = {}
+        self.pools_lock = threading.Lock()
+
+    def get_pool(self, scheme: str, host: str, port: int) -> ConnectionPool:
+        key = (scheme, host, port)
+        with self.pools_lock:
+            if key not in self.pools:
+                self.pools[key] = ConnectionPool(
+                    scheme,
+                    host,
+                    port,
+                    size=get_http_setting("POOL_SIZE", 4),
+                    timeout=get_http_setting("TIMEOUT", 10),
+                )
+            return self.pools[key]
+
+    def close(self) -> None:
+        with self.pools_lock:
+            for pool in self.pools.values():
+                pool.close()
+            self.pools.clear()
+
+    def send(self, url, message_data, **kwargs):
+        qs = QueryDict(mutable=True)
+        qs.update(message_data)
+        body = qs.urlencode().encode("utf-8")
+
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        pool = self.get_pool(
+            parts.scheme,
+            parts.hostname,
+            parts.port or (443 if parts.scheme == "https" else 80),
+        )
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        retries = get_http_setting("RETRIES", 1)
+        started = time.perf_counter()
+        for retry in range(retries + 1):
+            connection, reused = pool.get()
+            try:
+                connection.request("POST", path, body, headers)
+                response = connection.getresponse()
+                content = response.read().decode("utf-8")
+            except CONNECTION_ERRORS:
+                pool.put(connection, reuse=False)
+                record(connection_resets=1)
+                if retry < retries:
+                    continue
+                raise
+            except Exception:
+                pool.put(connection, reuse=False)
+                raise
+            pool.put(connection, reuse=not response.will_close)
+            break
+
+        record(
+            http_requests=1,
+            http_latency_ms=round((time.perf_counter() - started) * 1000),
+        )
+        if response.status >= 400:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        return self.validate(
+            response.getheader("Content-Type", ""), content, message_data
+        )
+
+
+_queue_backends = {}
+
+
+def get_queue_backend() -> Backend:
+    """
+    실제로 메시지를 보낼 backend를 리턴합니다. backend 이름별로 한 번만 만듭니다.
+    """
+    name = app_settings.BACKEND_FOR_QUEUE
+    if name not in _queue_backends:
+        _queue_backends[name] = import_string(name)()
+    return _queue_backends[name]
+
+
+def get_backoff(attempts: int) -> timedelta:
+    """
+    실패한 횟수에 따라 다음 시도까지 기다릴 시간을 지수적으로 늘립니다.
+    """
+    seconds = get_outbox_setting("BACKOFF", 30) * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, get_outbox_setting("MAX_BACKOFF", 3600)))
+
+
+def get_expired_lease(now: datetime) -> Q:
+    """
+    보내는 중에 worker가 죽어 lease가 끝난 메시지 조건입니다. 다시 점유할 수 있습니다.
+    """
+    return Q(status=SlackMessage.STATUS.SENDING, next_attempt_at__lte=now)
+
+
+def retry_on_lock(func: Callable[[], Any]) -> Any:
+    """
+    SQLite처럼 여러 스레드가 동시에 쓰면 잠기는 DB에서는 잠시 뒤 다시 시도합니다.
+    """
+    for retry in range(get_outbox_setting("LOCK_RETRIES", 5)):
+        try:
+            return func()
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            time.sleep(0.05 * 2**retry)
+    return func()
+
+
+def claim_if_unchanged(
+    messages: List[SlackMessage], lease_until: datetime
+) -> List[SlackMessage]:
+    """
+    읽은 뒤 다른 worker가 상태를 바꾸지 않은 메시지만 조건부 UPDATE로 점유합니다.
+    """
+    claimed = []
+    for message in messages:
+        updated = SlackMessage.objects.filter(
+            pk=message.pk,
+            status=message.status,
+            next_attempt_at=message.next_attempt_at,
+        ).update(status=SlackMessage.STATUS.SENDING, next_attempt_at=lease_until)
+        if updated:
+            claimed.append(message)
+    return claimed
+
+
+def claim_messages(queryset: QuerySet) -> List[SlackMessage]:
+    """
+    메시지를 SENDING 상태로 lease 시간만큼 점유합니다. 다른 worker가 점유 중인 메시지는 건너뜁니다.
+    SKIP LOCKED를 지원하지 않는 DB(MySQL 8.0.1 미만, SQLite)에서는 조건부 UPDATE로 점유합니다.
+    """
+    lease_until = timezone.now() + timedelta(seconds=get_outbox_setting("LEASE", 60))
+
+    def claim():
+        if not connections[queryset.db].features.has_select_for_update_skip_locked:
+            return claim_if_unchanged(list(queryset), lease_until)
+
+        with transaction.atomic(using=queryset.db):
+            messages = list(queryset.select_for_update(skip_locked=True))
+            SlackMessage.objects.filter(
+                pk__in=[message.pk for message in messages]
+            ).update(status=SlackMessage.STATUS.SENDING, next_attempt_at=lease_until)
+        return messages
+
+    return retry_on_lock(claim)
+
+
+def get_message_data(messages: List[SlackMessage]) -> Dict[str, Any]:
+    """
+    보낼 내용을 만듭니다. 여러 메시지가 묶인 경우 digest_format에 항목들을 채운 한 건으로 만듭니다.
+    """
+    message_data = json.loads(messages[0].payload)
+    if len(messages) == 1:
+        return message_data
+
+    items = list(
+        dict.fromkeys(
+            message.digest_item.translate(SLACK_ESCAPES) for message in messages
+        )
+    )
+    text = messages[0].digest_format.format(items=", ".join(items))
+    return replace_text(message_data, text)
+
+
+def send_messages(messages: List[SlackMessage]) -> Dict[str, int]:
+    """
+    점유한 메시지를 API 한 번으로 보냅니다. 실패하면 다음 시도 시간을 미루고,
+    SLACK_OUTBOX_MAX_ATTEMPTS번 실패하면 더 보내지 않습니다(dead letter).
+    """
+    if not messages:
+        return {}
+
+    record(api_calls=1, coalesced=len(messages) - 1)
+    attempts = max(message.attempts for message in messages) + 1
+    try:
+        get_queue_backend().send(messages[0].url, get_message_data(messages))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        if attempts >= get_outbox_setting("MAX_ATTEMPTS", 5):
+            result, status = DEAD, SlackMessage.STATUS.DEAD
+            logger.error(f"Slack 메시지 {messages[0].pk} 전송 실패: {error}")
+        else:
+            result, status = RETRY, SlackMessage.STATUS.PENDING
+        fields = dict(
+            status=status,
+            attempts=attempts,
+            last_error=error,
+            next_attempt_at=timezone.now() + get_backoff(attempts),
+        )
+    else:
+        result = SENT
+        fields = dict(
+            status=SlackMessage.STATUS.SENT, attempts=attempts, sent_at=timezone.now()
+        )
+
+    queryset = SlackMessage.objects.filter(pk__in=[message.pk for message in messages])
+    retry_on_lock(lambda: queryset.update(**fields))
+
+    record(**{result: len(messages)})
+    return {result: len(messages)}
+
+
+def deliver(message_id: int) -> Dict[str, int]:
+    """
+    outbox 메시지 한 건을 보냅니다.
+    """
+    now = timezone.now()
+    return send_messages(
+        claim_messages(
+            SlackMessage.objects.filter(
+                Q(status=SlackMessage.STATUS.PENDING, next_attempt_at__lte=now)
+                | get_expired_lease(now),
+                pk=message_id,
+            )
+        )
+    )
+
+
+def deliver_digest(digest_key: str, flush: bool = False) -> Dict[str, int]:
+    """
+    digest_key로 모인 메시지 중 보낼 시간이 된 메시지를 한 건으로 묶어 보냅니다.
+    flush이면(묶는 시간이 끝났거나 최대 건수가 찬 경우) 아직 보낸 적 없는 메시지도 함께 보내고,
+    실패한 메시지는 backoff가 끝나야 다시 보냅니다.
+    """
+    now = timezone.now()
+    pending = Q(status=SlackMessage.STATUS.PENDING, next_attempt_at__lte=now)
+    if flush:
+        pending |= Q(status=SlackMessage.STATUS.PENDING, attempts=0)
+    return send_messages(
+        claim_messages(
+            SlackMessage.objects.filter(
+                pending | get_expired_lease(now),
+                digest_key=digest_key,
+            ).order_by("created_at", "id")[: get_outbox_setting("DIGEST_MAX_SIZE", 20)]
+        )
+    )
+
+
+def run_in_thread(task: Callable[[], Dict[str, int]]) -> Dict[str, int]:
+    close_old_connections()
+    try:
+        return task()
+    except Exception as e:
+        logger.error(f"Slack 메시지 처리 중 오류: {e}")
+        return {}
+    finally:
+        close_old_connections()
+
+
+_executor = None
+_executor_slots = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    프로세스에서 공유하는 전송용 스레드 풀을 리턴합니다.
+    """
+    global _executor, _executor_slots
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = get_outbox_setting("WORKERS", 4)
+                _executor_slots = threading.BoundedSemaphore(
+                    workers * get_outbox_setting("QUEUE_SIZE_PER_WORKER", 25)
+                )
+                _executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="slack-outbox"
+                )
+    return _executor
+
+
+def dispatch(task: Callable[[], Dict[str, int]]) -> None:
+    """
+    전송 작업을 스레드 풀에 넘깁니다. 풀의 대기열이 가득 차면 넘기지 않고,
+    outbox에 남은 메시지는 drain_slack_outbox 명령이 보냅니다.
+    """
+    executor = get_executor()
+    if not _executor_slots.acquire(blocking=False):
+        logger.warning("Slack outbox 대기열이 가득 찼습니다. 남은 메시지는 나중에 보냅니다.")
+        return
+    future = executor.submit(run_in_thread, task)
+    future.add_done_callback(lambda _: _executor_slots.release())
+
+
+_scheduled_digests = set()
+_scheduled_digests_lock = threading.Lock()
+
+
+def schedule_digest(digest_key: str) -> None:
+    """
+    모인 메시지가 SLACK_OUTBOX_DIGEST_MAX_SIZE건이 되면 바로, 아니면 묶음의 첫 메시지부터
+    SLACK_OUTBOX_DIGEST_WINDOW초 뒤에 한 번 보냅니다.
+    """
+    num_pending = SlackMessage.objects.filter(
+        digest_key=digest_key, status=SlackMessage.STATUS.PENDING
+    ).count()
+    if num_pending >= get_outbox_setting("DIGEST_MAX_SIZE", 20):
+        dispatch(partial(deliver_digest, digest_key, flush=True))
+        return
+
+    with _scheduled_digests_lock:
+        if digest_key in _scheduled_digests:
+            return
+        _scheduled_digests.add(digest_key)
+
+    def flush():
+        with _scheduled_digests_lock:
+            _scheduled_digests.discard(digest_key)
+        dispatch(partial(deliver_digest, digest_key, flush=True))
+
+    timer = threading.Timer(get_outbox_setting("DIGEST_WINDOW", 60), flush)
+    timer.daemon = True
+    timer.start()
+
+
+def drain_outbox(limit: int = 100, workers: int = None) -> Dict[str, int]:
+    """
+    보낼 시간이 된 outbox 메시지를 최대 limit건(묶음은 한 건으로 셉니다) 보내고, 결과별 메시지 수를 리턴합니다.
+    workers가 1이면 스레드 없이 현재 스레드에서 차례로 보냅니다.
+    """
+    if workers is None:
+        workers = get_outbox_setting("WORKERS", 4)
+
+    now = timezone.now()
+    due = SlackMessage.objects.filter(
+        Q(status=SlackMessage.STATUS.PENDING, next_attempt_at__lte=now)
+        | get_expired_lease(now)
+    )
+    digest_keys = (
+        due.exclude(digest_key="")
+        .values("digest_key")
+        .annotate(first_attempt_at=Min("next_attempt_at"))
+        .order_by("first_attempt_at")
+        .values_list("digest_key", flat=True)[:limit]
+    )
+    message_ids = (
+        due.filter(digest_key="")
+        .order_by("next_attempt_at", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+    tasks = [partial(deliver_digest, digest_key) for digest_key in digest_keys]
+    tasks += [partial(deliver, message_id) for message_id in message_ids]
+    tasks = tasks[:limit]
+
+    results = Counter()
+    if workers <= 1:
+        for task in tasks:
+            results.update(task())
+        return dict(results)
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="slack-drain"
+    ) as executor:
+        for result in executor.map(run_in_thread, tasks):
+            results.update(result)
+    return dict(results)
@@ -0,0 +1,146 @@
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Sum
+
+from core.models import AttendanceMonthly
+
+STATISTICS_VERSION_KEY = "core:attendance:statistics:version"
+STATISTICS_SCOPE_VERSION_KEY = "core:attendance:statistics:version:{year}:{scope}"
+MONTH_LABELS = [f"{month}월" for month in range(1, 13)]
+
+
+def get_statistics_scope(user_id: int = None, team: str = None) -> str:
+    """
+    통계가 어느 출근기록에서 집계되는지(사용자 한 명, 팀, 전체)를 나타냅니다. 사용자를 지정하면 팀과 상관없이 그 사용자입니다.
+    """
+    if user_id is not None:
+        return f"user:{user_id}"
+    if team:
+        return f"team:{team}"
+    return "all"
+
+
+def get_statistics_version(year: int, scope: str) -> str:
+    """
+    전체 버전과 (년도, 범위)별 버전을 합친 통계 캐시 버전을 리턴합니다. 버전이 없으면(캐시가 비워진 경우 등) 새 버전을 만듭니다.
+    """
+    keys = [
+        STATISTICS_VERSION_KEY,
+        STATISTICS_SCOPE_VERSION_KEY.format(year=year, scope=scope),
+    ]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if versions.get(key) is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return ":".join(str(versions[key]) for key in keys)
+
+
+def bump_statistics_version(
+    user_ids: Iterable[int] = None, years: Iterable[int] = None
+) -> None:
+    """
+    출근기록이 바뀌었을 때 호출합니다. 사용자들과 년도들을 주면 그 사용자, 사용자가 속한 팀, 전체 통계의
+    해당 년도 버전만 올리고, 주지 않으면 전체 버전을 올려 모든 통계 캐시를 더 이상 읽지 않습니다.
+    """
+    if user_ids is not None and years is not None:
+        user_ids, years = set(user_ids), set(years)
+
+    def bump():
+        if user_ids is None or years is None:
+            keys = [STATISTICS_VERSION_KEY]
+        else:
+            teams = set(
+                Group.objects.filter(user__in=user_ids).values_list("name", flat=True)
+            )
+            scopes = [get_statistics_scope(user_id=user_id) for user_id in user_ids]
+            scopes += [get_statistics_scope(team=team) for team in teams]
+            scopes.append(get_statistics_scope())
+            keys = [
+                STATISTICS_SCOPE_VERSION_KEY.format(year=year, scope=scope)
+                for year in years
+                for scope in scopes
+            ]
+        # incr은 DB 캐시에서 만료 시간을 기본값으로 되돌리므로, 새 버전을 만료 없이 저장합니다.
+        version = time.time_ns()
+        cache.set_many({key: version for key in keys}, timeout=None)
+
+    # 커밋 전에 올리면 다른 요청이 이전 집계로 새 버전을 채울 수 있으므로 커밋한 뒤에 한 번만 올립니다.
+    transaction.on_commit(bump)
+
+
+def format_seconds_of_day(seconds: Optional[float]) -> Optional[str]:
+    if seconds is None:
+        return None
+    seconds = round(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}"
+
+
+def compute_attendance_statistics(
+    year: int, user_id: int = None, team: str = None
+) -> Dict[str, Any]:
+    """
+    월별 근무 시간, 출근 일수, 평균 출근 시각, 지각(ATTENDANCE_LATE_TIME 이후 출근) 일수를
+    월별 집계(AttendanceMonthly)에서 합칩니다. 사용자 한 명이면 1년에 12행만 읽습니다.
+    team은 사용자 그룹 이름입니다.
+    """
+    queryset = AttendanceMonthly.objects.filter(year=year)
+    if user_id is not None:
+        queryset = queryset.filter(user_id=user_id)
+    if team:
+        queryset = queryset.filter(user__groups__name=team)
+
+    rows = (
+        queryset.values("month")
+        .annotate(
+            total_worked_seconds=Sum("worked_seconds"),
+            total_days=Sum("days"),
+            total_check_in_seconds=Sum("check_in_seconds"),
+            total_late_days=Sum("late_days"),
+        )
+        .order_by("month")
+    )
+    months = {row["month"]: row for row in rows}
+
+    def get_values(key: str, default: Any = 0):
+        return [months.get(month, {}).get(key, default) for month in range(1, 13)]
+
+    return {
+        "year": year,
+        "labels": MONTH_LABELS,
+        "worked_hours": [
+            round(seconds / 3600, 1) for seconds in get_values("total_worked_seconds")
+        ],
+        "days": get_values("total_days"),
+        "average_check_in": [
+            format_seconds_of_day(seconds / days) if days else None
+            for seconds, days in zip(
+                get_values("total_check_in_seconds"), get_values("total_days")
+            )
+        ],
+        "late_counts": get_values("total_late_days"),
+    }
+
+
+def get_attendance_statistics(
+    year: int, user_id: int = None, team: str = None
+) -> Dict[str, Any]:
+    """
+    출근 통계를 캐시에서 읽습니다. 해당 사용자(팀)의 출근기록이 바뀌면 버전이 올라가 다음 조회 때 다시 집계합니다.
+    """
+    version = get_statistics_version(year, get_statistics_scope(user_id, team))
+    key = f"core:attendance:statistics:{version}:{year}:{user_id or ''}:{team or ''}"
+    statistics = cache.get(key)
+    if statistics is None:
+        statistics = compute_attendance_statistics(year, user_id=user_id, team=team)
+        cache.set(
+            key,
+            statistics,
+            timeout=getattr(settings, "ATTENDANCE_STATISTICS_CACHE_TIMEOUT", 24 * 3600),
+        )
+    return statistics
@@ -0,0 +1,128 @@
+import os
+import threading
+from collections import Counter
+from typing import Dict
+
+from django import template
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.utils import make_template_fragment_key
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+register = template.Library()
+
+# 조각을 캐시할 때 요청마다 바뀌는 CSRF 토큰 대신 넣어 두는 값
+CSRF_TOKEN_PLACEHOLDER = "__FRAGMENT_CACHE_CSRF_TOKEN__"
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def record(render_context: template.context.RenderContext, **counts: int) -> None:
+    with _stats_lock:
+        _stats.update(counts)
+    render_context.setdefault(FragmentCacheNode, Counter()).update(counts)
+
+
+def get_fragment_cache():
+    """
+    조각 키에는 바뀌는 값(수정일 등)이 모두 들어가므로, 행마다 공유 캐시(DB)를 읽지 않도록 프로세스별 캐시
+    (FRAGMENT_CACHE_ALIAS, 기본값 local)에 둡니다. 해당 캐시가 없으면 default를 씁니다.
+    """
+    alias = getattr(settings, "FRAGMENT_CACHE_ALIAS", "local")
+    if alias not in settings.CACHES:
+        alias = DEFAULT_CACHE_ALIAS
+    return caches[alias]
+
+
+def get_fragment_cache_stats() -> Dict[str, int]:
+    """
+    이 프로세스에서 조각 캐시를 읽은 결과입니다. 캐시에서 바로 읽은 수(hits)와 새로 렌더링한 수(misses)를 셉니다.
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_fragment_cache_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, fragment_name, vary_on, template_version):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.vary_on = vary_on
+        self.template_version = template_version
+
+    def render(self, context):
+        vary_on = [self.template_version]
+        vary_on.extend(var.resolve(context) for var in self.vary_on)
+
+        # CSRF 토큰은 요청마다 다르므로 자리표시자로 캐시하고, 꺼낼 때 이번 요청의 토큰으로 바꿉니다.
+        csrf_token = context.get("csrf_token")
+        csrf_token = str(csrf_token) if csrf_token else None
+        use_placeholder = csrf_token is not None and csrf_token != "NOTPROVIDED"
+        vary_on.append(use_placeholder)
+
+        key = make_template_fragment_key(self.fragment_name, vary_on)
+        cache = get_fragment_cache()
+        value = cache.get(key)
+        if value is None:
+            record(context.render_context, misses=1)
+            with context.push(
+                csrf_token=CSRF_TOKEN_PLACEHOLDER if use_placeholder else csrf_token
+            ):
+                value = self.nodelist.render(context)
+            cache.set(
+                key, value, timeout=getattr(settings, "FRAGMENT_CACHE_TIMEOUT", 3600)
+            )
+        else:
+            record(context.render_context, hits=1)
+
+        if use_placeholder:
+            value = value.replace(CSRF_TOKEN_PLACEHOLDER, csrf_token)
+        return mark_safe(value)
+
+
+@register.tag("cache_fragment")
+def do_cache_fragment(parser, token):
+    """
+    {% cache_fragment "이름" 값... %} ~ {% endcache_fragment %} 사이를 이름과 값들을 키로 캐시합니다.
+    {% cache %}와 달리 안에 {% csrf_token %}이 있어도 되고, 템플릿 파일이 바뀌면 이전 캐시는 쓰지 않습니다.
+    """
+    nodelist = parser.parse(("endcache_fragment",))
+    parser.delete_first_token()
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag requires at least 1 argument."
+        )
+
+    origin = getattr(parser, "origin", None)
+    try:
+        template_version = f"{origin.name}:{os.path.getmtime(origin.name)}"
+    except (AttributeError, TypeError, OSError):
+        template_version = ""
+
+    fragment_name = bits[1].strip("'\"")
+    return FragmentCacheNode(
+        nodelist,
+        fragment_name,
+        [parser.compile_filter(bit) for bit in bits[2:]],
+        template_version,
+    )
+
+
+@register.simple_tag(takes_context=True)
+def fragment_cache_stats(context) -> str:
+    """
+    DEBUG일 때 이번 렌더링에서 조각 캐시를 읽은 결과를 HTML 주석으로 남깁니다.
+    """
+    if not settings.DEBUG:
+        return ""
+    stats = context.render_context.get(FragmentCacheNode, Counter())
+    return format_html(
+        "<!-- fragment cache: {} hits, {} misses -->", stats["hits"], stats["misses"]
+    )
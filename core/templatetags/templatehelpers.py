@@ -2,19 +2,11 @@ import datetime
 import os
 from datetime import timedelta
 
-import pandas as pd
 from django import template
-from django.db.models import QuerySet
-
-from vacation.constants import (
-    HOLIDAY_LIST,
-    VacationApproval,
-    VacationTypes,
-    SPECIAL_VACATION_TYPES,
-)
-from vacation.utils import (
-    calculate_vacation_days_by_type,
-)
+
+from vacation.business_days import count_business_days_between
+from vacation.constants import BUSINESS_DAY_UNITS, DAY_OFF_TYPES
+from vacation.models import Vacation
 
 register = template.Library()
 
@@ -42,43 +34,20 @@ def get_verbose_field_name(instance, field_name):
 
 @register.simple_tag
 def get_duration(start_at: datetime.datetime, end_at: datetime.datetime) -> str:
-    business_day_range = pd.bdate_range(start=start_at, end=end_at).to_list()
     diff = end_at - start_at
     if diff.days > 0:
-        return f"{len(set(business_day_range) - set(HOLIDAY_LIST))} 일"
+        return f"{count_business_days_between(start=start_at, end=end_at)} 일"
     elif start_at == end_at:
         return "1 일"
     return f"{int(diff.seconds / 3600)} 시간"
 
 
 @register.simple_tag
-def get_used_days(
-    vacation_list: QuerySet,
-    year: str,
-    day_off_type: str = str(VacationTypes.DAY_OFF.value),
-) -> float:
-    if not year.strip():
-        year = datetime.datetime.today().year
-
-    vacation_list = vacation_list.filter(approval=VacationApproval.APPROVED.value)
-    vacation_list = (
-        vacation_list.filter(cat=day_off_type)
-        if day_off_type in SPECIAL_VACATION_TYPES
-        else vacation_list.exclude(cat__in=SPECIAL_VACATION_TYPES)
-    )
-
-    return calculate_vacation_days_by_type(vacation_list=vacation_list, year=int(year))
-
-
-@register.simple_tag
-def get_on_hold_days(vacation_list: QuerySet, year: str) -> float:
-    if not year.strip():
-        year = datetime.datetime.today().year
-
-    vacation_list = vacation_list.exclude(cat__in=SPECIAL_VACATION_TYPES).filter(
-        approval=VacationApproval.ON_HOLD.value
-    )
-    return calculate_vacation_days_by_type(vacation_list=vacation_list, year=int(year))
+def get_vacation_duration(vacation: Vacation) -> str:
+    if vacation.cat in DAY_OFF_TYPES:
+        return f"{vacation.business_days // BUSINESS_DAY_UNITS} 일"
+    diff = vacation.end_at - vacation.start_at
+    return f"{int(diff.seconds / 3600)} 시간"
 
 
 @register.filter
@@ -91,13 +60,6 @@ def subtract(first_val: str, second_val: str = "0") -> float:
     return float(first_val) - float(second_val) if first_val else 0
 
 
-@register.simple_tag
-def subtract_two_vals(
-    first_val: str, second_val: str = "0", third_val: str = "0"
-) -> float:
-    return float(first_val) - float(second_val) - float(third_val) if first_val else 0
-
-
 @register.filter
 def date_format(value, format="%Y-%m-%d"):
     if not value:
@@ -0,0 +1,150 @@
+import datetime
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.attendance import (
+    AttendanceError,
+    check_in,
+    check_out,
+    get_latest_attendance,
+)
+from core.models import Attendance, LatestAttendance
+from vacation.constants import TestCaseCredentials
+
+IP_ADDRESS = "127.0.0.1"
+
+
+class TestAttendanceService(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+
+    def test_check_in_and_out(self):
+        attendance = check_in(
+            self.user, IP_ADDRESS, now=datetime.datetime(2021, 7, 28, 9, 0, 30, 500)
+        )
+        self.assertEqual(
+            (datetime.date(2021, 7, 28), datetime.time(9, 0, 30), None),
+            (attendance.date, attendance.start_at, attendance.end_at),
+        )
+        self.assertEqual(
+            attendance, LatestAttendance.objects.get(user=self.user).attendance
+        )
+
+        with self.assertRaisesMessage(
+            AttendanceError, "이미 출근기록이 있습니다(2021-07-28 09:00:30)"
+        ):
+            check_in(self.user, IP_ADDRESS, now=datetime.datetime(2021, 7, 28, 10))
+
+        attendance = check_out(self.user, now=datetime.datetime(2021, 7, 28, 18))
+        attendance.refresh_from_db()
+        self.assertEqual(datetime.time(18), attendance.end_at)
+        self.assertEqual(self.user, attendance.updated_by)
+
+        # 퇴근 후 8시간이 지나기 전에는 퇴근시간을 다시 남길 수 있습니다.
+        check_out(self.user, now=datetime.datetime(2021, 7, 28, 19))
+        with self.assertRaises(AttendanceError):
+            check_out(self.user, now=datetime.datetime(2021, 7, 29, 3))
+        # 며칠이 지난 경우도 체크인이 없는 것으로 판단합니다.
+        with self.assertRaises(AttendanceError):
+            check_out(self.user, now=datetime.datetime(2021, 7, 31, 20))
+
+        attendance = check_in(
+            self.user, IP_ADDRESS, now=datetime.datetime(2021, 7, 29, 9)
+        )
+        self.assertEqual(attendance, get_latest_attendance(self.user))
+
+    def test_check_out_without_check_in(self):
+        with self.assertRaises(AttendanceError):
+            check_out(self.user)
+
+        check_in(self.user, IP_ADDRESS, now=datetime.datetime(2021, 7, 26, 9))
+        with self.assertRaises(AttendanceError):
+            check_out(self.user, now=datetime.datetime(2021, 7, 27, 9))
+        check_out(self.user, now=datetime.datetime(2021, 7, 27, 8))
+
+    def test_latest_attendance_fallback(self):
+        older = Attendance.objects.create(
+            user=self.user,
+            date=datetime.date(2021, 7, 27),
+            start_at=datetime.time(9),
+            created_by=self.user,
+            ip_address=IP_ADDRESS,
+        )
+        latest = Attendance.objects.create(
+            user=self.user,
+            date=datetime.date(2021, 7, 28),
+            start_at=datetime.time(9),
+            created_by=self.user,
+            ip_address=IP_ADDRESS,
+        )
+        self.assertEqual(latest, get_latest_attendance(self.user))
+
+        # 더 이전 날짜의 기록을 추가해도 마지막 기록은 바뀌지 않습니다.
+        Attendance.objects.create(
+            user=self.user,
+            date=datetime.date(2021, 7, 1),
+            start_at=datetime.time(9),
+            created_by=self.user,
+            ip_address=IP_ADDRESS,
+        )
+        self.assertEqual(latest, get_latest_attendance(self.user))
+
+        # 마지막 기록을 지우면 남은 기록 중 마지막 기록을 다시 찾습니다.
+        latest.delete()
+        self.assertFalse(LatestAttendance.objects.exists())
+        self.assertEqual(older, get_latest_attendance(self.user))
+        self.assertEqual(older, LatestAttendance.objects.get(user=self.user).attendance)
+
+    def test_check_in_queries(self):
+        check_in(self.user, IP_ADDRESS, now=datetime.datetime(2021, 7, 27, 9))
+        # SAVEPOINT, 마지막 기록 조회(잠금), 출근기록 저장, 마지막 기록 갱신, RELEASE SAVEPOINT
+        # (집계와 통계는 퇴근할 때 갱신합니다.)
+        with self.assertNumQueries(5):
+            attendance = check_in(
+                self.user, IP_ADDRESS, now=datetime.datetime(2021, 7, 28, 9)
+            )
+        self.assertEqual(attendance, get_latest_attendance(self.user))
+
+    def test_check_out_queries(self):
+        check_in(self.user, IP_ADDRESS, now=datetime.datetime(2021, 7, 28, 9))
+        # SAVEPOINT, 마지막 기록 조회, 퇴근시간 저장, RELEASE SAVEPOINT
+        # + 일별/월별 집계 갱신 (SAVEPOINT, 삭제/집계/저장 x 2, RELEASE SAVEPOINT)
+        with self.assertNumQueries(12):
+            check_out(self.user, now=datetime.datetime(2021, 7, 28, 18))
+
+
+@override_settings(ALLOWED_CLIENT_IPS=["127.0.0.1"])
+class TestAttendanceCreateView(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+
+    def setUp(self):
+        self.client.login(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+
+    def test_check_in_and_out(self):
+        url = reverse("core:attendance_add")
+        response = self.client.post(url, {"checkin": "checkin"})
+        self.assertRedirects(response, reverse("core:index"))
+        attendance = Attendance.objects.get(user=self.user)
+        self.assertEqual(self.user, attendance.created_by)
+        self.assertEqual(IP_ADDRESS, attendance.ip_address)
+
+        response = self.client.post(url, {"checkin": "checkin"})
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, "이미 출근기록이 있습니다")
+        self.assertEqual(1, Attendance.objects.count())
+
+        response = self.client.post(url, {"checkout": "checkout"})
+        self.assertRedirects(response, reverse("core:index"))
+        attendance.refresh_from_db()
+        self.assertIsNotNone(attendance.end_at)
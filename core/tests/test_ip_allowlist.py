@@ -0,0 +1,64 @@
+import os
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from core.ip_allowlist import IPAllowList, get_allowlist, is_allowed_ip
+
+
+class TestIPAllowList(SimpleTestCase):
+    def test_octet_prefix(self):
+        allowlist = IPAllowList(["10.1", "163.239.", "192.168.0.7"])
+        self.assertIn("10.1.2.3", allowlist)
+        self.assertNotIn("10.10.2.3", allowlist)
+        self.assertIn("163.239.28.23", allowlist)
+        self.assertNotIn("163.2.28.23", allowlist)
+        self.assertIn("192.168.0.7", allowlist)
+        self.assertNotIn("192.168.0.70", allowlist)
+
+    def test_cidr(self):
+        allowlist = IPAllowList(["172.16.0.0/12", "2001:db8::/32", "10.0.0.1/24"])
+        self.assertIn("172.31.255.255", allowlist)
+        self.assertNotIn("172.32.0.0", allowlist)
+        self.assertIn("2001:db8::1", allowlist)
+        self.assertNotIn("2001:db9::1", allowlist)
+        self.assertIn("10.0.0.200", allowlist)
+        self.assertIn("::ffff:172.16.0.1", allowlist)
+
+    def test_allow_all_and_invalid(self):
+        self.assertIn("8.8.8.8", IPAllowList([""]))
+        self.assertIn("::1", IPAllowList([""]))
+        self.assertNotIn("8.8.8.8", IPAllowList([]))
+
+        allowlist = IPAllowList(["not-an-ip", "10.300", "10.0.0.0/8"])
+        self.assertIn("10.1.1.1", allowlist)
+        self.assertNotIn(None, allowlist)
+        self.assertNotIn("unknown", allowlist)
+
+    def test_many_entries(self):
+        allowlist = IPAllowList([f"10.{i // 256}.{i % 256}.0/24" for i in range(5000)])
+        self.assertEqual(1, len(allowlist.intervals[4][0]))
+        self.assertIn("10.19.135.1", allowlist)
+        self.assertNotIn("10.19.136.1", allowlist)
+
+    def test_reload(self):
+        with override_settings(ALLOWED_CLIENT_IPS=["10.1."]):
+            self.assertTrue(is_allowed_ip("10.1.0.1"))
+            with override_settings(ALLOWED_CLIENT_IPS=["10.2."]):
+                self.assertFalse(is_allowed_ip("10.1.0.1"))
+                self.assertTrue(is_allowed_ip("10.2.0.1"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "allowed_ips.txt")
+            with open(path, "w") as f:
+                f.write("# 사무실\n10.3.0.0/16\n")
+            with override_settings(ALLOWED_CLIENT_IPS=[], ALLOWED_CLIENT_IPS_FILE=path):
+                self.assertTrue(is_allowed_ip("10.3.0.1"))
+                allowlist = get_allowlist()
+                self.assertIs(allowlist, get_allowlist())
+
+                with open(path, "w") as f:
+                    f.write("10.4.0.0/16\n")
+                os.utime(path, (0, 0))
+                self.assertFalse(is_allowed_ip("10.3.0.1"))
+                self.assertTrue(is_allowed_ip("10.4.0.1"))
@@ -0,0 +1,308 @@
+import datetime
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from urllib.error import HTTPError
+from unittest import mock
+from urllib.parse import parse_qs
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from core.models import SlackMessage
+from core.slack import (
+    DEAD,
+    RETRY,
+    SENT,
+    OutboxBackend,
+    PooledHTTPBackend,
+    claim_if_unchanged,
+    claim_messages,
+    deliver_digest,
+    drain_outbox,
+    get_delivery_stats,
+    reset_delivery_stats,
+)
+
+
+class SlackStub(object):
+    """
+    Slack API 대신 메시지를 받는 로컬 HTTP 서버입니다. status가 200이 아니면 실패로 응답합니다.
+    """
+
+    def __init__(self):
+        self.status = 200
+        self.requests = []
+        self.connections = 0
+        self.drop_connection = False
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+
+            def do_POST(self):
+                drop_connection = stub.drop_connection
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                stub.requests.append(parse_qs(body.decode()))
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+                # 클라이언트에 알리지 않고 keep-alive 연결을 끊습니다.
+                self.close_connection = drop_connection
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/chat.postMessage"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@override_settings(
+    SLACK_BACKEND_FOR_QUEUE="django_slack.backends.UrllibBackend",
+    SLACK_OUTBOX_MAX_ATTEMPTS=2,
+    SLACK_OUTBOX_BACKOFF=30,
+)
+class TestSlackOutbox(TestCase):
+    def setUp(self):
+        self.stub = SlackStub()
+        self.addCleanup(self.stub.close)
+
+    def create_message(
+        self, text: str = "체크인", channel: str = "random", **kwargs
+    ) -> SlackMessage:
+        return OutboxBackend().send(
+            self.stub.url,
+            {"channel": channel, "text": text, "token": "token"},
+            **kwargs,
+        )
+
+    def create_checkin_message(self, name: str, channel: str = "random"):
+        return self.create_message(
+            text=f"{name}님이 체크인 하였습니다. 화이팅!",
+            channel=channel,
+            digest_key="checkin",
+            digest_item=name,
+            digest_format="{items}님이 체크인 하였습니다.",
+        )
+
+    def test_send_stores_message(self):
+        message = self.create_message()
+        self.assertEqual(SlackMessage.STATUS.PENDING, message.status)
+        self.assertEqual([], self.stub.requests)
+
+    def test_drain_outbox(self):
+        message = self.create_message()
+        self.assertEqual({SENT: 1}, drain_outbox(workers=1))
+
+        message.refresh_from_db()
+        self.assertEqual(SlackMessage.STATUS.SENT, message.status)
+        self.assertEqual(1, message.attempts)
+        self.assertEqual([["체크인"]], [request["text"] for request in self.stub.requests])
+        self.assertEqual({}, drain_outbox(workers=1))
+
+    def test_retry_and_dead_letter(self):
+        self.stub.status = 500
+        message = self.create_message()
+        self.assertEqual({RETRY: 1}, drain_outbox(workers=1))
+
+        message.refresh_from_db()
+        self.assertEqual(SlackMessage.STATUS.PENDING, message.status)
+        self.assertIn("HTTPError", message.last_error)
+        self.assertGreater(
+            message.next_attempt_at,
+            timezone.now() + datetime.timedelta(seconds=20),
+        )
+        # backoff가 끝나기 전에는 다시 보내지 않습니다.
+        self.assertEqual({}, drain_outbox(workers=1))
+
+        SlackMessage.objects.filter(pk=message.pk).update(
+            next_attempt_at=timezone.now()
+        )
+        self.assertEqual({DEAD: 1}, drain_outbox(workers=1))
+        message.refresh_from_db()
+        self.assertEqual(
+            (SlackMessage.STATUS.DEAD, 2), (message.status, message.attempts)
+        )
+
+    def test_digest(self):
+        reset_delivery_stats()
+        for name in ("A", "B", "C"):
+            self.create_checkin_message(name)
+        self.create_checkin_message("D", channel="general")
+
+        # 묶는 시간이 지나기 전에는 보내지 않습니다.
+        self.assertEqual({}, drain_outbox(workers=1))
+
+        SlackMessage.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual({SENT: 4}, drain_outbox(workers=1))
+        self.assertEqual(
+            {
+                ("random", "A, B, C님이 체크인 하였습니다."),
+                ("general", "D님이 체크인 하였습니다. 화이팅!"),
+            },
+            {
+                (request["channel"][0], request["text"][0])
+                for request in self.stub.requests
+            },
+        )
+        stats = get_delivery_stats()
+        self.assertEqual(
+            (4, 2, 2, 4),
+            (stats["enqueued"], stats["api_calls"], stats["coalesced"], stats[SENT]),
+        )
+
+    @override_settings(SLACK_OUTBOX_DIGEST_MAX_SIZE=2)
+    def test_digest_max_size(self):
+        for name in ("A", "B", "C"):
+            self.create_checkin_message(name)
+
+        self.assertEqual({SENT: 2}, deliver_digest("checkin:random", flush=True))
+        self.assertEqual({SENT: 1}, deliver_digest("checkin:random", flush=True))
+        self.assertEqual({}, deliver_digest("checkin:random", flush=True))
+        self.assertEqual(
+            ["A, B님이 체크인 하였습니다.", "C님이 체크인 하였습니다. 화이팅!"],
+            [request["text"][0] for request in self.stub.requests],
+        )
+
+    def test_digest_waits_for_backoff(self):
+        self.stub.status = 500
+        self.create_checkin_message("A")
+        self.assertEqual({RETRY: 1}, deliver_digest("checkin:random", flush=True))
+
+        # 실패한 메시지는 묶음을 다시 보낼 때도 backoff가 끝날 때까지 기다립니다.
+        self.stub.status = 200
+        self.create_checkin_message("B")
+        self.assertEqual({}, deliver_digest("checkin:random"))
+        self.assertEqual({SENT: 1}, deliver_digest("checkin:random", flush=True))
+        self.assertEqual("B님이 체크인 하였습니다. 화이팅!", self.stub.requests[-1]["text"][0])
+        self.assertEqual(
+            SlackMessage.STATUS.PENDING,
+            SlackMessage.objects.get(digest_item="A").status,
+        )
+
+    def test_claim_skips_messages_claimed_by_other_worker(self):
+        message = self.create_message()
+        queryset = SlackMessage.objects.filter(pk=message.pk)
+        stale = list(queryset)
+        lease_until = timezone.now() + datetime.timedelta(seconds=60)
+
+        self.assertEqual([message], claim_messages(queryset))
+        # 먼저 읽어 둔 다른 worker는 이미 점유된 메시지를 다시 점유하지 않습니다.
+        self.assertEqual([], claim_if_unchanged(stale, lease_until))
+
+    def test_claim_with_skip_locked(self):
+        message = self.create_message()
+        with mock.patch.object(
+            connection.features, "has_select_for_update_skip_locked", True
+        ):
+            self.assertEqual(
+                [message], claim_messages(SlackMessage.objects.filter(pk=message.pk))
+            )
+        message.refresh_from_db()
+        self.assertEqual(SlackMessage.STATUS.SENDING, message.status)
+
+    def test_drain_slack_outbox_command(self):
+        self.create_message()
+        out = StringIO()
+        call_command("drain_slack_outbox", "--workers", "1", stdout=out)
+        self.assertIn(f"{SENT}: 1", out.getvalue())
+
+
+@override_settings(SLACK_BACKEND_FOR_QUEUE="django_slack.backends.UrllibBackend")
+class TestSlackOutboxWorkers(TransactionTestCase):
+    def test_drain_outbox_with_thread_pool(self):
+        stub = SlackStub()
+        self.addCleanup(stub.close)
+        for i in range(3):
+            SlackMessage.objects.create(
+                url=stub.url, payload=json.dumps({"text": f"{i}", "token": "token"})
+            )
+
+        self.assertEqual({SENT: 3}, drain_outbox(workers=3))
+        self.assertEqual(
+            3, SlackMessage.objects.filter(status=SlackMessage.STATUS.SENT).count()
+        )
+        self.assertEqual(
+            {"0", "1", "2"}, {request["text"][0] for request in stub.requests}
+        )
+
+
+@override_settings(SLACK_HTTP_POOL_SIZE=2, SLACK_HTTP_TIMEOUT=5)
+class TestPooledHTTPBackend(SimpleTestCase):
+    def setUp(self):
+        self.stub = SlackStub()
+        self.addCleanup(self.stub.close)
+        self.backend = PooledHTTPBackend()
+        self.addCleanup(self.backend.close)
+        reset_delivery_stats()
+
+    def send(self, text: str):
+        return self.backend.send(
+            self.stub.url, {"channel": "random", "text": text, "token": "token"}
+        )
+
+    def test_reuses_connection(self):
+        for i in range(5):
+            self.assertEqual("ok", self.send(f"{i}"))
+
+        self.assertEqual(1, self.stub.connections)
+        self.assertEqual(
+            [f"{i}" for i in range(5)],
+            [request["text"][0] for request in self.stub.requests],
+        )
+        stats = get_delivery_stats()
+        self.assertEqual(
+            (5, 1, 4),
+            (
+                stats["http_requests"],
+                stats["connections_opened"],
+                stats["connections_reused"],
+            ),
+        )
+
+    def test_concurrent_sends_share_pool(self):
+        threads = [
+            threading.Thread(target=self.send, args=(f"{i}",)) for i in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(10, len(self.stub.requests))
+        self.assertLessEqual(self.stub.connections, 2)
+
+    def test_retry_on_connection_reset(self):
+        self.stub.drop_connection = True
+        self.send("1")
+        self.stub.drop_connection = False
+        self.send("2")
+
+        self.assertEqual(
+            ["1", "2"], [request["text"][0] for request in self.stub.requests]
+        )
+        self.assertEqual(2, self.stub.connections)
+        self.assertEqual(1, get_delivery_stats()["connection_resets"])
+
+    def test_error_status(self):
+        self.stub.status = 500
+        with self.assertRaises(HTTPError):
+            self.send("1")
+        self.stub.status = 200
+        self.assertEqual("ok", self.send("2"))
+        self.assertEqual(1, self.stub.connections)
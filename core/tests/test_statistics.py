@@ -0,0 +1,279 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import CacheHandler, cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.models import Attendance, AttendanceDaily, AttendanceMonthly
+from core.rollups import rebuild_rollups
+from core.statistics import bump_statistics_version, get_attendance_statistics
+from vacation.constants import TestCaseCredentials
+
+
+def create_attendance(user, date, start_at, end_at=None):
+    return Attendance.objects.create(
+        user=user,
+        date=date,
+        start_at=start_at,
+        end_at=end_at,
+        created_by=user,
+        ip_address="127.0.0.1",
+    )
+
+
+class TestAttendanceStatistics(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        cls.other = User.objects.create_user(username="other", password="other")
+        team = Group.objects.create(name="dev")
+        cls.user.groups.add(team)
+
+        create_attendance(
+            cls.user, datetime.date(2021, 3, 2), datetime.time(9), datetime.time(18)
+        )
+        create_attendance(
+            cls.user,
+            datetime.date(2021, 3, 3),
+            datetime.time(10, 30),
+            datetime.time(19, 15),
+        )
+        # 자정을 넘겨 퇴근
+        create_attendance(
+            cls.user, datetime.date(2021, 4, 1), datetime.time(22), datetime.time(2)
+        )
+        # 퇴근 기록 없음
+        create_attendance(cls.user, datetime.date(2021, 4, 2), datetime.time(9, 40))
+        create_attendance(cls.user, datetime.date(2020, 3, 2), datetime.time(9))
+        create_attendance(
+            cls.other, datetime.date(2021, 3, 2), datetime.time(8), datetime.time(17)
+        )
+        # 퇴근하지 않은 기록은 집계를 다시 만들 때 들어갑니다.
+        rebuild_rollups()
+
+    def setUp(self):
+        cache.clear()
+        # TestCase는 커밋하지 않으므로 커밋 후에 올리는 통계 버전을 바로 올립니다.
+        patcher = mock.patch(
+            "core.statistics.transaction.on_commit", side_effect=lambda func: func()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_statistics(self):
+        statistics = get_attendance_statistics(2021, user_id=self.user.id)
+        self.assertEqual("3월", statistics["labels"][2])
+        self.assertEqual([17.8, 4.0], statistics["worked_hours"][2:4])
+        self.assertEqual([0, 0, 2, 2, 0], statistics["days"][:5])
+        self.assertEqual(
+            [None, "09:45", "15:50", None], statistics["average_check_in"][1:5]
+        )
+        self.assertEqual([1, 1], statistics["late_counts"][2:4])
+
+        statistics = get_attendance_statistics(2021)
+        self.assertEqual(3, statistics["days"][2])
+
+        statistics = get_attendance_statistics(2021, team="dev")
+        self.assertEqual([2, 2], statistics["days"][2:4])
+
+    def test_cache(self):
+        statistics = get_attendance_statistics(2021, user_id=self.user.id)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(
+                statistics, get_attendance_statistics(2021, user_id=self.user.id)
+            )
+        # 공유 캐시(DB 캐시)를 읽는 쿼리 말고는 집계를 읽지 않습니다.
+        self.assertEqual(
+            [],
+            [query["sql"] for query in queries if "django_cache" not in query["sql"]],
+        )
+
+        create_attendance(
+            self.user, datetime.date(2021, 5, 3), datetime.time(9), datetime.time(18)
+        )
+        statistics = get_attendance_statistics(2021, user_id=self.user.id)
+        self.assertEqual(1, statistics["days"][4])
+
+    def test_cache_scope(self):
+        statistics = {
+            scope: get_attendance_statistics(2021, **kwargs)
+            for scope, kwargs in (
+                ("user", {"user_id": self.user.id}),
+                ("other", {"user_id": self.other.id}),
+                ("team", {"team": "dev"}),
+                ("all", {}),
+            )
+        }
+        statistics["2020"] = get_attendance_statistics(2020, user_id=self.user.id)
+
+        # 다른 사용자의 출근기록이 바뀌면 그 사용자와 전체 통계만 다시 집계합니다.
+        create_attendance(
+            self.other, datetime.date(2021, 5, 3), datetime.time(9), datetime.time(18)
+        )
+        for scope, kwargs in (
+            ("user", {"user_id": self.user.id}),
+            ("team", {"team": "dev"}),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(
+                    statistics[scope], get_attendance_statistics(2021, **kwargs)
+                )
+            self.assertFalse(
+                [query for query in queries if "core_attendancemonthly" in query["sql"]]
+            )
+        self.assertEqual(
+            1, get_attendance_statistics(2021, user_id=self.other.id)["days"][4]
+        )
+        self.assertEqual(1, get_attendance_statistics(2021)["days"][4])
+
+        # 팀원의 출근기록이 바뀌면 팀 통계도 다시 집계하고, 다른 년도는 그대로 읽습니다.
+        create_attendance(
+            self.user, datetime.date(2021, 5, 4), datetime.time(9), datetime.time(18)
+        )
+        self.assertEqual(1, get_attendance_statistics(2021, team="dev")["days"][4])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(
+                statistics["2020"],
+                get_attendance_statistics(2020, user_id=self.user.id),
+            )
+        self.assertFalse(
+            [query for query in queries if "core_attendancemonthly" in query["sql"]]
+        )
+
+    def test_bump_from_other_process(self):
+        get_attendance_statistics(2021, user_id=self.user.id)
+        # 다른 프로세스(다른 캐시 연결)에서 출근기록을 바꾸고 버전을 올립니다.
+        Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    user=self.user,
+                    date=datetime.date(2021, 5, 3),
+                    start_at=datetime.time(9),
+                    created_by=self.user,
+                    ip_address="127.0.0.1",
+                )
+            ]
+        )
+        rebuild_rollups()
+        other_cache = CacheHandler()["default"]
+        with mock.patch("core.statistics.cache", other_cache):
+            bump_statistics_version(user_ids=[self.user.id], years=[2021])
+
+        statistics = get_attendance_statistics(2021, user_id=self.user.id)
+        self.assertEqual(1, statistics["days"][4])
+
+    def test_view(self):
+        self.client.login(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        url = reverse("core:attendance_statistics")
+        # 관리자(superuser)가 아니면 staff여도 자신의 통계만 볼 수 있습니다.
+        User.objects.filter(pk=self.user.pk).update(is_staff=True)
+        response = self.client.get(url, {"year": 2021, "user": self.other.id})
+        self.assertEqual([0, 0, 2], response.json()["days"][:3])
+        response = self.client.get(url, {"year": 2021, "team": "other"})
+        self.assertEqual([0, 0, 2], response.json()["days"][:3])
+
+        User.objects.filter(pk=self.user.pk).update(is_superuser=True)
+        response = self.client.get(url, {"year": 2021, "user": self.other.id})
+        self.assertEqual([0, 0, 1], response.json()["days"][:3])
+
+        self.assertEqual(400, self.client.get(url, {"year": "abc"}).status_code)
+        self.assertEqual(
+            200, self.client.get(reverse("core:attendance_chart")).status_code
+        )
+
+
+class TestAttendanceRollups(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+
+    def test_rollups(self):
+        attendance = create_attendance(
+            self.user, datetime.date(2021, 3, 2), datetime.time(10, 30)
+        )
+        # 체크인으로 막 시작한 근무는 퇴근할 때 집계합니다.
+        self.assertFalse(AttendanceDaily.objects.exists())
+
+        attendance.end_at = datetime.time(18, 30)
+        attendance.save(update_fields=["end_at"])
+        daily = AttendanceDaily.objects.get(user=self.user)
+        self.assertEqual(
+            (1, 8 * 3600, 37800, True),
+            (daily.shifts, daily.worked_seconds, daily.check_in_seconds, daily.is_late),
+        )
+        create_attendance(
+            self.user, datetime.date(2021, 3, 3), datetime.time(9), datetime.time(18)
+        )
+        monthly = AttendanceMonthly.objects.get(user=self.user)
+        self.assertEqual(
+            (2021, 3, 2, 8 * 3600 + 9 * 3600, 37800 + 32400, 1),
+            (
+                monthly.year,
+                monthly.month,
+                monthly.days,
+                monthly.worked_seconds,
+                monthly.check_in_seconds,
+                monthly.late_days,
+            ),
+        )
+
+        # 날짜를 다른 달로 옮기면 두 달의 집계가 모두 바뀝니다.
+        attendance.date = datetime.date(2021, 4, 1)
+        attendance.save()
+        self.assertEqual(
+            [(3, 1), (4, 1)],
+            list(
+                AttendanceMonthly.objects.order_by("month").values_list("month", "days")
+            ),
+        )
+
+        attendance.delete()
+        self.assertEqual(
+            [(3, 1)], list(AttendanceMonthly.objects.values_list("month", "days"))
+        )
+
+    def test_rebuild_command(self):
+        for day in (1, 2, 3):
+            create_attendance(
+                self.user,
+                datetime.date(2021, 1, day),
+                datetime.time(9),
+                datetime.time(18),
+            )
+        create_attendance(self.user, datetime.date(2021, 3, 2), datetime.time(9))
+        AttendanceDaily.objects.all().delete()
+        AttendanceMonthly.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_attendance_rollups", stdout=out)
+        self.assertIn("일별 집계 4건, 월별 집계 2건", out.getvalue())
+        self.assertEqual(
+            [(1, 3, 27 * 3600), (3, 1, 0)],
+            list(
+                AttendanceMonthly.objects.order_by("month").values_list(
+                    "month", "days", "worked_seconds"
+                )
+            ),
+        )
+
+        call_command(
+            "rebuild_attendance_rollups",
+            "--start",
+            "2021-03-01",
+            "--end",
+            "2021-03-31",
+            stdout=out,
+        )
+        self.assertEqual(2, AttendanceMonthly.objects.count())
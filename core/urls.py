@@ -24,6 +24,8 @@ urlpatterns = [
     path("", views.IndexView.as_view(), name="index"),
     path("attendance/", views.AttendanceListView.as_view(), name="attendance_list"),
     path("attendance/add", views.AttendanceCreate.as_view(), name="attendance_add"),
+    path("attendance/statistics", views.statistics, name="attendance_statistics"),
+    path("attendance/chart", views.ChartView.as_view(), name="attendance_chart"),
 ]
 
 # try:
@@ -1,11 +1,12 @@
-import datetime
 import random
 
 from django import forms
 from django.conf import settings
 from django.contrib import messages
+from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse
+from django.db import transaction
+from django.http import HttpResponseBadRequest, HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils import timezone
@@ -15,20 +16,15 @@ from django_slack import slack_message
 from ipware import get_client_ip
 
 from core import models
+from core.attendance import AttendanceError, check_in, check_out
+from core.ip_allowlist import is_allowed_ip
+from core.pagination import KeysetPaginationMixin
+from core.statistics import get_attendance_statistics
 
 # from django_filters.views import FilterView
 from core.models import Profile
 
 
-def is_allowed_ip(ip_str):
-    allowed_client_ips = getattr(settings, "ALLOWED_CLIENT_IPS", None)
-
-    for allowed_ip in allowed_client_ips:
-        if ip_str.startswith(allowed_ip):
-            return True
-    return False
-
-
 # Create your views here.
 class IndexView(TemplateView):
     template_name = "core/index.html"
@@ -73,6 +69,7 @@ class AttendanceCreate(LoginRequiredMixin, CreateView):
     def get_success_url(self):
         return reverse("core:index")
 
+    @transaction.atomic
     def form_valid(self, form):
         current_user = self.request.user
 
@@ -83,28 +80,15 @@ class AttendanceCreate(LoginRequiredMixin, CreateView):
             if form.data.get("checkout") == "checkout"
             else ""
         )
-        now = datetime.datetime.now()
-
-        latest = self.model.objects.filter(user=current_user).order_by("date").last()
 
         if typ == "1":  # 출근
-            if latest and now.date() == latest.date:
-                start_date = latest.date.strftime("%Y-%m-%d")
-                start_time = latest.start_at.strftime("%H:%M:%S")
-                error = (
-                    f"이미 출근기록이 있습니다({start_date} {start_time}). 기록을 남기시려면 퇴근을 선택해 주세요."
-                )
-                form.add_error(None, error)
+            try:
+                self.object = check_in(current_user, ip_address=self.client_ip)
+            except AttendanceError as e:
+                form.add_error(None, str(e))
                 return super().form_invalid(form)
 
-            start_at = now.strftime("%H:%M:%S")
-
-            instance = form.instance
-            instance.date = now
-            instance.start_at = start_at
-            instance.user = current_user
-            instance.created_by = current_user
-            instance.ip_address = self.client_ip
+            start_at = self.object.start_at.strftime("%H:%M:%S")
 
             hello_messages = [
                 "오늘 하루도 화이팅!",
@@ -131,36 +115,24 @@ class AttendanceCreate(LoginRequiredMixin, CreateView):
                         "text": f"{current_user.first_name}님이 체크인 하였습니다. {random.choice(hello_messages)}",
                     },
                     channel=channel,
+                    digest_key="checkin",
+                    digest_item=current_user.first_name,
+                    digest_format="{items}님이 체크인 하였습니다.",
                 )
             except ValueError:
                 pass
 
             messages.success(self.request, f"출근기록을 등록하였습니다. (출근시간 : {start_at})")
-            return super().form_valid(form)
+            return HttpResponseRedirect(self.get_success_url())
 
         elif typ == "2":  # 퇴근
-            work_time = now - datetime.datetime.combine(latest.date, latest.start_at)
-            if latest.end_at:
-                # 마지막 퇴근 후 8시간 이상 지난 경우 체크인이 없는 것으로 판단
-                rest_time = now - datetime.datetime.combine(latest.date, latest.end_at)
-                if rest_time.seconds / 3600 >= 8:
-                    error = "출근기록이 제출되지 않았습니다. 제출 시 출근을 선택해 주세요."
-                    form.add_error(None, error)
-                    return super().form_invalid(form)
-
-            else:  # 마지막 항목에 체크아웃 시간이 없을 때
-                # 마지막 출근 후 24시간 이상 지난 경우 체크인이 없는 것으로 판단
-                if work_time.days >= 1:
-                    error = "출근기록이 제출되지 않았습니다. 제출 시 출근을 선택해 주세요."
-                    form.add_error(None, error)
-                    return super().form_invalid(form)
-
-            end_at = now.strftime("%H:%M:%S")
-
-            form.instance = latest
-            instance = form.instance
-            instance.end_at = end_at
-            instance.updated_by = current_user
+            try:
+                self.object = check_out(current_user)
+            except AttendanceError as e:
+                form.add_error(None, str(e))
+                return super().form_invalid(form)
+
+            end_at = self.object.end_at.strftime("%H:%M:%S")
 
             goodbye_messages = [
                 "고생하셨어요~",
@@ -187,50 +159,52 @@ class AttendanceCreate(LoginRequiredMixin, CreateView):
                         "text": f"{current_user.first_name}님이 체크아웃 하였습니다. {random.choice(goodbye_messages)}",
                     },
                     channel=channel,
+                    digest_key="checkout",
+                    digest_item=current_user.first_name,
+                    digest_format="{items}님이 체크아웃 하였습니다.",
                 )
             except ValueError:
                 pass
 
             messages.success(self.request, f"퇴근기록을 등록하였습니다. (퇴근시간 : {end_at})")
-            return super().form_valid(form)
+            return HttpResponseRedirect(self.get_success_url())
 
         else:
             messages.error(self.request, "체크인/체크아웃 정보가 없습니다.")
             return super().form_invalid(form)
 
 
-class AttendanceListView(LoginRequiredMixin, ListView):
+class AttendanceListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
     model = models.Attendance
+    keyset_ordering = ("-id",)
 
     def get_queryset(self):
         current_user = self.request.user
         return self.model.objects.filter(user=current_user).order_by("-id").all()
 
 
+@login_required
 def statistics(request):
-    labels = [
-        "1월",
-        "2월",
-        "3월",
-        "4월",
-        "5월",
-        "6월",
-        "7월",
-        "8월",
-        "9월",
-        "10월",
-        "11월",
-        "12월",
-    ]
-    chartLabel = "my data"
-    chartdata = [0, 10, 5, 2, 20, 30, 45]
-    data = {
-        "labels": labels,
-        "chartLabel": chartLabel,
-        "chartdata": chartdata,
-    }
-    return JsonResponse(data, safe=False)
-
-
-class ChartView(TemplateView):
+    """
+    출근 통계(JSON). 관리자는 user(사용자 id)나 team(그룹 이름)으로 다른 사용자의 통계를 볼 수 있습니다.
+    """
+    try:
+        year = int(request.GET.get("year", timezone.now().year))
+        user_id = int(request.GET["user"]) if request.GET.get("user") else None
+    except ValueError:
+        return HttpResponseBadRequest("잘못된 조회 조건입니다.")
+    team = request.GET.get("team") or None
+
+    if not request.user.is_superuser:
+        user_id, team = request.user.id, None
+    data = get_attendance_statistics(year, user_id=user_id, team=team)
+    return JsonResponse(data)
+
+
+class ChartView(LoginRequiredMixin, TemplateView):
     template_name = "core/chart.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["query_string"] = self.request.GET.urlencode()
+        return context
@@ -61,8 +61,11 @@ INTERNAL_IPS = ["127.0.0.1"]
 
 #
 # MY_CLIENT_IPS에 정의한 값을 ALLOWED_CLIENT_IPS에 추가.
+# 주소("163.239.28.23"), 옥텟 prefix("163.239."), CIDR("10.0.0.0/8", "2001:db8::/32")를 쓸 수 있습니다.
+# ALLOWED_CLIENT_IPS_FILE에 한 줄에 하나씩 적어 두면 파일이 바뀔 때 재시작 없이 다시 읽습니다.
 #
 ALLOWED_CLIENT_IPS = []
+ALLOWED_CLIENT_IPS_FILE = None
 
 try:
     from .private_settings import MY_CLIENT_IPS
@@ -135,6 +138,38 @@ WSGI_APPLICATION = "isds.wsgi.application"
 # https://docs.djangoproject.com/en/3.0/ref/settings/#databases
 
 
+#
+# Cache
+# https://docs.djangoproject.com/en/3.0/topics/cache/
+# 공휴일/휴가 현황/통계 캐시 버전은 모든 프로세스(서버 워커, manage.py 명령)가 같이 봐야 하므로
+# default는 반드시 공유 캐시(DB, Redis, Memcached)여야 합니다. 프로세스별 캐시(LocMemCache)는 쓰면 안 됩니다.
+# 기본값은 DB 캐시이며, 처음 한 번 `python manage.py createcachetable`로 테이블을 만듭니다.
+# DB 캐시는 MAX_ENTRIES(기본값 300)를 넘으면 키를 가리지 않고 지우는데, 버전/세대 키가 지워지면
+# 모든 프로세스가 캐시를 다시 채우게 됩니다. 사용자 x 년도 x 키 종류(휴가 현황 세대/값,
+# 통계 버전/값, 공휴일 버전)에 팀/전체 통계를 더해도 넘지 않도록 넉넉하게 잡습니다.
+# (예: 사용자 2000명 x 5년 x 5종류 = 50000)
+# local은 내용이 키에 모두 들어가 있어 프로세스마다 따로 가져도 되는 캐시(템플릿 조각)에 씁니다.
+# private_settings.py에 CACHES를 정의하면 그 값을 씁니다.
+#
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    },
+    "local": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "isds-local",
+    },
+}
+
+try:
+    from .private_settings import CACHES
+
+except ImportError:
+    logger.info("CACHES is not set.")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
@@ -207,7 +242,19 @@ BOOTSTRAP4 = {
 # Django-slack 모듈 설정
 # https://django-slack.readthedocs.io/
 
-SLACK_BACKEND = "django_slack.backends.UrllibBackend"
+# 메시지는 outbox(core.SlackMessage)에 저장한 뒤 백그라운드에서 SLACK_BACKEND_FOR_QUEUE로 보냅니다.
+# 남은 메시지는 `python manage.py drain_slack_outbox`로 보낼 수 있습니다.
+SLACK_BACKEND = "core.slack.OutboxBackend"
+# 호스트별 keep-alive 연결 풀로 보내 메시지마다 TLS 연결을 새로 맺지 않습니다.
+SLACK_BACKEND_FOR_QUEUE = "core.slack.PooledHTTPBackend"
+SLACK_HTTP_POOL_SIZE = 4
+SLACK_HTTP_TIMEOUT = 10
+SLACK_HTTP_RETRIES = 1
+SLACK_OUTBOX_WORKERS = 4
+SLACK_OUTBOX_MAX_ATTEMPTS = 5
+# 체크인/체크아웃 메시지는 채널별로 DIGEST_WINDOW초 동안(최대 DIGEST_MAX_SIZE건) 모아 한 번에 보냅니다.
+SLACK_OUTBOX_DIGEST_WINDOW = 60
+SLACK_OUTBOX_DIGEST_MAX_SIZE = 20
 
 #
 # Session 설정
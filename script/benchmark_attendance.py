@@ -0,0 +1,142 @@
+"""
+체크인/체크아웃 벤치마크. 테스트 DB를 새로 만들어 사용자마다 출근기록을 쌓은 뒤,
+여러 스레드에서 동시에 체크인하고 체크아웃하는 시간을 잽니다.
+
+    python script/benchmark_attendance.py --users 2000 --history 60 --workers 16
+"""
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "isds.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import close_old_connections, connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from core.attendance import check_in, check_out  # noqa: E402
+from core.models import Attendance, LatestAttendance  # noqa: E402
+
+IP_ADDRESS = "127.0.0.1"
+TODAY = datetime.date(2021, 7, 28)
+
+
+def create_data(num_users: int, history: int) -> list:
+    User.objects.bulk_create([User(username=f"benchmark{i}") for i in range(num_users)])
+    users = list(User.objects.filter(username__startswith="benchmark"))
+    Attendance.objects.bulk_create(
+        [
+            Attendance(
+                user=user,
+                date=TODAY - datetime.timedelta(days=days),
+                start_at=datetime.time(9),
+                end_at=datetime.time(18),
+                created_by=user,
+                ip_address=IP_ADDRESS,
+            )
+            for user in users
+            for days in range(history, 0, -1)
+        ]
+    )
+    latest = Attendance.objects.filter(date=TODAY - datetime.timedelta(days=1))
+    LatestAttendance.objects.bulk_create(
+        [
+            LatestAttendance(user_id=attendance.user_id, attendance=attendance)
+            for attendance in latest
+        ]
+    )
+    return users
+
+
+def run(task, users: list, workers: int) -> list:
+    def timed(user):
+        close_old_connections()
+        started = time.perf_counter()
+        try:
+            task(user)
+        finally:
+            close_old_connections()
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(timed, users))
+
+
+def report(name: str, elapsed: float, latencies: list) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{name:>16}: {len(latencies) / elapsed:8.1f}/s, "
+        f"p50 {statistics.median(latencies) * 1000:6.2f}ms, p95 {p95 * 1000:6.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--history", type=int, default=60, help="사용자별 이전 출근기록 수")
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    if connection.vendor == "sqlite":
+        # 메모리 DB는 여러 스레드가 동시에 쓰면 바로 잠기므로 파일 DB를 씁니다.
+        test_db = os.path.join(tempfile.mkdtemp(), "benchmark.sqlite3")
+        settings.DATABASES["default"]["TEST"] = {"NAME": test_db}
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        started = time.perf_counter()
+        users = create_data(args.users, args.history)
+        print(
+            f"{args.users} users x {args.history} records "
+            f"({time.perf_counter() - started:.1f}s)"
+        )
+
+        def legacy_lookup(user):
+            Attendance.objects.filter(user=user).order_by("date").last()
+
+        def pointer_lookup(user):
+            LatestAttendance.objects.select_related("attendance").filter(
+                user=user
+            ).first()
+
+        write_workers = args.workers
+        if connection.vendor == "sqlite" and write_workers > 1:
+            # SQLite는 읽던 트랜잭션이 쓰기로 바뀔 때 기다리지 않고 바로 잠김 오류를 냅니다.
+            print("SQLite에서는 체크인/체크아웃을 한 스레드로 잽니다.")
+            write_workers = 1
+
+        now = datetime.datetime.combine(TODAY, datetime.time(9))
+        for name, task, workers in (
+            ("legacy lookup", legacy_lookup, args.workers),
+            ("pointer lookup", pointer_lookup, args.workers),
+            (
+                "check_in",
+                lambda user: check_in(user, IP_ADDRESS, now=now),
+                write_workers,
+            ),
+            (
+                "check_out",
+                lambda user: check_out(user, now=now + datetime.timedelta(hours=9)),
+                write_workers,
+            ),
+        ):
+            started = time.perf_counter()
+            latencies = run(task, users, workers)
+            report(name, time.perf_counter() - started, latencies)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
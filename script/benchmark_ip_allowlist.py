@@ -0,0 +1,53 @@
+"""
+ALLOWED_CLIENT_IPS 확인 벤치마크. 항목 수를 늘려 가며 예전 str.startswith 반복과 IPAllowList의 조회 시간을 비교합니다.
+
+    python script/benchmark_ip_allowlist.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.ip_allowlist import IPAllowList  # noqa: E402
+
+
+def is_allowed_ip_startswith(ip_str, allowed_client_ips):
+    for allowed_ip in allowed_client_ips:
+        if ip_str.startswith(allowed_ip):
+            return True
+    return False
+
+
+def main():
+    random.seed(0)
+    ips = [
+        f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}"
+        for _ in range(1000)
+    ]
+    print(f"{'entries':>8} {'startswith':>14} {'IPAllowList':>14}")
+    for num_entries in (10, 100, 1000, 10000):
+        entries = [
+            f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}."
+            for _ in range(num_entries)
+        ]
+        allowlist = IPAllowList(entries)
+        for ip in ips:
+            # 두 방식의 결과가 같은지 확인합니다.
+            assert is_allowed_ip_startswith(ip, entries) == (ip in allowlist)
+
+        number = 10
+        legacy = timeit.timeit(
+            lambda: [is_allowed_ip_startswith(ip, entries) for ip in ips],
+            number=number,
+        )
+        compiled = timeit.timeit(lambda: [ip in allowlist for ip in ips], number=number)
+        per_lookup = 1e6 / (number * len(ips))
+        print(
+            f"{num_entries:>8} {legacy * per_lookup:>12.2f}us {compiled * per_lookup:>12.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,3 +4,43 @@ from django.contrib import admin
 from vacation import models
 
 admin.site.register(models.Vacation)
+
+
+class BalanceAdmin(admin.ModelAdmin):
+    list_display = (
+        "user",
+        "year",
+        "used_days",
+        "on_hold_days",
+        "sick_days",
+        "comp_days",
+        "updated_at",
+    )
+    list_filter = ("year",)
+
+
+admin.site.register(models.Balance, BalanceAdmin)
+
+
+class BalanceHistoryAdmin(admin.ModelAdmin):
+    list_display = (
+        "user",
+        "year",
+        "total_days",
+        "used_days",
+        "remaining_days",
+        "next_total_days",
+        "created_at",
+    )
+    list_filter = ("year",)
+
+
+admin.site.register(models.BalanceHistory, BalanceHistoryAdmin)
+
+
+class HolidayAdmin(admin.ModelAdmin):
+    list_display = ("date", "name", "updated_at")
+    date_hierarchy = "date"
+
+
+admin.site.register(models.Holiday, HolidayAdmin)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class VacationConfig(AppConfig):
     name = "vacation"
+
+    def ready(self):
+        import vacation.signals  # noqa: F401
@@ -0,0 +1,189 @@
+import itertools
+import random
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import Client
+from django.urls import reverse
+
+from core.templatetags.templatehelpers import get_duration
+from vacation.benchmarks.datasets import Dataset
+from vacation.constants import VacationApproval, VacationTypes
+from vacation.models import Vacation
+from vacation.utils import (
+    calculate_vacation_days_by_type,
+    does_vacation_overlap,
+    get_vacation_days,
+    get_valid_vacation_dates,
+)
+
+
+class Case(NamedTuple):
+    """
+    벤치마크 하나입니다. setup이 있으면 매번 func 전에 부르고, 리턴한 값을 func의 인자로 넘깁니다.
+    setup에 걸린 시간은 재지 않습니다.
+    """
+
+    name: str
+    group: str
+    func: Callable[..., Any]
+    setup: Optional[Callable[[], Tuple]] = None
+
+
+def check_status(response: HttpResponse, status_code: int) -> None:
+    if response.status_code != status_code:
+        raise AssertionError(
+            f"{response.request['PATH_INFO']}: {response.status_code} != {status_code}"
+        )
+
+
+def clear_caches() -> Tuple:
+    for alias in settings.CACHES:
+        caches[alias].clear()
+    return ()
+
+
+def get_util_cases(dataset: Dataset, seed: int = 0) -> List[Case]:
+    rng = random.Random(seed)
+    users = dataset.users
+    year = dataset.year
+    approved = Vacation.objects.filter(
+        approval=str(VacationApproval.APPROVED.value)
+    ).exclude(cat=str(VacationTypes.SICK_DAY.value))
+    # 태그는 템플릿에서 한 행씩 부르므로, 목록 한 페이지(200행)를 한 번 재는 것으로 합니다.
+    durations = list(
+        Vacation.objects.order_by("pk").values_list("start_at", "end_at")[:200]
+    )
+
+    def random_user() -> Tuple:
+        return (rng.choice(users),)
+
+    def random_profile() -> Tuple:
+        return (rng.choice(users).profile,)
+
+    def overlap_args() -> Tuple:
+        start_at, end_at = rng.choice(durations)
+        return rng.choice(users), start_at, end_at
+
+    return [
+        Case(
+            "get_valid_vacation_dates",
+            "utils",
+            lambda: get_valid_vacation_dates(vacation_list=approved, year=year),
+        ),
+        Case(
+            "get_valid_vacation_dates[user]",
+            "utils",
+            lambda user: get_valid_vacation_dates(
+                vacation_list=approved.filter(user=user), year=year
+            ),
+            random_user,
+        ),
+        Case(
+            "calculate_vacation_days_by_type",
+            "utils",
+            lambda: calculate_vacation_days_by_type(vacation_list=approved, year=year),
+        ),
+        Case(
+            "does_vacation_overlap",
+            "utils",
+            lambda user, start_at, end_at: does_vacation_overlap(
+                user=user,
+                start=start_at,
+                end=end_at,
+                vacation_type=VacationTypes.DAY_OFF.value,
+            ),
+            overlap_args,
+        ),
+        Case(
+            "get_vacation_days",
+            "utils",
+            lambda profile: get_vacation_days(user_profile=profile, year=year),
+            random_profile,
+        ),
+        Case(
+            "get_duration",
+            "utils",
+            lambda: [get_duration(start_at, end_at) for start_at, end_at in durations],
+        ),
+    ]
+
+
+def get_view_cases(dataset: Dataset, seed: int = 0) -> List[Case]:
+    rng = random.Random(seed)
+    year = dataset.year
+    user_client = Client()
+    admin_client = Client()
+    admin_client.force_login(dataset.superuser)
+
+    # 캐시가 찬 뒤 같은 직원이 다시 보는 경우와, 캐시가 빈 상태에서 아무 직원이나 보는 경우를 따로 잽니다.
+    user = rng.choice(dataset.users)
+    user_client.force_login(user)
+
+    def login_random_user_without_cache() -> Tuple:
+        clear_caches()
+        random_user = rng.choice(dataset.users)
+        user_client.force_login(random_user)
+        return (random_user,)
+
+    def vacation_list(list_user) -> None:
+        url = reverse("vacation:list", kwargs={"user_id": list_user.pk})
+        check_status(user_client.get(url, {"year": year}), 200)
+
+    def member_list() -> None:
+        check_status(admin_client.get(reverse("vacation:member_list")), 200)
+
+    # 하루에 한 번만 체크인할 수 있으므로 직원들을 차례로 체크인, 체크아웃 시킵니다.
+    checkin_users = itertools.cycle(dataset.users)
+    checkout_users = itertools.cycle(dataset.users)
+
+    def login_next_user(users) -> Callable[[], Tuple]:
+        def setup() -> Tuple:
+            user_client.force_login(next(users))
+            return ()
+
+        return setup
+
+    def attendance_create(action: str) -> Callable[[], None]:
+        def post() -> None:
+            response = user_client.post(
+                reverse("core:attendance_add"), {action: action}
+            )
+            check_status(response, 302)
+
+        return post
+
+    return [
+        Case("VacationListView", "views", lambda: vacation_list(user)),
+        Case(
+            "VacationListView[cold]",
+            "views",
+            vacation_list,
+            login_random_user_without_cache,
+        ),
+        Case("MemberListView", "views", member_list),
+        Case(
+            "MemberListView[cold]",
+            "views",
+            member_list,
+            clear_caches,
+        ),
+        Case(
+            "AttendanceCreate[checkin]",
+            "views",
+            attendance_create("checkin"),
+            login_next_user(checkin_users),
+        ),
+        Case(
+            "AttendanceCreate[checkout]",
+            "views",
+            attendance_create("checkout"),
+            login_next_user(checkout_users),
+        ),
+    ]
+
+
+def get_cases(dataset: Dataset, seed: int = 0) -> List[Case]:
+    return get_util_cases(dataset, seed=seed) + get_view_cases(dataset, seed=seed)
@@ -0,0 +1,168 @@
+import datetime
+import random
+from typing import List, NamedTuple
+
+from django.contrib.auth.models import User
+
+from core.attendance import refresh_latest_attendances
+from core.models import Attendance, Profile
+from vacation.constants import VacationApproval, VacationTypes
+from vacation.ledger import rebuild_balances
+from vacation.models import Vacation
+from vacation.utils import get_end_at, update_business_days
+
+USERNAME_PREFIX = "benchmark"
+SUPERUSER_USERNAME = f"{USERNAME_PREFIX}-admin"
+IP_ADDRESS = "127.0.0.1"
+
+# 휴가 종류별 비율 (연차, 반차, 반반차, 병가, 대체 휴가)
+VACATION_TYPE_WEIGHTS = {
+    VacationTypes.DAY_OFF.value: 6,
+    VacationTypes.HALF_DAY_OFF.value: 2,
+    VacationTypes.ONE_FOURTH_DAY_OFF.value: 1,
+    VacationTypes.SICK_DAY.value: 1,
+    VacationTypes.COMP_DAY.value: 1,
+}
+APPROVAL_WEIGHTS = {
+    VacationApproval.APPROVED.value: 7,
+    VacationApproval.ON_HOLD.value: 2,
+    VacationApproval.DENIED.value: 1,
+}
+
+
+class Dataset(NamedTuple):
+    """
+    벤치마크에 쓰는 가상 조직입니다. users에는 관리자를 뺀 직원들이 들어 있습니다.
+    """
+
+    year: int
+    superuser: User
+    users: List[User]
+    num_vacations: int
+    num_attendances: int
+
+
+def create_vacations(
+    rng: random.Random, user: User, year: int, count: int
+) -> List[Vacation]:
+    """
+    서로 겹치지 않도록 한 주에 하나씩 휴가를 만듭니다.
+    """
+    first_monday = datetime.datetime(year, 1, 1)
+    first_monday += datetime.timedelta(days=-first_monday.weekday() % 7)
+    vacations = []
+    for week in sorted(rng.sample(range(50), min(count, 50))):
+        cat = rng.choices(
+            list(VACATION_TYPE_WEIGHTS), weights=list(VACATION_TYPE_WEIGHTS.values())
+        )[0]
+        start_at = first_monday + datetime.timedelta(weeks=week, days=rng.randrange(3))
+        if cat in (
+            VacationTypes.HALF_DAY_OFF.value,
+            VacationTypes.ONE_FOURTH_DAY_OFF.value,
+        ):
+            start_at += datetime.timedelta(hours=rng.choice((9, 14)))
+            end_at = get_end_at(vacation_type=cat, start_at=start_at)
+        else:
+            end_at = start_at + datetime.timedelta(days=rng.randrange(3))
+        vacations.append(
+            Vacation(
+                user=user,
+                cat=str(cat),
+                start_at=start_at,
+                end_at=end_at,
+                approval=str(
+                    rng.choices(
+                        list(APPROVAL_WEIGHTS), weights=list(APPROVAL_WEIGHTS.values())
+                    )[0]
+                ),
+            )
+        )
+    return vacations
+
+
+def create_dataset(
+    num_users: int,
+    vacations_per_user: int = 5,
+    attendances_per_user: int = 10,
+    year: int = None,
+    today: datetime.date = None,
+    seed: int = 0,
+    batch_size: int = 500,
+) -> Dataset:
+    """
+    직원 num_users명과 관리자 한 명, 직원마다 year년 휴가와 today 전날까지의 출근기록을 bulk_create로 만듭니다.
+    같은 seed로 만들면 같은 데이터가 나오므로 벤치마크 결과를 서로 비교할 수 있습니다.
+    사용 일수와 휴가 원장, 마지막 출근기록은 만든 뒤 한 번에 계산합니다.
+    """
+    today = today or datetime.date.today()
+    year = year or today.year
+    rng = random.Random(seed)
+
+    superuser = User(
+        username=SUPERUSER_USERNAME,
+        first_name="관리자",
+        is_staff=True,
+        is_superuser=True,
+    )
+    superuser.set_unusable_password()
+    superuser.save()
+    Profile.objects.create(user=superuser)
+
+    User.objects.bulk_create(
+        [
+            User(
+                username=f"{USERNAME_PREFIX}{i}",
+                first_name=f"직원{i}",
+                password="!",
+            )
+            for i in range(num_users)
+        ],
+        batch_size=batch_size,
+    )
+    users = list(
+        User.objects.filter(username__startswith=USERNAME_PREFIX)
+        .exclude(pk=superuser.pk)
+        .order_by("pk")
+    )
+    Profile.objects.bulk_create(
+        [Profile(user=user) for user in users], batch_size=batch_size
+    )
+
+    Vacation.objects.bulk_create(
+        [
+            vacation
+            for user in users
+            for vacation in create_vacations(rng, user, year, vacations_per_user)
+        ],
+        batch_size=batch_size,
+    )
+    vacation_list = Vacation.objects.filter(user__in=users)
+    update_business_days(vacation_list, batch_size=batch_size)
+    rebuild_balances(year=year, batch_size=batch_size)
+
+    Attendance.objects.bulk_create(
+        [
+            Attendance(
+                user=user,
+                date=today - datetime.timedelta(days=days),
+                start_at=datetime.time(9, rng.randrange(60)),
+                end_at=datetime.time(18, rng.randrange(60)),
+                created_by=user,
+                ip_address=IP_ADDRESS,
+            )
+            for user in users
+            for days in range(attendances_per_user, 0, -1)
+        ],
+        batch_size=batch_size,
+    )
+    refresh_latest_attendances(
+        user_ids=[user.pk for user in users], batch_size=batch_size
+    )
+
+    return Dataset(
+        year=year,
+        superuser=superuser,
+        users=users,
+        num_vacations=vacation_list.count(),
+        num_attendances=len(users) * attendances_per_user,
+    )
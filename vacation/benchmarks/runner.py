@@ -0,0 +1,208 @@
+import datetime
+import fnmatch
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import django
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from vacation.benchmarks.cases import Case, get_cases
+from vacation.benchmarks.datasets import IP_ADDRESS, create_dataset
+
+# 캐시는 운영과 같은 구성(공유 DB 캐시 + 프로세스별 캐시)으로 따로 쓰고(벤치마크 중에 비우므로),
+# 체크인 화면은 허용한 주소에서만 열리고, Slack 메시지는 보내지 않습니다.
+BENCHMARK_SETTINGS = {
+    "DEBUG": False,
+    "CACHES": {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "benchmark_cache",
+        },
+        "local": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "benchmark",
+        },
+    },
+    "ALLOWED_CLIENT_IPS": [IP_ADDRESS],
+    "ALLOWED_CLIENT_IPS_FILE": None,
+    "SLACK_BACKEND": "django_slack.backends.DisabledBackend",
+    "SLACK_BACKEND_FOR_QUEUE": "django_slack.backends.DisabledBackend",
+}
+
+
+class Comparison(NamedTuple):
+    """
+    기준 결과와 비교한 벤치마크 하나입니다. 기준이나 이번 결과에 없으면 해당 값이 None입니다.
+    """
+
+    name: str
+    baseline_ms: Optional[float]
+    current_ms: Optional[float]
+    baseline_queries: Optional[int]
+    current_queries: Optional[int]
+    regression: bool
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return self.current_ms / self.baseline_ms
+
+
+def measure(case: Case, repeat: int = 20, warmup: int = 3) -> Dict[str, Any]:
+    """
+    case를 warmup번 실행한 뒤 repeat번 시간을 잽니다. 쿼리 수는 시간을 잰 뒤 한 번 더 실행해서 셉니다.
+    """
+    timings = []
+    for i in range(warmup + repeat):
+        args = case.setup() if case.setup else ()
+        started = time.perf_counter()
+        case.func(*args)
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            timings.append(elapsed * 1000)
+
+    args = case.setup() if case.setup else ()
+    with CaptureQueriesContext(connection) as queries:
+        case.func(*args)
+
+    timings.sort()
+    return {
+        "group": case.group,
+        "repeat": repeat,
+        "min_ms": timings[0],
+        "median_ms": statistics.median(timings),
+        "mean_ms": statistics.mean(timings),
+        "p95_ms": timings[max(int(len(timings) * 0.95) - 1, 0)],
+        "stdev_ms": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "queries": len(queries),
+    }
+
+
+def run_cases(
+    cases: Iterable[Case],
+    suffix: str = "",
+    repeat: int = 20,
+    warmup: int = 3,
+    pattern: str = None,
+    progress: Callable[[str, Dict[str, Any]], None] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    pattern(fnmatch, 예: "*ListView*")에 맞는 case들을 재고, 이름에 suffix를 붙여 리턴합니다.
+    """
+    results = {}
+    with override_settings(**BENCHMARK_SETTINGS):
+        call_command("createcachetable", verbosity=0)
+        for case in cases:
+            name = f"{case.name}{suffix}"
+            if pattern and not fnmatch.fnmatchcase(name, pattern):
+                continue
+            results[name] = measure(case, repeat=repeat, warmup=warmup)
+            if progress is not None:
+                progress(name, results[name])
+    return results
+
+
+def run_benchmarks(
+    sizes: Iterable[int],
+    repeat: int = 20,
+    warmup: int = 3,
+    pattern: str = None,
+    seed: int = 0,
+    progress: Callable[[str, Dict[str, Any]], None] = None,
+    **dataset_kwargs,
+) -> Dict[str, Any]:
+    """
+    직원 수(sizes)마다 DB를 비우고 같은 seed로 가상 조직을 만든 뒤 모든 벤치마크를 잽니다.
+    DB를 비우므로 테스트 DB에서만 실행합니다.
+    """
+    results = {}
+    datasets = {}
+    for num_users in sizes:
+        call_command("flush", interactive=False, verbosity=0)
+        started = time.perf_counter()
+        dataset = create_dataset(num_users, seed=seed, **dataset_kwargs)
+        datasets[num_users] = {
+            "vacations": dataset.num_vacations,
+            "attendances": dataset.num_attendances,
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+        results.update(
+            run_cases(
+                get_cases(dataset, seed=seed),
+                suffix=f"@{num_users}",
+                repeat=repeat,
+                warmup=warmup,
+                pattern=pattern,
+                progress=progress,
+            )
+        )
+
+    return {
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "platform": platform.platform(),
+        },
+        "options": {"repeat": repeat, "warmup": warmup, "seed": seed, **dataset_kwargs},
+        "datasets": datasets,
+        "results": results,
+    }
+
+
+def save_results(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.2,
+    min_delta_ms: float = 0.1,
+) -> List[Comparison]:
+    """
+    중앙값이 기준보다 threshold(비율) 넘게, 그리고 min_delta_ms 넘게 느려졌거나 쿼리 수가 늘었으면 회귀로 봅니다.
+    시간은 측정할 때마다 흔들리지만 쿼리 수는 같은 데이터에서 항상 같으므로 조금만 늘어도 회귀입니다.
+    """
+    baseline_results = baseline["results"]
+    current_results = current["results"]
+    comparisons = []
+    for name in sorted(set(baseline_results) | set(current_results)):
+        before = baseline_results.get(name, {})
+        after = current_results.get(name, {})
+        baseline_ms, current_ms = before.get("median_ms"), after.get("median_ms")
+        baseline_queries, current_queries = before.get("queries"), after.get("queries")
+
+        regression = False
+        if baseline_ms is not None and current_ms is not None:
+            regression = (
+                current_ms > baseline_ms * (1 + threshold)
+                and current_ms - baseline_ms > min_delta_ms
+            )
+        if baseline_queries is not None and current_queries is not None:
+            regression = regression or current_queries > baseline_queries
+
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline_ms=baseline_ms,
+                current_ms=current_ms,
+                baseline_queries=baseline_queries,
+                current_queries=current_queries,
+                regression=regression,
+            )
+        )
+    return comparisons
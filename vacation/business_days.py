@@ -0,0 +1,123 @@
+from datetime import date
+from typing import Any, Iterable, Tuple
+
+import numpy as np
+
+from vacation.constants import BUSINESS_DAY_UNITS, VacationTypes
+from vacation.holidays import get_holiday_calendar
+
+
+def to_day_array(values: Iterable[Any]) -> np.ndarray:
+    """
+    date/datetime 목록을 일 단위 numpy 배열(datetime64[D])로 변환합니다. 시간은 버립니다.
+    """
+    return np.array(list(values), dtype="datetime64[us]").astype("datetime64[D]")
+
+
+def get_year_bounds(year: int) -> Tuple[np.datetime64, np.datetime64]:
+    """
+    지정한 년도의 첫날과 마지막 날을 리턴합니다.
+    """
+    return np.datetime64(f"{year:04d}-01-01"), np.datetime64(f"{year:04d}-12-31")
+
+
+def get_busdaycal(busdaycal: np.busdaycalendar = None) -> np.busdaycalendar:
+    """
+    영업일 달력을 지정하지 않으면 DB에 등록된 공휴일로 만든 달력을 리턴합니다.
+    """
+    return busdaycal if busdaycal is not None else get_holiday_calendar().busdaycal
+
+
+def count_business_days(
+    starts: np.ndarray, ends: np.ndarray, busdaycal: np.busdaycalendar = None
+) -> np.ndarray:
+    """
+    각 기간(start ~ end, 양 끝 포함)에 포함된 영업일(주말, 공휴일 제외) 수를 한 번에 계산합니다.
+    """
+    starts = to_day_array(starts)
+    ends = to_day_array(ends)
+    counts = np.busday_count(starts, ends + 1, busdaycal=get_busdaycal(busdaycal))
+    return np.maximum(counts, 0)
+
+
+def get_business_dates_in_year(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    year: int,
+    busdaycal: np.busdaycalendar = None,
+) -> np.ndarray:
+    """
+    여러 기간을 지정한 년도로 잘라낸 뒤, 겹치는 날짜는 한 번만 세어 영업일만 리턴합니다.
+    """
+    year_start, year_end = get_year_bounds(year)
+    num_days = int((year_end - year_start).astype(int)) + 1
+
+    starts = np.maximum(to_day_array(starts), year_start)
+    ends = np.minimum(to_day_array(ends), year_end)
+    in_year = starts <= ends
+
+    # 각 기간의 시작에 +1, 끝 다음날에 -1을 더한 뒤 누적합을 구하면 휴가로 덮인 날짜를 알 수 있습니다.
+    coverage = np.zeros(num_days + 1, dtype=np.int64)
+    np.add.at(coverage, (starts[in_year] - year_start).astype(int), 1)
+    np.add.at(coverage, (ends[in_year] - year_start).astype(int) + 1, -1)
+    covered = np.cumsum(coverage[:-1]) > 0
+
+    year_dates = year_start + np.arange(num_days)
+    return year_dates[
+        covered & np.is_busday(year_dates, busdaycal=get_busdaycal(busdaycal))
+    ]
+
+
+def count_business_days_in_year(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    year: int,
+    busdaycal: np.busdaycalendar = None,
+) -> int:
+    """
+    여러 기간을 지정한 년도로 잘라낸 뒤, 중복을 제외한 영업일 수를 계산합니다.
+    """
+    return len(
+        get_business_dates_in_year(
+            starts=starts, ends=ends, year=year, busdaycal=busdaycal
+        )
+    )
+
+
+def count_business_days_between(start: date, end: date) -> int:
+    """
+    한 기간(start ~ end, 양 끝 포함)의 영업일 수를 계산합니다.
+    """
+    return int(count_business_days(starts=[start], ends=[end])[0])
+
+
+def get_business_day_units(
+    cats: Iterable[str],
+    starts: Iterable[Any],
+    ends: Iterable[Any],
+    busdaycal: np.busdaycalendar = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    휴가별 사용 일수와 그중 종료일이 속한 년도의 일수를 1/4일 단위로 한 번에 계산합니다.
+    연차, 병가, 대체 휴가는 영업일 수, 반차는 1/2일, 반반차는 1/4일입니다.
+    """
+    cats = np.array(list(cats), dtype=object)
+    starts = to_day_array(starts)
+    ends = to_day_array(ends)
+    busdaycal = get_busdaycal(busdaycal)
+
+    units = count_business_days(starts, ends, busdaycal=busdaycal) * BUSINESS_DAY_UNITS
+    end_year_starts = ends.astype("datetime64[Y]").astype("datetime64[D]")
+    split_units = np.where(
+        starts < end_year_starts,
+        count_business_days(end_year_starts, ends, busdaycal=busdaycal)
+        * BUSINESS_DAY_UNITS,
+        0,
+    )
+
+    is_half = cats == str(VacationTypes.HALF_DAY_OFF.value)
+    is_one_fourth = cats == str(VacationTypes.ONE_FOURTH_DAY_OFF.value)
+    units = np.where(is_half, BUSINESS_DAY_UNITS // 2, units)
+    units = np.where(is_one_fourth, BUSINESS_DAY_UNITS // 4, units)
+    split_units = np.where(is_half | is_one_fourth, 0, split_units)
+    return units, split_units
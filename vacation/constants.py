@@ -1,7 +1,8 @@
-from datetime import datetime
 from enum import Enum
 
 NUM_PRENOTICE_DAYS = 3
+# 휴가 일수는 1/4일(반반차) 단위 정수로 저장합니다.
+BUSINESS_DAY_UNITS = 4
 DATETIME_FORMAT = "%Y-%m-%d %H:%M"
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -46,17 +47,18 @@ class TestCaseCredentials(object):
     USER_PW = "password"
 
 
-HOLIDAY_LIST = [
-    datetime(2021, 8, 15),
-    datetime(2021, 9, 20),
-    datetime(2021, 9, 21),
-    datetime(2021, 9, 22),
-    datetime(2021, 10, 3),
-    datetime(2021, 10, 9),
-    datetime(2021, 12, 25),
+SPECIAL_VACATION_TYPES = [
+    str(VacationTypes.SICK_DAY.value),
+    str(VacationTypes.COMP_DAY.value),
 ]
 
-SPECIAL_VACATION_TYPES = [
+DAY_OFF_TYPES = [
+    str(VacationTypes.DAY_OFF.value),
     str(VacationTypes.SICK_DAY.value),
     str(VacationTypes.COMP_DAY.value),
 ]
+
+PARTIAL_DAY_OFF_TYPES = [
+    str(VacationTypes.HALF_DAY_OFF.value),
+    str(VacationTypes.ONE_FOURTH_DAY_OFF.value),
+]
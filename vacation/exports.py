@@ -0,0 +1,199 @@
+import csv
+import datetime
+import tempfile
+from typing import Any, Iterable, Iterator, List, Optional
+
+from core.models import Attendance
+from core.pagination import iter_keyset
+from vacation.constants import (
+    APPROVAL_CHOICES,
+    BUSINESS_DAY_UNITS,
+    DATE_FORMAT,
+    DATETIME_FORMAT,
+    DAY_OFF_TYPES,
+    VACATION_CHOICES,
+)
+from vacation.models import Vacation
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+VACATION_HEADER = [
+    "id",
+    "아이디",
+    "이름",
+    "종류",
+    "시작",
+    "종료",
+    "승인 여부",
+    "사용 일수",
+    "종료 년도 사용 일수",
+]
+ATTENDANCE_HEADER = [
+    "id",
+    "아이디",
+    "이름",
+    "날짜",
+    "출근시간",
+    "퇴근시간",
+    "근무 시간",
+    "상태",
+    "IP주소",
+]
+
+# 한 번에 내보낼 CSV 행 수
+CSV_ROWS_PER_CHUNK = 500
+XLSX_BLOCK_SIZE = 64 * 1024
+
+
+def get_worked_seconds(start_at: datetime.time, end_at: Optional[datetime.time]) -> int:
+    """
+    core.rollups.get_worked_seconds()와 같은 규칙(자정을 넘기면 하루를 더함)으로 근무 시간(초)을 계산합니다.
+    SQLite에서는 시각 함수가 파이썬으로 돌아가므로 DB 대신 여기서 계산합니다.
+    """
+    if end_at is None:
+        return 0
+    worked = datetime.datetime.combine(
+        datetime.date.min, end_at
+    ) - datetime.datetime.combine(datetime.date.min, start_at)
+    return int(worked.total_seconds()) % (24 * 3600)
+
+
+def get_vacation_rows(
+    start: datetime.date, end: datetime.date, chunk_size: int = 2000
+) -> Iterator[List[Any]]:
+    """
+    기간(start ~ end)에 걸친 휴가를 (시작일, id) 순서로 chunk_size개씩 읽어 한 행씩 리턴합니다.
+    """
+    categories = dict(VACATION_CHOICES)
+    approvals = dict(APPROVAL_CHOICES)
+    vacation_list = Vacation.objects.filter(
+        start_at__lt=datetime.datetime.combine(end, datetime.time.min)
+        + datetime.timedelta(days=1),
+        end_at__gte=datetime.datetime.combine(start, datetime.time.min),
+    ).values(
+        "id",
+        "user__username",
+        "user__first_name",
+        "cat",
+        "start_at",
+        "end_at",
+        "approval",
+        "business_days",
+        "year_split_days",
+    )
+
+    for vacation in iter_keyset(vacation_list, ("start_at", "id"), chunk_size):
+        time_format = (
+            DATE_FORMAT if vacation["cat"] in DAY_OFF_TYPES else DATETIME_FORMAT
+        )
+        yield [
+            vacation["id"],
+            vacation["user__username"],
+            vacation["user__first_name"],
+            categories.get(vacation["cat"], vacation["cat"]),
+            vacation["start_at"].strftime(time_format),
+            vacation["end_at"].strftime(time_format),
+            approvals.get(vacation["approval"], vacation["approval"]),
+            vacation["business_days"] / BUSINESS_DAY_UNITS,
+            vacation["year_split_days"] / BUSINESS_DAY_UNITS,
+        ]
+
+
+def get_attendance_rows(
+    start: datetime.date, end: datetime.date, chunk_size: int = 2000
+) -> Iterator[List[Any]]:
+    """
+    기간(start ~ end)의 출근기록을 (날짜, id) 순서로 chunk_size개씩 읽어 근무 시간과 함께 한 행씩 리턴합니다.
+    """
+    statuses = dict(Attendance.STATUS)
+    attendance_list = Attendance.objects.filter(date__gte=start, date__lte=end).values(
+        "id",
+        "user__username",
+        "user__first_name",
+        "date",
+        "start_at",
+        "end_at",
+        "status",
+        "ip_address",
+    )
+
+    for attendance in iter_keyset(attendance_list, ("date", "id"), chunk_size):
+        yield [
+            attendance["id"],
+            attendance["user__username"],
+            attendance["user__first_name"],
+            attendance["date"].strftime(DATE_FORMAT),
+            attendance["start_at"].strftime("%H:%M:%S"),
+            attendance["end_at"].strftime("%H:%M:%S") if attendance["end_at"] else "",
+            round(
+                get_worked_seconds(attendance["start_at"], attendance["end_at"]) / 3600,
+                2,
+            ),
+            statuses.get(attendance["status"], attendance["status"]),
+            attendance["ip_address"],
+        ]
+
+
+EXPORTS = {
+    "vacation": (VACATION_HEADER, get_vacation_rows),
+    "attendance": (ATTENDANCE_HEADER, get_attendance_rows),
+}
+
+
+class Echo(object):
+    """
+    csv.writer가 쓴 한 줄을 그대로 리턴하는 가짜 파일입니다.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv(header: List[str], rows: Iterable[List[Any]]) -> Iterator[str]:
+    """
+    CSV를 CSV_ROWS_PER_CHUNK행씩 묶어 보냅니다. 엑셀에서 한글이 깨지지 않도록 BOM을 붙입니다.
+    """
+    writer = csv.writer(Echo())
+    yield "\ufeff" + writer.writerow(header)
+
+    lines = []
+    for row in rows:
+        lines.append(writer.writerow(row))
+        if len(lines) >= CSV_ROWS_PER_CHUNK:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def stream_xlsx(header: List[str], rows: Iterable[List[Any]]) -> Iterator[bytes]:
+    """
+    openpyxl의 write_only 모드로 행을 임시 파일에 쓴 뒤 나눠 보냅니다.
+    XLSX는 zip 파일이라 다 쓴 뒤에야 보낼 수 있지만, 메모리에는 행을 쌓아 두지 않습니다.
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while True:
+            block = file.read(XLSX_BLOCK_SIZE)
+            if not block:
+                return
+            yield block
+
+
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", stream_csv),
+    "xlsx": (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        stream_xlsx,
+    ),
+}
@@ -0,0 +1,173 @@
+import csv
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Iterator, TextIO, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from vacation.models import Holiday
+
+HOLIDAY_VERSION_KEY = "vacation:holidays:version"
+
+
+class HolidayCalendar(object):
+    """
+    공휴일을 정렬된 일 단위 배열과 numpy 영업일 달력(busdaycalendar)으로 미리 만들어 둔 읽기 전용 구조입니다.
+    """
+
+    def __init__(self, dates: Iterable[date], version: int = 0):
+        holidays = np.unique(np.array(list(dates), dtype="datetime64[D]"))
+        holidays.flags.writeable = False
+
+        self.version = version
+        self.holidays = holidays
+        self.busdaycal = np.busdaycalendar(holidays=holidays)
+
+    def __len__(self):
+        return len(self.holidays)
+
+    def __contains__(self, day: Any) -> bool:
+        return self.is_holiday(day)
+
+    def is_holiday(self, day: Any) -> bool:
+        if isinstance(day, datetime):
+            day = day.date()
+        day = np.datetime64(day, "D")
+        index = np.searchsorted(self.holidays, day)
+        return bool(index < len(self.holidays) and self.holidays[index] == day)
+
+
+_calendar = None
+_calendar_checked_at = None
+_calendar_lock = threading.Lock()
+
+
+def get_holiday_version() -> int:
+    """
+    공휴일 캐시 버전을 리턴합니다. 버전이 없으면(캐시가 비워진 경우 등) 새 버전을 만듭니다.
+    """
+    version = cache.get(HOLIDAY_VERSION_KEY)
+    if version is None:
+        cache.add(HOLIDAY_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(HOLIDAY_VERSION_KEY)
+    return version
+
+
+def bump_holiday_version() -> None:
+    """
+    공휴일이 바뀌었을 때 호출합니다. 모든 프로세스의 공휴일 캐시가 다음 조회 때 다시 만들어집니다.
+    """
+    global _calendar_checked_at
+
+    # incr은 DB 캐시에서 만료 시간을 기본값으로 되돌리므로, 새 버전을 만료 없이 저장합니다.
+    cache.set(HOLIDAY_VERSION_KEY, time.time_ns(), timeout=None)
+    # 이 프로세스는 다음 조회 때 바로 새 버전을 확인합니다.
+    _calendar_checked_at = None
+
+
+def get_holiday_calendar() -> HolidayCalendar:
+    """
+    프로세스 전체에서 공유하는 공휴일 달력을 리턴합니다. 버전이 바뀐 경우에만 DB에서 다시 읽습니다.
+    공유 캐시의 버전은 HOLIDAY_VERSION_CHECK_INTERVAL초(기본값 1초)에 한 번만 확인하고, 그 사이에는 같은 달력을 씁니다.
+    """
+    global _calendar, _calendar_checked_at
+
+    calendar, checked_at = _calendar, _calendar_checked_at
+    now = time.monotonic()
+    interval = getattr(settings, "HOLIDAY_VERSION_CHECK_INTERVAL", 1)
+    if calendar is not None and checked_at is not None and now - checked_at < interval:
+        return calendar
+
+    version = get_holiday_version()
+    if calendar is None or calendar.version != version:
+        with _calendar_lock:
+            if _calendar is None or _calendar.version != version:
+                _calendar = HolidayCalendar(
+                    dates=Holiday.objects.values_list("date", flat=True),
+                    version=version,
+                )
+            calendar = _calendar
+    _calendar_checked_at = now
+    return calendar
+
+
+def read_holidays_from_csv(file: TextIO) -> Iterator[Tuple[date, str]]:
+    """
+    "날짜,이름" 형식의 CSV 파일에서 공휴일을 한 줄씩 읽습니다. 날짜로 읽을 수 없는 줄(헤더 등)은 건너뜁니다.
+    """
+    for row in csv.reader(file):
+        if not row or not row[0].strip():
+            continue
+        try:
+            day = date.fromisoformat(row[0].strip())
+        except ValueError:
+            continue
+        yield day, row[1].strip() if len(row) > 1 else ""
+
+
+def read_holidays_from_ics(file: TextIO) -> Iterator[Tuple[date, str]]:
+    """
+    iCalendar(.ics) 파일의 VEVENT에서 공휴일을 읽습니다. 여러 날짜에 걸친 일정은 하루씩 나눠 리턴합니다.
+    """
+
+    def parse_date(value: str) -> date:
+        return datetime.strptime(value.strip()[:8], "%Y%m%d").date()
+
+    def unfold(lines: Iterable[str]) -> Iterator[str]:
+        # RFC 5545: 공백으로 시작하는 줄은 앞 줄에 이어지는 내용입니다.
+        previous = None
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if line[:1] in (" ", "\t") and previous is not None:
+                previous += line[1:]
+                continue
+            if previous is not None:
+                yield previous
+            previous = line
+        if previous is not None:
+            yield previous
+
+    event = None
+    for line in unfold(file):
+        if line == "BEGIN:VEVENT":
+            event = {}
+        elif line == "END:VEVENT" and event is not None:
+            if "DTSTART" in event:
+                start = parse_date(event["DTSTART"])
+                end = parse_date(event["DTEND"]) if "DTEND" in event else start
+                name = event.get("SUMMARY", "")
+                yield start, name
+                for offset in range(1, (end - start).days):
+                    yield start + timedelta(days=offset), name
+            event = None
+        elif event is not None and ":" in line:
+            key, value = line.split(":", 1)
+            event[key.split(";", 1)[0].upper()] = value
+
+
+def import_holidays(
+    holidays: Iterable[Tuple[date, str]], replace: bool = False, batch_size: int = 500
+) -> int:
+    """
+    공휴일을 한 번에 저장하고 공휴일 캐시 버전을 올립니다. replace이면 같은 년도의 기존 공휴일을 지웁니다.
+    bulk 작업은 signal을 보내지 않으므로, 휴가 사용 일수는 호출한 쪽에서 한 번에 다시 계산합니다.
+    """
+    holidays = {day: name for day, name in holidays}
+    with transaction.atomic():
+        if replace:
+            years = {day.year for day in holidays}
+            # QuerySet.delete()는 post_delete receiver가 있으면 공휴일마다 signal을 보내
+            # 버전을 올리고 사용 일수를 다시 계산하므로, signal 없이 한 번의 DELETE로 지웁니다.
+            queryset = Holiday.objects.filter(date__year__in=years)
+            queryset._raw_delete(queryset.db)
+        Holiday.objects.bulk_create(
+            [Holiday(date=day, name=name) for day, name in sorted(holidays.items())],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+    bump_holiday_version()
+    return len(holidays)
@@ -0,0 +1,514 @@
+import csv
+import ipaddress
+import json
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime, time as datetime_time
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TextIO, Tuple
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from core.attendance import refresh_latest_attendances
+from core.models import Attendance, Profile
+from core.rollups import rebuild_rollups
+from core.statistics import bump_statistics_version
+from vacation.business_days import get_business_day_units
+from vacation.constants import (
+    APPROVAL_CHOICES,
+    DAY_OFF_TYPES,
+    VACATION_CHOICES,
+    VacationApproval,
+    VacationMessages,
+)
+from vacation.ledger import rebuild_balances
+from vacation.models import Vacation
+from vacation.utils import convert_start_and_end_at, is_category_day_off
+
+# (줄 번호, 행)
+Row = Tuple[int, Dict[str, Any]]
+
+# 코드("1")와 이름("연차/휴가") 모두 받습니다.
+VACATION_CATEGORIES = {
+    **{code: code for code, _ in VACATION_CHOICES},
+    **{label: code for code, label in VACATION_CHOICES},
+}
+VACATION_APPROVALS = {
+    **{code: code for code, _ in APPROVAL_CHOICES},
+    **{label: code for code, label in APPROVAL_CHOICES},
+}
+ATTENDANCE_STATUSES = {
+    **{code: code for code, _ in Attendance.STATUS},
+    **{label: code for code, label in Attendance.STATUS},
+}
+
+
+class RowError(ValueError):
+    """
+    가져올 수 없는 행입니다. 해당 행만 건너뜁니다.
+    """
+
+
+def read_rows_from_csv(file: TextIO) -> Iterator[Row]:
+    """
+    헤더가 있는 CSV 파일을 한 행씩 읽습니다. 빈 값은 없는 것으로 봅니다.
+    """
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and value and value.strip()
+        }
+
+
+def read_rows_from_jsonl(file: TextIO) -> Iterator[Row]:
+    """
+    한 줄에 JSON 객체 하나씩 있는 파일을 한 행씩 읽습니다. JSON으로 읽을 수 없는 줄은 빈 행으로 넘깁니다.
+    """
+    for line_num, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        if not isinstance(row, dict):
+            row = {}
+        yield line_num, {
+            key: value.strip() if isinstance(value, str) else value
+            for key, value in row.items()
+            if value not in (None, "")
+        }
+
+
+def iter_chunks(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def get_value(row: Dict[str, Any], key: str) -> Any:
+    if key not in row:
+        raise RowError(f"{key} 값이 없습니다.")
+    return row[key]
+
+
+def parse_choice(row: Dict[str, Any], key: str, choices: Dict[str, str]) -> str:
+    value = str(get_value(row, key))
+    if value not in choices:
+        raise RowError(f"알 수 없는 {key}입니다: {value}")
+    return choices[value]
+
+
+def parse_datetime(value: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        raise RowError(f"{VacationMessages.INVALID_DATES} ({value})")
+
+
+def parse_date(value: Any) -> date:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        raise RowError(f"{VacationMessages.INVALID_DATES} ({value})")
+
+
+def parse_time(value: Any) -> datetime_time:
+    try:
+        return datetime_time.fromisoformat(str(value))
+    except ValueError:
+        raise RowError(f"잘못된 시각입니다: {value}")
+
+
+class ImportStats(object):
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.errors = []
+        self.started_at = time.monotonic()
+
+    @property
+    def skipped(self) -> int:
+        return self.rows - self.imported
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+class UserLookup(object):
+    """
+    username -> user id. 청크마다 처음 보는 username만 한 번에 읽습니다.
+    """
+
+    def __init__(self):
+        self.ids = {}
+
+    def load(self, usernames: Iterable[str]) -> None:
+        missing = {str(username) for username in usernames} - self.ids.keys()
+        if not missing:
+            return
+        self.ids.update(dict.fromkeys(missing))
+        self.ids.update(
+            User.objects.filter(username__in=missing).values_list("username", "id")
+        )
+
+    def get(self, row: Dict[str, Any]) -> int:
+        username = str(get_value(row, "username"))
+        user_id = self.ids.get(username)
+        if user_id is None:
+            raise RowError(f"사용자가 없습니다: {username}")
+        return user_id
+
+
+class VacationIntervals(object):
+    """
+    사용자별로 거부되지 않은 휴가 기간을 겹치지 않는 구간의 정렬된 배열로 모아 둡니다.
+    연차/병가/대체휴가는 종료일 하루 전체를 쓰므로, does_vacation_overlap과 같은 규칙으로 겹침을 판단합니다.
+    """
+
+    def __init__(self):
+        self.intervals = defaultdict(lambda: ([], []))
+
+    @staticmethod
+    def get_interval(
+        cat: str, start: datetime, end: datetime
+    ) -> Tuple[datetime, datetime]:
+        if str(cat) in DAY_OFF_TYPES:
+            start = datetime.combine(start.date(), datetime.min.time())
+            end = datetime.combine(end.date(), datetime.max.time())
+        return start, end
+
+    def overlaps(self, user_id: int, cat: str, start: datetime, end: datetime) -> bool:
+        start, end = self.get_interval(cat, start, end)
+        starts, ends = self.intervals[user_id]
+        i = bisect_right(starts, end) - 1
+        return i >= 0 and ends[i] >= start
+
+    def add(self, user_id: int, cat: str, start: datetime, end: datetime) -> None:
+        start, end = self.get_interval(cat, start, end)
+        starts, ends = self.intervals[user_id]
+        # 겹치는 구간(lo ~ hi - 1)은 하나로 합칩니다.
+        lo = bisect_left(ends, start)
+        hi = bisect_right(starts, end)
+        if lo < hi:
+            start, end = min(start, starts[lo]), max(end, ends[hi - 1])
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
+
+
+class Importer(object):
+    """
+    행을 청크 단위로 검증해 청크마다 한 트랜잭션으로 bulk_create합니다.
+    bulk_create는 signal을 보내지 않으므로 원장/집계는 finish()에서 한 번에 다시 계산합니다.
+    """
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self.users = UserLookup()
+
+    def prepare(self, rows: List[Row]) -> None:
+        self.users.load(row["username"] for _, row in rows if "username" in row)
+
+    def build(self, row: Dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    def save(self, objects: List[Any]) -> int:
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        pass
+
+    def import_rows(
+        self,
+        rows: Iterable[Row],
+        chunk_size: int = 5000,
+        progress: Callable[[ImportStats], None] = None,
+    ) -> ImportStats:
+        stats = ImportStats()
+        for chunk in iter_chunks(rows, chunk_size):
+            self.prepare(chunk)
+            objects = []
+            for line_num, row in chunk:
+                try:
+                    objects.append(self.build(row))
+                except RowError as e:
+                    stats.errors.append((line_num, str(e)))
+            with transaction.atomic():
+                stats.imported += self.save(objects)
+            stats.rows += len(chunk)
+            if progress is not None:
+                progress(stats)
+        self.finish()
+        return stats
+
+
+class VacationImporter(Importer):
+    """
+    username, cat, start_at, end_at(반차/반반차는 생략), approval(기본값: 승인) 열을 읽습니다.
+    휴가 신청과 같이 종류, 기간, 겹치는 휴가를 검사하고, 지난 기록이므로 잔여 휴가는 검사하지 않습니다.
+    """
+
+    def __init__(self, batch_size: int = 500):
+        super().__init__(batch_size=batch_size)
+        self.intervals = VacationIntervals()
+        self.loaded_user_ids = set()
+        self.user_ids_by_year = defaultdict(set)
+
+    def prepare(self, rows: List[Row]) -> None:
+        super().prepare(rows)
+        user_ids = set(self.users.ids.values()) - self.loaded_user_ids - {None}
+        vacations = (
+            Vacation.objects.filter(user_id__in=user_ids)
+            .exclude(approval=str(VacationApproval.DENIED.value))
+            .values_list("user_id", "cat", "start_at", "end_at")
+        )
+        for user_id, cat, start_at, end_at in vacations:
+            self.intervals.add(user_id, cat, start_at, end_at)
+        self.loaded_user_ids |= user_ids
+
+    def build(self, row: Dict[str, Any]) -> Vacation:
+        user_id = self.users.get(row)
+        cat = parse_choice(row, "cat", VACATION_CATEGORIES)
+        approval = VACATION_APPROVALS.get(
+            str(row.get("approval", "")), str(VacationApproval.APPROVED.value)
+        )
+
+        if is_category_day_off(vacation_type=int(cat)):
+            start_at, end_at = convert_start_and_end_at(
+                start_at=parse_date(get_value(row, "start_at")),
+                end_at=parse_date(get_value(row, "end_at")),
+                vacation_type=int(cat),
+            )
+        else:
+            start_at, end_at = convert_start_and_end_at(
+                start_at=parse_datetime(get_value(row, "start_at")),
+                end_at=None,
+                vacation_type=int(cat),
+            )
+
+        if start_at > end_at:
+            raise RowError(VacationMessages.START_GREATER_THAN_END)
+        if self.intervals.overlaps(user_id, cat, start_at, end_at):
+            raise RowError(VacationMessages.OVERLAPPED_VACATION)
+        if approval != str(VacationApproval.DENIED.value):
+            self.intervals.add(user_id, cat, start_at, end_at)
+
+        return Vacation(
+            user_id=user_id,
+            cat=cat,
+            start_at=start_at,
+            end_at=end_at,
+            approval=approval,
+        )
+
+    def save(self, vacations: List[Vacation]) -> int:
+        units, split_units = get_business_day_units(
+            cats=(vacation.cat for vacation in vacations),
+            starts=(vacation.start_at for vacation in vacations),
+            ends=(vacation.end_at for vacation in vacations),
+        )
+        for vacation, business_days, year_split_days in zip(
+            vacations, units.tolist(), split_units.tolist()
+        ):
+            vacation.business_days = business_days
+            vacation.year_split_days = year_split_days
+            for year in range(vacation.start_at.year, vacation.end_at.year + 1):
+                self.user_ids_by_year[year].add(vacation.user_id)
+
+        Vacation.objects.bulk_create(vacations, batch_size=self.batch_size)
+        return len(vacations)
+
+    def finish(self) -> None:
+        for year, user_ids in sorted(self.user_ids_by_year.items()):
+            rebuild_balances(year=year, user_ids=user_ids, batch_size=self.batch_size)
+
+
+class AttendanceImporter(Importer):
+    """
+    username, date, start_at, end_at(생략 가능), ip_address, status 열을 읽습니다.
+    같은 사용자, 날짜, 출근시간의 기록이 이미 있으면 건너뜁니다.
+    """
+
+    def __init__(self, batch_size: int = 500, ip_address: str = "127.0.0.1"):
+        super().__init__(batch_size=batch_size)
+        self.ip_address = ip_address
+        self.keys = set()
+        self.user_ids = set()
+        self.start = self.end = None
+
+    def prepare(self, rows: List[Row]) -> None:
+        super().prepare(rows)
+        user_ids = {self.users.ids.get(str(row.get("username"))) for _, row in rows}
+        dates = []
+        for _, row in rows:
+            try:
+                dates.append(parse_date(row.get("date")))
+            except RowError:
+                pass
+        if dates:
+            self.keys.update(
+                Attendance.objects.filter(
+                    user_id__in=user_ids - {None},
+                    date__gte=min(dates),
+                    date__lte=max(dates),
+                ).values_list("user_id", "date", "start_at")
+            )
+
+    def build(self, row: Dict[str, Any]) -> Attendance:
+        user_id = self.users.get(row)
+        day = parse_date(get_value(row, "date"))
+        start_at = parse_time(get_value(row, "start_at"))
+        end_at = parse_time(row["end_at"]) if "end_at" in row else None
+        status = (
+            parse_choice(row, "status", ATTENDANCE_STATUSES)
+            if "status" in row
+            else Attendance.STATUS.SUBMITTED
+        )
+        ip_address = str(row.get("ip_address", self.ip_address))
+        try:
+            ipaddress.ip_address(ip_address)
+        except ValueError:
+            raise RowError(f"잘못된 IP 주소입니다: {ip_address}")
+
+        key = (user_id, day, start_at)
+        if key in self.keys:
+            raise RowError("같은 출근기록이 이미 있습니다.")
+        self.keys.add(key)
+
+        return Attendance(
+            user_id=user_id,
+            date=day,
+            start_at=start_at,
+            end_at=end_at,
+            status=status,
+            ip_address=ip_address,
+            created_by_id=user_id,
+        )
+
+    def save(self, attendances: List[Attendance]) -> int:
+        if attendances:
+            dates = [attendance.date for attendance in attendances]
+            start, end = min(dates), max(dates)
+            self.start = min(self.start or start, start)
+            self.end = max(self.end or end, end)
+            self.user_ids.update(attendance.user_id for attendance in attendances)
+        Attendance.objects.bulk_create(attendances, batch_size=self.batch_size)
+        return len(attendances)
+
+    def finish(self) -> None:
+        if not self.user_ids:
+            return
+        rebuild_rollups(start=self.start, end=self.end, batch_size=self.batch_size)
+        refresh_latest_attendances(self.user_ids, batch_size=self.batch_size)
+        bump_statistics_version(
+            user_ids=self.user_ids, years=range(self.start.year, self.end.year + 1)
+        )
+
+
+class ProfileImporter(Importer):
+    """
+    username, first_name, last_name, email, total_days, slack_channel 열을 읽습니다.
+    없는 사용자는 비밀번호 없이 새로 만들고, 있는 사용자는 파일에 있는 값만 바꿉니다.
+    """
+
+    USER_FIELDS = ["first_name", "last_name", "email"]
+    PROFILE_FIELDS = ["total_days", "slack_channel"]
+
+    def prepare(self, rows: List[Row]) -> None:
+        pass
+
+    def build(self, row: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        username = str(get_value(row, "username"))
+        values = {
+            field: str(row[field])
+            for field in self.USER_FIELDS + ["slack_channel"]
+            if field in row
+        }
+        if "total_days" in row:
+            try:
+                values["total_days"] = float(row["total_days"])
+            except ValueError:
+                values["total_days"] = -1
+            if values["total_days"] < 0:
+                raise RowError(f"잘못된 총 휴가 일수입니다: {row['total_days']}")
+        return username, values
+
+    def save(self, rows: List[Tuple[str, Dict[str, Any]]]) -> int:
+        values_by_username = dict(rows)
+        usernames = list(values_by_username)
+
+        users = {
+            user.username: user
+            for user in User.objects.filter(username__in=usernames).only(
+                "id", "username", *self.USER_FIELDS
+            )
+        }
+        new_users = []
+        for username in usernames:
+            if username in users:
+                continue
+            user = User(username=username)
+            user.set_unusable_password()
+            new_users.append(user)
+        # SQLite에서는 bulk_create가 id를 채우지 않으므로 다시 읽습니다.
+        User.objects.bulk_create(new_users, batch_size=self.batch_size)
+        if new_users:
+            users.update(
+                (user.username, user)
+                for user in User.objects.filter(
+                    username__in=[user.username for user in new_users]
+                ).only("id", "username", *self.USER_FIELDS)
+            )
+
+        profiles = {
+            profile.user_id: profile
+            for profile in Profile.objects.filter(
+                user_id__in=[user.id for user in users.values()]
+            )
+        }
+        new_profiles = []
+        for username, values in values_by_username.items():
+            user = users[username]
+            for field in self.USER_FIELDS:
+                if field in values:
+                    setattr(user, field, values[field])
+            profile = profiles.get(user.id)
+            if profile is None:
+                profile = Profile(user_id=user.id)
+                new_profiles.append(profile)
+            for field in self.PROFILE_FIELDS:
+                if field in values:
+                    setattr(profile, field, values[field])
+
+        User.objects.bulk_update(
+            users.values(), self.USER_FIELDS, batch_size=self.batch_size
+        )
+        Profile.objects.bulk_update(
+            profiles.values(), self.PROFILE_FIELDS, batch_size=self.batch_size
+        )
+        Profile.objects.bulk_create(new_profiles, batch_size=self.batch_size)
+        return len(rows)
+
+
+READERS = {
+    "csv": read_rows_from_csv,
+    "jsonl": read_rows_from_jsonl,
+}
+
+IMPORTERS = {
+    "vacation": VacationImporter,
+    "attendance": AttendanceImporter,
+    "profile": ProfileImporter,
+}
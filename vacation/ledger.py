@@ -0,0 +1,329 @@
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, NamedTuple
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from core.models import Profile
+from vacation.constants import (
+    DAY_OFF_TYPES,
+    SPECIAL_VACATION_TYPES,
+    VacationApproval,
+    VacationTypes,
+)
+from vacation.models import Balance, Vacation
+from vacation.utils import (
+    VacationBalance,
+    get_vacation_days_by_user,
+    update_business_days,
+    update_vacation_days,
+)
+
+BALANCE_FIELDS = ["used_days", "on_hold_days", "sick_days", "comp_days"]
+PROFILE_FIELDS = ["used_days", "sick_days", "comp_days"]
+
+BALANCE_VERSION_KEY = "vacation:balance:version"
+BALANCE_GENERATION_KEY = "vacation:balance:generation:{user_id}"
+
+_cache_stats = Counter()
+_cache_stats_lock = threading.Lock()
+
+# 년도 -> {원장 항목: 일수}
+Contribution = Dict[int, Dict[str, float]]
+
+
+def get_balance_cache_setting(name: str, default: Any) -> Any:
+    return getattr(settings, f"BALANCE_CACHE_{name}", default)
+
+
+def record(**counts: int) -> None:
+    with _cache_stats_lock:
+        _cache_stats.update(counts)
+
+
+def get_balance_cache_stats() -> Dict[str, int]:
+    """
+    이 프로세스에서 휴가 현황 캐시를 읽은 결과입니다. 캐시에서 바로 읽은 수(hits), 캐시에 없던 수(misses),
+    원장을 읽어 캐시를 채운 수(computations), 다른 요청이 채우기를 기다려 읽은 수(waits)를 셉니다.
+    """
+    with _cache_stats_lock:
+        return dict(_cache_stats)
+
+
+def reset_balance_cache_stats() -> None:
+    with _cache_stats_lock:
+        _cache_stats.clear()
+
+
+def get_or_add_counter(key: str) -> int:
+    counter = cache.get(key)
+    if counter is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        counter = cache.get(key)
+    return counter
+
+
+def bump_counters(keys: Iterable[str]) -> None:
+    # incr은 DB 캐시에서 만료 시간을 기본값으로 되돌리므로, 새 값을 만료 없이 저장합니다.
+    counter = time.time_ns()
+    cache.set_many({key: counter for key in keys}, timeout=None)
+
+
+def invalidate_balance_cache(user_ids: Iterable[int] = None) -> None:
+    """
+    사용자들(None이면 전체)의 휴가 현황 캐시 세대를 올립니다. 트랜잭션 안이면 커밋한 뒤에 한 번 더 올려,
+    커밋 전에 다른 요청이 이전 원장으로 채운 캐시도 버립니다.
+    """
+    if user_ids is None:
+        keys = [BALANCE_VERSION_KEY]
+    else:
+        keys = [
+            BALANCE_GENERATION_KEY.format(user_id=user_id) for user_id in set(user_ids)
+        ]
+
+    bump_counters(keys)
+    transaction.on_commit(lambda: bump_counters(keys))
+
+
+def get_balance_cache_key(user_id: int, year: int) -> str:
+    """
+    전체 버전과 사용자 세대가 들어간 키입니다. 둘 중 하나가 바뀌면 이전 키의 캐시는 더 이상 읽지 않습니다.
+    """
+    generation_key = BALANCE_GENERATION_KEY.format(user_id=user_id)
+    counters = cache.get_many([BALANCE_VERSION_KEY, generation_key])
+    version = counters.get(BALANCE_VERSION_KEY) or get_or_add_counter(
+        BALANCE_VERSION_KEY
+    )
+    generation = counters.get(generation_key) or get_or_add_counter(generation_key)
+    return f"vacation:balance:{version}:{user_id}:{generation}:{year}"
+
+
+def get_cached_balance(
+    user_id: int, year: int = datetime.today().year
+) -> VacationBalance:
+    """
+    사용자의 년도별 (사용 휴가, 승인 예정 휴가, 병가, 대체 휴가)를 캐시에서 읽습니다.
+    캐시에 없으면 한 요청만 원장을 읽어 채우고, 동시에 들어온 다른 요청은 채워질 때까지 기다립니다.
+    """
+    key = get_balance_cache_key(user_id=user_id, year=year)
+    values = cache.get(key)
+    if values is not None:
+        record(hits=1)
+        return VacationBalance(*values)
+    record(misses=1)
+
+    lock_key = f"{key}:lock"
+    lock_token = f"{os.getpid()}:{threading.get_ident()}:{time.time_ns()}"
+    lock_timeout = get_balance_cache_setting("LOCK_TIMEOUT", 5)
+    deadline = time.monotonic() + lock_timeout
+    locked = cache.add(lock_key, lock_token, timeout=lock_timeout)
+    while not locked and time.monotonic() < deadline:
+        time.sleep(get_balance_cache_setting("WAIT_INTERVAL", 0.01))
+        values = cache.get(key)
+        if values is not None:
+            record(waits=1)
+            return VacationBalance(*values)
+        locked = cache.add(lock_key, lock_token, timeout=lock_timeout)
+
+    # 기다리다 시간이 다 되면 잠금 없이 직접 계산합니다.
+    try:
+        balance = get_balance(user_id=user_id, year=year)
+        values = tuple(getattr(balance, field) for field in BALANCE_FIELDS)
+        cache.set(key, values, timeout=get_balance_cache_setting("TIMEOUT", 24 * 3600))
+        record(computations=1)
+    finally:
+        # 잠금이 만료되어 다른 요청이 새로 잡은 경우에는 지우지 않습니다.
+        if locked and cache.get(lock_key) == lock_token:
+            cache.delete(lock_key)
+    return VacationBalance(*values)
+
+
+def get_vacation_contribution(vacation: Vacation) -> Contribution:
+    """
+    휴가 한 건이 년도별로 원장의 어느 항목에 몇 일을 더하는지 저장된 사용 일수로 계산합니다.
+    """
+    approval = str(vacation.approval)
+    cat = str(vacation.cat)
+
+    if approval == str(VacationApproval.APPROVED.value):
+        field = {
+            str(VacationTypes.SICK_DAY.value): "sick_days",
+            str(VacationTypes.COMP_DAY.value): "comp_days",
+        }.get(cat, "used_days")
+    elif approval == str(VacationApproval.ON_HOLD.value):
+        if cat in SPECIAL_VACATION_TYPES:
+            return {}
+        field = "on_hold_days"
+    else:
+        return {}
+
+    return {year: {field: days} for year, days in vacation.get_days_by_year().items()}
+
+
+def get_contribution_delta(new: Contribution, old: Contribution) -> Contribution:
+    """
+    두 기여분의 차이(new - old)를 계산합니다.
+    """
+    delta = defaultdict(lambda: defaultdict(float))
+    for sign, contribution in ((1, new), (-1, old)):
+        for year, fields in contribution.items():
+            for field, days in fields.items():
+                delta[year][field] += sign * days
+    return {
+        year: {field: days for field, days in fields.items() if days}
+        for year, fields in delta.items()
+        if any(fields.values())
+    }
+
+
+def apply_balance_delta(user_id: int, delta: Contribution) -> None:
+    """
+    원장에 변경분을 더합니다. 원장이 아직 없는 년도는 전체를 다시 계산합니다.
+    """
+    current_year = datetime.today().year
+    for year, fields in delta.items():
+        with transaction.atomic():
+            updated = Balance.objects.filter(user_id=user_id, year=year).update(
+                **{field: F(field) + days for field, days in fields.items()}
+            )
+            if not updated:
+                rebuild_balances(year=year, user_ids=[user_id])
+                continue
+
+            profile_fields = {
+                field: F(field) + days
+                for field, days in fields.items()
+                if field in PROFILE_FIELDS
+            }
+            if year == current_year and profile_fields:
+                Profile.objects.filter(user_id=user_id).update(**profile_fields)
+
+    if delta:
+        invalidate_balance_cache(user_ids=[user_id])
+
+
+class BalanceSummary(NamedTuple):
+    """
+    휴가 내역 화면에 보여주는 휴가 현황입니다.
+    """
+
+    total_days: float
+    used_days: float
+    on_hold_days: float
+    available_days: float
+    sick_days: float
+    comp_days: float
+
+
+def get_balance_summary(
+    user_profile: Profile, year: int = datetime.today().year
+) -> BalanceSummary:
+    """
+    원장 한 줄과 Profile의 총 휴가를 가지고 휴가 현황을 만듭니다.
+    """
+    balance = get_cached_balance(user_id=user_profile.user_id, year=year)
+    return BalanceSummary(
+        total_days=user_profile.total_days,
+        used_days=balance.used_days,
+        on_hold_days=balance.on_hold_days,
+        available_days=user_profile.total_days
+        - balance.used_days
+        - balance.on_hold_days,
+        sick_days=balance.sick_days,
+        comp_days=balance.comp_days,
+    )
+
+
+def get_balance(user_id: int, year: int = datetime.today().year) -> Balance:
+    """
+    원장에서 사용자의 년도별 휴가 현황을 읽습니다. 원장이 없으면 새로 계산합니다.
+    """
+    balance = Balance.objects.filter(user_id=user_id, year=year).first()
+    if balance is None:
+        rebuild_balances(year=year, user_ids=[user_id])
+        balance = Balance.objects.get(user_id=user_id, year=year)
+    return balance
+
+
+def rebuild_balances(
+    year: int = datetime.today().year,
+    user_ids: Iterable[int] = None,
+    batch_size: int = 500,
+) -> int:
+    """
+    휴가 기록 전체를 다시 읽어 원장을 새로 계산합니다. 올해 원장이면 Profile도 함께 갱신합니다.
+    """
+    balance_list = Balance.objects.filter(year=year)
+    if user_ids is None:
+        all_user_ids = list(User.objects.values_list("id", flat=True))
+    else:
+        user_ids = all_user_ids = list(user_ids)
+        balance_list = balance_list.filter(user_id__in=user_ids)
+
+    approved_days = get_vacation_days_by_user(year=year, user_ids=user_ids)
+    on_hold_days = get_vacation_days_by_user(
+        year=year, user_ids=user_ids, approval=str(VacationApproval.ON_HOLD.value)
+    )
+
+    balances = {balance.user_id: balance for balance in balance_list}
+    new_balances = []
+    for user_id in all_user_ids:
+        used_days, sick_days, comp_days = approved_days.get(user_id, (0.0, 0.0, 0.0))
+        balance = balances.get(user_id)
+        if balance is None:
+            balance = Balance(user_id=user_id, year=year)
+            new_balances.append(balance)
+        balance.used_days = used_days
+        balance.on_hold_days = on_hold_days.get(user_id, (0.0,))[0]
+        balance.sick_days = sick_days
+        balance.comp_days = comp_days
+
+    with transaction.atomic():
+        Balance.objects.bulk_update(
+            balances.values(), BALANCE_FIELDS, batch_size=batch_size
+        )
+        Balance.objects.bulk_create(
+            new_balances, batch_size=batch_size, ignore_conflicts=True
+        )
+        if year == datetime.today().year:
+            update_vacation_days(
+                year=year,
+                user_ids=user_ids,
+                batch_size=batch_size,
+                vacation_days=approved_days,
+            )
+    invalidate_balance_cache(user_ids=user_ids)
+    return len(all_user_ids)
+
+
+def refresh_business_days(
+    start: date = None, end: date = None, batch_size: int = 500
+) -> int:
+    """
+    기간(start ~ end)에 걸친 연차, 병가, 대체 휴가의 사용 일수를 다시 계산하고,
+    값이 바뀐 휴가가 있는 사용자의 원장을 다시 만듭니다. 공휴일이 바뀌었을 때 호출합니다.
+    """
+    vacation_list = Vacation.objects.filter(cat__in=DAY_OFF_TYPES)
+    if start is not None:
+        vacation_list = vacation_list.filter(end_at__date__gte=start)
+    if end is not None:
+        vacation_list = vacation_list.filter(start_at__date__lte=end)
+
+    changed_vacations = update_business_days(
+        vacation_list=vacation_list, batch_size=batch_size
+    )
+
+    user_ids_by_year = defaultdict(set)
+    for vacation in changed_vacations:
+        for year in range(vacation.start_at.year, vacation.end_at.year + 1):
+            user_ids_by_year[year].add(vacation.user_id)
+    for year, user_ids in sorted(user_ids_by_year.items()):
+        rebuild_balances(year=year, user_ids=user_ids, batch_size=batch_size)
+    return len(changed_vacations)
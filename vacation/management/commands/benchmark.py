@@ -0,0 +1,116 @@
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from vacation.benchmarks.runner import (
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "테스트 DB에 직원 수별 가상 조직을 만들고 vacation.utils 함수와 휴가/출근 화면의 시간과 쿼리 수를 잽니다. "
+        "결과를 JSON으로 저장하고, 기준 결과와 비교해 느려진 항목을 알려줍니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            nargs="+",
+            default=[100, 1000],
+            help="직원 수 (여러 개 지정 가능, 예: --users 100 1000 10000)",
+        )
+        parser.add_argument("--vacations", type=int, default=5, help="직원별 휴가 수")
+        parser.add_argument("--attendances", type=int, default=10, help="직원별 출근기록 수")
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "-k", dest="pattern", help='실행할 벤치마크 이름 패턴 (예: "*ListView*@1000")'
+        )
+        parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+        parser.add_argument("--compare", help="비교할 기준 결과 JSON 파일")
+        parser.add_argument(
+            "--threshold", type=float, default=0.2, help="회귀로 볼 중앙값 증가 비율"
+        )
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1 or options["warmup"] < 0:
+            raise CommandError("--repeat는 1 이상, --warmup은 0 이상이어야 합니다.")
+        # 체크인/체크아웃은 직원마다 하루 한 번만 잴 수 있습니다.
+        if min(options["users"]) < options["warmup"] + options["repeat"] + 1:
+            raise CommandError("--users는 --warmup + --repeat보다 커야 합니다.")
+
+        baseline = None
+        if options["compare"]:
+            try:
+                baseline = load_results(options["compare"])
+            except (OSError, ValueError) as e:
+                raise CommandError(e)
+
+        def progress(name: str, result: dict):
+            if options["verbosity"] >= 1:
+                self.stdout.write(
+                    f"{name:<44} {result['median_ms']:9.2f}ms "
+                    f"(p95 {result['p95_ms']:9.2f}ms, {result['queries']:3d} queries)"
+                )
+
+        setup_test_environment()
+        if connection.vendor == "sqlite":
+            # 메모리 DB 대신 파일 DB를 써서 실제 운영과 비슷하게 잽니다.
+            test_db = os.path.join(tempfile.mkdtemp(), "benchmark.sqlite3")
+            settings.DATABASES["default"]["TEST"] = {"NAME": test_db}
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            report = run_benchmarks(
+                options["users"],
+                repeat=options["repeat"],
+                warmup=options["warmup"],
+                pattern=options["pattern"],
+                seed=options["seed"],
+                progress=progress,
+                vacations_per_user=options["vacations"],
+                attendances_per_user=options["attendances"],
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        if options["output"]:
+            save_results(report, options["output"])
+            self.stdout.write(f"결과를 저장하였습니다. ({options['output']})")
+
+        if baseline is None:
+            return
+
+        regressions = []
+        for comparison in compare_results(
+            baseline, report, threshold=options["threshold"]
+        ):
+            if comparison.baseline_ms is None or comparison.current_ms is None:
+                status = "new" if comparison.baseline_ms is None else "missing"
+                self.stdout.write(f"{comparison.name:<44} {status}")
+                continue
+
+            line = (
+                f"{comparison.name:<44} {comparison.baseline_ms:9.2f}ms -> "
+                f"{comparison.current_ms:9.2f}ms ({comparison.ratio:5.2f}x, "
+                f"queries {comparison.baseline_queries} -> {comparison.current_queries})"
+            )
+            if comparison.regression:
+                regressions.append(comparison)
+                self.stdout.write(self.style.ERROR(f"{line} REGRESSION"))
+            else:
+                self.stdout.write(line)
+
+        if regressions:
+            raise CommandError(f"{len(regressions)}개 항목이 기준보다 느려졌습니다.")
+        self.stdout.write(self.style.SUCCESS("기준보다 느려진 항목이 없습니다."))
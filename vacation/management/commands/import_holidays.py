@@ -0,0 +1,57 @@
+import os
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vacation.holidays import (
+    import_holidays,
+    read_holidays_from_csv,
+    read_holidays_from_ics,
+)
+from vacation.ledger import refresh_business_days
+
+READERS = {
+    "csv": read_holidays_from_csv,
+    "ics": read_holidays_from_ics,
+}
+
+
+class Command(BaseCommand):
+    help = "CSV(날짜,이름) 또는 iCalendar(.ics) 파일에서 공휴일을 한 번에 등록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="공휴일 파일 경로")
+        parser.add_argument(
+            "--format",
+            choices=READERS.keys(),
+            help="파일 형식 (기본값: 확장자로 판단)",
+        )
+        parser.add_argument(
+            "--replace",
+            action="store_true",
+            help="파일에 포함된 년도의 기존 공휴일을 지우고 새로 등록",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or os.path.splitext(path)[1][1:].lower()
+        if file_format not in READERS:
+            raise CommandError(f"지원하지 않는 파일 형식입니다: {path}")
+
+        try:
+            with open(path, encoding="utf-8-sig") as file:
+                holidays = list(READERS[file_format](file))
+        except OSError as e:
+            raise CommandError(e)
+
+        num_holidays = import_holidays(holidays, replace=options["replace"])
+        if holidays:
+            # bulk 작업은 signal을 보내지 않으므로 바뀐 기간의 휴가 사용 일수를 한 번에 갱신합니다.
+            # replace이면 지운 공휴일도 있으므로 해당 년도 전체를 다시 계산합니다.
+            days = [day for day, _ in holidays]
+            start, end = min(days), max(days)
+            if options["replace"]:
+                start, end = date(start.year, 1, 1), date(end.year, 12, 31)
+            refresh_business_days(start=start, end=end)
+
+        self.stdout.write(self.style.SUCCESS(f"공휴일 {num_holidays}개를 등록하였습니다. ({path})"))
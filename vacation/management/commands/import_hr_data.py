@@ -0,0 +1,76 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vacation.importer import IMPORTERS, READERS, AttendanceImporter, ImportStats
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV 또는 JSONL 파일에서 휴가, 출근기록, 사용자 프로필을 청크 단위로 한 번에 등록합니다. "
+        "검증에 실패한 행은 건너뛰고 줄 번호와 함께 알려줍니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=IMPORTERS.keys(), help="등록할 데이터 종류")
+        parser.add_argument("path", help="파일 경로")
+        parser.add_argument(
+            "--format",
+            choices=READERS.keys(),
+            help="파일 형식 (기본값: 확장자로 판단)",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=5000, help="한 트랜잭션에서 처리할 행 수"
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--ip-address",
+            default="127.0.0.1",
+            help="출근기록에 ip_address 열이 없을 때 쓸 주소",
+        )
+        parser.add_argument(
+            "--max-errors", type=int, default=20, help="출력할 오류 행의 최대 개수"
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or os.path.splitext(path)[1][1:].lower()
+        if file_format not in READERS:
+            raise CommandError(f"지원하지 않는 파일 형식입니다: {path}")
+
+        importer_class = IMPORTERS[options["kind"]]
+        if importer_class is AttendanceImporter:
+            importer = importer_class(
+                batch_size=options["batch_size"], ip_address=options["ip_address"]
+            )
+        else:
+            importer = importer_class(batch_size=options["batch_size"])
+
+        def progress(stats: ImportStats):
+            if options["verbosity"] >= 1:
+                self.stdout.write(
+                    f"{stats.rows}행 처리 ({stats.imported}행 등록, {stats.skipped}행 건너뜀, "
+                    f"{stats.rows_per_second:.0f}행/s)"
+                )
+
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as file:
+                stats = importer.import_rows(
+                    READERS[file_format](file),
+                    chunk_size=options["chunk_size"],
+                    progress=progress,
+                )
+        except OSError as e:
+            raise CommandError(e)
+
+        for line_num, message in stats.errors[: options["max_errors"]]:
+            self.stderr.write(f"{path}:{line_num}: {message}")
+        if len(stats.errors) > options["max_errors"]:
+            self.stderr.write(f"외 {len(stats.errors) - options['max_errors']}행")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{stats.imported}행을 등록하였습니다. ({path}, {stats.skipped}행 건너뜀, "
+                f"{stats.elapsed:.2f}s, {stats.rows_per_second:.0f}행/s)"
+            )
+        )
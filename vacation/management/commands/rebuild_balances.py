@@ -0,0 +1,42 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from vacation.ledger import rebuild_balances
+
+
+class Command(BaseCommand):
+    help = "휴가 기록 전체를 다시 읽어 사용자별/년도별 휴가 원장을 새로 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            type=int,
+            action="append",
+            dest="years",
+            help="계산할 년도 (여러 번 지정 가능, 기본값: 올해)",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="특정 사용자 id만 계산 (여러 번 지정 가능)",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        for year in options["years"] or [datetime.today().year]:
+            started_at = time.monotonic()
+            num_users = rebuild_balances(
+                year=year,
+                user_ids=options["user_ids"],
+                batch_size=options["batch_size"],
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{year}년 휴가 원장을 {num_users}명에 대해 다시 계산하였습니다. "
+                    f"({time.monotonic() - started_at:.2f}s)"
+                )
+            )
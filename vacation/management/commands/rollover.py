@@ -0,0 +1,84 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vacation.rollover import rollover
+
+
+class Command(BaseCommand):
+    help = (
+        "년도의 휴가를 마감합니다. 사용자별 최종 휴가 현황을 휴가 마감 기록에 남기고, "
+        "다음 년도 총 휴가를 주고 쓰인 휴가를 다음 년도 기준으로 되돌립니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            type=int,
+            default=datetime.today().year - 1,
+            help="마감할 년도 (기본값: 작년)",
+        )
+        parser.add_argument(
+            "--total-days",
+            type=float,
+            help="다음 년도 총 휴가 (기본값: 사용자별 기존 총 휴가)",
+        )
+        parser.add_argument(
+            "--carry-over",
+            type=float,
+            default=0.0,
+            dest="max_carry_over_days",
+            help="다음 년도로 넘겨줄 잔여 휴가의 최대 일수",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="특정 사용자 id만 마감 (여러 번 지정 가능)",
+        )
+        parser.add_argument("--workers", type=int, default=1, help="나눠서 처리할 프로세스 수")
+        parser.add_argument("--shard-size", type=int, default=500)
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 결과만 출력")
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1 or options["shard_size"] < 1:
+            raise CommandError("--workers와 --shard-size는 1 이상이어야 합니다.")
+
+        year = options["year"]
+        started_at = time.monotonic()
+
+        def progress(num_done: int, num_users: int):
+            if options["verbosity"] >= 1:
+                self.stdout.write(
+                    f"{num_done}/{num_users}명 처리 ({time.monotonic() - started_at:.2f}s)"
+                )
+
+        results = rollover(
+            year,
+            user_ids=options["user_ids"],
+            workers=options["workers"],
+            shard_size=options["shard_size"],
+            progress=progress,
+            total_days=options["total_days"],
+            max_carry_over_days=options["max_carry_over_days"],
+            dry_run=options["dry_run"],
+            batch_size=options["batch_size"],
+        )
+
+        if options["dry_run"] and options["verbosity"] >= 2:
+            for result in results:
+                self.stdout.write(
+                    f"{result.user_id}: 총 {result.total_days}일, 사용 {result.used_days}일, "
+                    f"잔여 {result.remaining_days}일 -> 다음 년도 {result.next_total_days}일"
+                )
+
+        message = (
+            f"{year}년 휴가를 {len(results)}명에 대해 마감하였습니다. "
+            f"({time.monotonic() - started_at:.2f}s)"
+        )
+        if options["dry_run"]:
+            message = f"[dry-run] {message} 저장하지 않았습니다."
+        self.stdout.write(self.style.SUCCESS(message))
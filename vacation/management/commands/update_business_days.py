@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from vacation.ledger import refresh_business_days
+
+
+class Command(BaseCommand):
+    help = "휴가의 사용 일수를 공휴일 기준으로 다시 계산하고, 값이 바뀐 사용자의 원장을 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        started_at = time.monotonic()
+        num_vacations = refresh_business_days(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"휴가 {num_vacations}건의 사용 일수를 갱신하였습니다. "
+                f"({time.monotonic() - started_at:.2f}s)"
+            )
+        )
@@ -0,0 +1,40 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from vacation.utils import update_vacation_days
+
+
+class Command(BaseCommand):
+    help = "모든 사용자의 사용 휴가, 병가, 대체 휴가 일수를 한 번에 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            type=int,
+            default=datetime.today().year,
+            help="계산할 년도 (기본값: 올해)",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="특정 사용자 id만 계산 (여러 번 지정 가능)",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        started_at = time.monotonic()
+        num_profiles = update_vacation_days(
+            year=options["year"],
+            user_ids=options["user_ids"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{options['year']}년 휴가 일수를 {num_profiles}명에 대해 갱신하였습니다. "
+                f"({time.monotonic() - started_at:.2f}s)"
+            )
+        )
@@ -0,0 +1,57 @@
+# Generated by Django 3.0.2 on 2026-10-19 03:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("vacation", "0008_auto_20210727_1809"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Balance",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveSmallIntegerField(verbose_name="년도")),
+                ("used_days", models.FloatField(default=0.0, verbose_name="사용 휴가")),
+                (
+                    "on_hold_days",
+                    models.FloatField(default=0.0, verbose_name="승인 예정 휴가"),
+                ),
+                ("sick_days", models.FloatField(default=0.0, verbose_name="병가")),
+                ("comp_days", models.FloatField(default=0.0, verbose_name="대체 휴가")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "휴가 원장",
+                "verbose_name_plural": "휴가 원장",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="balance",
+            constraint=models.UniqueConstraint(
+                fields=("user", "year"), name="unique_user_year"
+            ),
+        ),
+    ]
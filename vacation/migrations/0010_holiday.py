@@ -0,0 +1,68 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:01
+
+import datetime
+
+from django.db import migrations, models
+
+HOLIDAYS_2021 = [
+    (datetime.date(2021, 8, 15), "광복절"),
+    (datetime.date(2021, 9, 20), "추석"),
+    (datetime.date(2021, 9, 21), "추석"),
+    (datetime.date(2021, 9, 22), "추석"),
+    (datetime.date(2021, 10, 3), "개천절"),
+    (datetime.date(2021, 10, 9), "한글날"),
+    (datetime.date(2021, 12, 25), "크리스마스"),
+]
+
+
+def create_holidays(apps, schema_editor):
+    Holiday = apps.get_model("vacation", "Holiday")
+    Holiday.objects.bulk_create(
+        [Holiday(date=date, name=name) for date, name in HOLIDAYS_2021],
+        ignore_conflicts=True,
+    )
+
+
+def delete_holidays(apps, schema_editor):
+    Holiday = apps.get_model("vacation", "Holiday")
+    Holiday.objects.filter(date__in=[date for date, _ in HOLIDAYS_2021]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vacation", "0009_balance"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Holiday",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(unique=True, verbose_name="날짜")),
+                (
+                    "name",
+                    models.CharField(blank=True, max_length=50, verbose_name="이름"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일")),
+            ],
+            options={
+                "verbose_name": "공휴일",
+                "verbose_name_plural": "공휴일",
+                "ordering": ["date"],
+            },
+        ),
+        migrations.RunPython(create_holidays, delete_holidays),
+    ]
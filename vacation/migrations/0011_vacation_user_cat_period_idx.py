@@ -0,0 +1,20 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vacation", "0010_holiday"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="vacation",
+            index=models.Index(
+                fields=["user", "cat", "start_at", "end_at"],
+                name="vacation_user_cat_period_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:09
+
+import numpy as np
+from django.db import migrations, models
+
+from vacation.business_days import get_business_day_units
+
+
+def fill_business_days(apps, schema_editor):
+    Holiday = apps.get_model("vacation", "Holiday")
+    Vacation = apps.get_model("vacation", "Vacation")
+
+    busdaycal = np.busdaycalendar(
+        holidays=np.array(
+            list(Holiday.objects.values_list("date", flat=True)),
+            dtype="datetime64[D]",
+        )
+    )
+    vacations = list(Vacation.objects.only("id", "cat", "start_at", "end_at"))
+    units, split_units = get_business_day_units(
+        cats=(vacation.cat for vacation in vacations),
+        starts=(vacation.start_at for vacation in vacations),
+        ends=(vacation.end_at for vacation in vacations),
+        busdaycal=busdaycal,
+    )
+    for vacation, business_days, year_split_days in zip(
+        vacations, units.tolist(), split_units.tolist()
+    ):
+        vacation.business_days = business_days
+        vacation.year_split_days = year_split_days
+    Vacation.objects.bulk_update(
+        vacations, ["business_days", "year_split_days"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vacation", "0011_vacation_user_cat_period_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vacation",
+            name="business_days",
+            field=models.PositiveIntegerField(default=0, verbose_name="사용 일수"),
+        ),
+        migrations.AddField(
+            model_name="vacation",
+            name="year_split_days",
+            field=models.PositiveIntegerField(default=0, verbose_name="종료 년도 사용 일수"),
+        ),
+        migrations.RunPython(fill_business_days, migrations.RunPython.noop),
+    ]
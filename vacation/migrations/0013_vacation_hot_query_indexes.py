@@ -0,0 +1,35 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vacation", "0012_vacation_business_days"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="vacation",
+            index=models.Index(
+                fields=["user", "approval", "cat"], name="vacation_user_approval_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vacation",
+            index=models.Index(
+                fields=["approval", "cat"], name="vacation_approval_cat_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vacation",
+            index=models.Index(
+                fields=["user", "start_at", "id"], name="vacation_user_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vacation",
+            index=models.Index(fields=["start_at", "id"], name="vacation_start_id_idx"),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 3.0.2 on 2026-10-19 04:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("vacation", "0013_vacation_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BalanceHistory",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveSmallIntegerField(verbose_name="년도")),
+                ("total_days", models.FloatField(default=0.0, verbose_name="총 휴가")),
+                ("used_days", models.FloatField(default=0.0, verbose_name="사용 휴가")),
+                (
+                    "on_hold_days",
+                    models.FloatField(default=0.0, verbose_name="승인 예정 휴가"),
+                ),
+                ("sick_days", models.FloatField(default=0.0, verbose_name="병가")),
+                ("comp_days", models.FloatField(default=0.0, verbose_name="대체 휴가")),
+                (
+                    "remaining_days",
+                    models.FloatField(default=0.0, verbose_name="잔여 휴가"),
+                ),
+                (
+                    "next_total_days",
+                    models.FloatField(default=0.0, verbose_name="다음 년도 총 휴가"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "휴가 마감 기록",
+                "verbose_name_plural": "휴가 마감 기록",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="balancehistory",
+            constraint=models.UniqueConstraint(
+                fields=("user", "year"), name="unique_history_user_year"
+            ),
+        ),
+    ]
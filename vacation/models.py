@@ -1,7 +1,9 @@
+from typing import Dict
+
 from django.contrib.auth import get_user_model
 from django.db import models
 
-from vacation.constants import APPROVAL_CHOICES, VACATION_CHOICES
+from vacation.constants import APPROVAL_CHOICES, BUSINESS_DAY_UNITS, VACATION_CHOICES
 
 
 class Vacation(models.Model):
@@ -12,6 +14,9 @@ class Vacation(models.Model):
     start_at = models.DateTimeField(default=None)
     end_at = models.DateTimeField(default=None)
     approval = models.CharField(max_length=1, choices=APPROVAL_CHOICES, default="0")
+    # 저장할 때 계산하는 사용 일수 (1/4일 단위)
+    business_days = models.PositiveIntegerField(default=0, verbose_name="사용 일수")
+    year_split_days = models.PositiveIntegerField(default=0, verbose_name="종료 년도 사용 일수")
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
@@ -20,5 +25,108 @@ class Vacation(models.Model):
     def use_days(self):
         return (self.end_at - self.start_at).days + 1
 
+    def get_days_by_year(self) -> Dict[int, float]:
+        """
+        저장된 사용 일수를 년도별 일수로 나눠 리턴합니다. 휴가는 최대 두 해에 걸친다고 봅니다.
+        """
+        start_year_units = self.business_days - self.year_split_days
+        days = {}
+        if start_year_units:
+            days[self.start_at.year] = start_year_units / BUSINESS_DAY_UNITS
+        if self.year_split_days:
+            days[self.end_at.year] = self.year_split_days / BUSINESS_DAY_UNITS
+        return days
+
     def __str__(self):
         return f"{self.id}"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "cat", "start_at", "end_at"],
+                name="vacation_user_cat_period_idx",
+            ),
+            # 사용자별 승인 상태/종류 조회 (휴가 현황 계산)
+            models.Index(
+                fields=["user", "approval", "cat"], name="vacation_user_approval_idx"
+            ),
+            # 승인 대기 중인 휴가 목록 (AdminIndexView)
+            models.Index(fields=["approval", "cat"], name="vacation_approval_cat_idx"),
+            # 사용자별 휴가 목록 정렬/페이지 나누기 (VacationListView)
+            models.Index(
+                fields=["user", "start_at", "id"], name="vacation_user_start_idx"
+            ),
+            # 전체 휴가 목록 정렬/페이지 나누기 (MemberListView)
+            models.Index(fields=["start_at", "id"], name="vacation_start_id_idx"),
+        ]
+
+
+class Balance(models.Model):
+    user = models.ForeignKey(
+        get_user_model(), on_delete=models.CASCADE, verbose_name="사용자"
+    )
+    year = models.PositiveSmallIntegerField(verbose_name="년도")
+    used_days = models.FloatField(default=0.0, verbose_name="사용 휴가")
+    on_hold_days = models.FloatField(default=0.0, verbose_name="승인 예정 휴가")
+    sick_days = models.FloatField(default=0.0, verbose_name="병가")
+    comp_days = models.FloatField(default=0.0, verbose_name="대체 휴가")
+
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    def __str__(self):
+        return f"{self.user_id} ({self.year})"
+
+    class Meta:
+        verbose_name = "휴가 원장"
+        verbose_name_plural = "휴가 원장"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "year"], name="unique_user_year")
+        ]
+
+
+class BalanceHistory(models.Model):
+    """
+    년도를 마감할 때(rollover) 사용자의 최종 휴가 현황과 다음 년도에 준 휴가를 남겨 둡니다.
+    """
+
+    user = models.ForeignKey(
+        get_user_model(), on_delete=models.CASCADE, verbose_name="사용자"
+    )
+    year = models.PositiveSmallIntegerField(verbose_name="년도")
+    total_days = models.FloatField(default=0.0, verbose_name="총 휴가")
+    used_days = models.FloatField(default=0.0, verbose_name="사용 휴가")
+    on_hold_days = models.FloatField(default=0.0, verbose_name="승인 예정 휴가")
+    sick_days = models.FloatField(default=0.0, verbose_name="병가")
+    comp_days = models.FloatField(default=0.0, verbose_name="대체 휴가")
+    remaining_days = models.FloatField(default=0.0, verbose_name="잔여 휴가")
+    next_total_days = models.FloatField(default=0.0, verbose_name="다음 년도 총 휴가")
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+
+    def __str__(self):
+        return f"{self.user_id} ({self.year})"
+
+    class Meta:
+        verbose_name = "휴가 마감 기록"
+        verbose_name_plural = "휴가 마감 기록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "year"], name="unique_history_user_year"
+            )
+        ]
+
+
+class Holiday(models.Model):
+    date = models.DateField(unique=True, verbose_name="날짜")
+    name = models.CharField(max_length=50, blank=True, verbose_name="이름")
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    def __str__(self):
+        return f"{self.date} {self.name}"
+
+    class Meta:
+        verbose_name = "공휴일"
+        verbose_name_plural = "공휴일"
+        ordering = ["date"]
@@ -0,0 +1,170 @@
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Sequence
+
+import django
+from django.apps import apps
+from django.db import connections, transaction
+
+from core.models import Profile
+from vacation.constants import VacationApproval
+from vacation.models import BalanceHistory
+from vacation.utils import PROFILE_BALANCE_FIELDS, get_vacation_days_by_user
+
+PROFILE_ROLLOVER_FIELDS = ["total_days", *PROFILE_BALANCE_FIELDS]
+
+
+class RolloverResult(NamedTuple):
+    """
+    사용자 한 명의 마감 년도 최종 휴가 현황과 다음 년도에 줄 총 휴가입니다.
+    """
+
+    user_id: int
+    total_days: float
+    used_days: float
+    on_hold_days: float
+    sick_days: float
+    comp_days: float
+    remaining_days: float
+    next_total_days: float
+
+
+def get_shards(user_ids: Sequence[int], shard_size: int) -> Iterator[List[int]]:
+    for i in range(0, len(user_ids), shard_size):
+        yield list(user_ids[i : i + shard_size])
+
+
+def rollover_users(
+    year: int,
+    user_ids: List[int],
+    total_days: float = None,
+    max_carry_over_days: float = 0.0,
+    dry_run: bool = False,
+    batch_size: int = 500,
+) -> List[RolloverResult]:
+    """
+    사용자들의 year년 휴가를 마감합니다. 최종 현황을 BalanceHistory에 남기고,
+    Profile에 다음 년도 총 휴가(total_days 또는 기존 총 휴가 + 최대 max_carry_over_days일의 이월)와
+    다음 년도에 이미 쓴 휴가를 저장합니다. 다시 실행해도 처음 마감한 총 휴가를 기준으로 같은 결과를 냅니다.
+    """
+    closing_totals = dict(
+        BalanceHistory.objects.filter(year=year, user_id__in=user_ids).values_list(
+            "user_id", "total_days"
+        )
+    )
+    profiles = list(
+        Profile.objects.filter(user_id__in=user_ids).only(
+            "user_id", *PROFILE_ROLLOVER_FIELDS
+        )
+    )
+    approved_days = get_vacation_days_by_user(year=year, user_ids=user_ids)
+    on_hold_days = get_vacation_days_by_user(
+        year=year, user_ids=user_ids, approval=str(VacationApproval.ON_HOLD.value)
+    )
+    next_year_days = get_vacation_days_by_user(year=year + 1, user_ids=user_ids)
+
+    results = []
+    # (총 휴가, 사용 휴가, 병가, 대체 휴가) -> 값이 그렇게 바뀌는 사용자 id 목록
+    user_ids_by_values = defaultdict(list)
+    for profile in profiles:
+        closing_total = closing_totals.get(profile.user_id, profile.total_days)
+        used_days, sick_days, comp_days = approved_days.get(
+            profile.user_id, (0.0, 0.0, 0.0)
+        )
+        remaining_days = closing_total - used_days
+        next_total_days = closing_total if total_days is None else total_days
+        next_total_days += min(max(remaining_days, 0.0), max_carry_over_days)
+        results.append(
+            RolloverResult(
+                user_id=profile.user_id,
+                total_days=closing_total,
+                used_days=used_days,
+                on_hold_days=on_hold_days.get(profile.user_id, (0.0,))[0],
+                sick_days=sick_days,
+                comp_days=comp_days,
+                remaining_days=remaining_days,
+                next_total_days=next_total_days,
+            )
+        )
+
+        values = (
+            next_total_days,
+            *next_year_days.get(profile.user_id, (0.0, 0.0, 0.0)),
+        )
+        if (
+            profile.total_days,
+            profile.used_days,
+            profile.sick_days,
+            profile.comp_days,
+        ) != values:
+            user_ids_by_values[values].append(profile.user_id)
+
+    if dry_run:
+        return results
+
+    # 년도별 원장(Balance)은 휴가가 바뀔 때마다 갱신되므로, 마감 기록만 남기고 Profile을 다음 년도 기준으로 바꿉니다.
+    with transaction.atomic():
+        BalanceHistory.objects.filter(year=year, user_id__in=user_ids).delete()
+        BalanceHistory.objects.bulk_create(
+            [BalanceHistory(year=year, **result._asdict()) for result in results],
+            batch_size=batch_size,
+        )
+        # 대부분 같은 값으로 바뀌므로 bulk_update(CASE WHEN) 대신 값이 같은 사용자끼리 한 번에 UPDATE 합니다.
+        for values, changed_user_ids in user_ids_by_values.items():
+            for shard in get_shards(changed_user_ids, batch_size):
+                Profile.objects.filter(user_id__in=shard).update(
+                    **dict(zip(PROFILE_ROLLOVER_FIELDS, values))
+                )
+    return results
+
+
+def init_worker() -> None:
+    """
+    spawn으로 시작한 작업 프로세스에서는 Django를 다시 설정합니다. DB 연결은 프로세스마다 처음 쿼리할 때 새로 엽니다.
+    """
+    if not apps.ready:
+        django.setup()
+
+
+def rollover(
+    year: int,
+    user_ids: Iterable[int] = None,
+    workers: int = 1,
+    shard_size: int = 500,
+    progress: Callable[[int, int], None] = None,
+    **kwargs,
+) -> List[RolloverResult]:
+    """
+    사용자를 shard_size명씩 나눠 마감합니다. workers가 2 이상이면 각자 DB 연결을 가진 프로세스들이 나눠 처리합니다.
+    progress(처리한 사용자 수, 전체 사용자 수)는 shard 하나가 끝날 때마다 부릅니다.
+    """
+    if user_ids is None:
+        user_ids = Profile.objects.order_by("user_id").values_list("user_id", flat=True)
+    user_ids = list(user_ids)
+    shards = list(get_shards(user_ids, shard_size))
+
+    results = []
+    num_done = 0
+
+    def done(shard: List[int], shard_results: List[RolloverResult]):
+        nonlocal num_done
+        num_done += len(shard)
+        results.extend(shard_results)
+        if progress is not None:
+            progress(num_done, len(user_ids))
+
+    if workers <= 1:
+        for shard in shards:
+            done(shard, rollover_users(year, shard, **kwargs))
+        return results
+
+    # fork된 프로세스가 부모의 DB 연결을 함께 쓰지 않도록 미리 닫습니다.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        futures = {
+            executor.submit(rollover_users, year, shard, **kwargs): shard
+            for shard in shards
+        }
+        for future in as_completed(futures):
+            done(futures[future], future.result())
+    return sorted(results)
@@ -0,0 +1,89 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from vacation.holidays import bump_holiday_version
+from vacation.ledger import (
+    apply_balance_delta,
+    get_contribution_delta,
+    get_vacation_contribution,
+    refresh_business_days,
+)
+from vacation.models import Holiday, Vacation
+from vacation.utils import set_business_days
+
+
+@receiver(pre_save, sender=Vacation)
+def fill_business_days(sender, instance, raw=False, **kwargs):
+    """
+    저장할 때마다 휴가의 사용 일수를 계산해 둡니다.
+    """
+    if not raw:
+        set_business_days(instance)
+
+
+@receiver(pre_save, sender=Vacation)
+def remember_previous_vacation(sender, instance, raw=False, **kwargs):
+    """
+    저장 전 DB에 있던 휴가의 사용자와 원장 기여분을 기억해 둡니다.
+    """
+    previous = Vacation.objects.filter(pk=instance.pk).first() if instance.pk else None
+    instance._previous_balance = (
+        (previous.user_id, get_vacation_contribution(previous)) if previous else None
+    )
+
+
+@receiver(post_save, sender=Vacation)
+def update_balance_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    contribution = get_vacation_contribution(instance)
+    previous = getattr(instance, "_previous_balance", None)
+    if previous is None:
+        apply_balance_delta(user_id=instance.user_id, delta=contribution)
+        return
+
+    previous_user_id, previous_contribution = previous
+    if previous_user_id != instance.user_id:
+        apply_balance_delta(
+            user_id=previous_user_id,
+            delta=get_contribution_delta(new={}, old=previous_contribution),
+        )
+        previous_contribution = {}
+
+    apply_balance_delta(
+        user_id=instance.user_id,
+        delta=get_contribution_delta(new=contribution, old=previous_contribution),
+    )
+    instance._previous_balance = (instance.user_id, contribution)
+
+
+@receiver(post_delete, sender=Vacation)
+def update_balance_on_delete(sender, instance, **kwargs):
+    apply_balance_delta(
+        user_id=instance.user_id,
+        delta=get_contribution_delta(new={}, old=get_vacation_contribution(instance)),
+    )
+
+
+@receiver(pre_save, sender=Holiday)
+def remember_previous_holiday(sender, instance, raw=False, **kwargs):
+    """
+    공휴일 날짜가 바뀌는 경우 이전 날짜에 걸친 휴가도 다시 계산할 수 있도록 기억해 둡니다.
+    """
+    instance._previous_date = (
+        Holiday.objects.filter(pk=instance.pk).values_list("date", flat=True).first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=Holiday)
+@receiver(post_delete, sender=Holiday)
+def invalidate_holiday_calendar(sender, instance, raw=False, **kwargs):
+    bump_holiday_version()
+    if raw:
+        return
+
+    for day in {instance.date, getattr(instance, "_previous_date", None)} - {None}:
+        refresh_business_days(start=day, end=day)
@@ -5,8 +5,14 @@ from django.test import Client, TestCase
 from django.urls import reverse, reverse_lazy
 
 from core.models import Profile
+from core.templatetags.fragment_cache import (
+    CSRF_TOKEN_PLACEHOLDER,
+    get_fragment_cache_stats,
+    reset_fragment_cache_stats,
+)
 from vacation.constants import TestCaseCredentials, VacationApproval, VacationTypes
 from vacation.forms import VacationForm, VacationYearSelectForm
+from vacation.ledger import BalanceSummary, invalidate_balance_cache
 from vacation.models import Vacation
 from vacation.tests.utils import (
     create_half_day_off,
@@ -32,6 +38,10 @@ class BaseTestCase(TestCase):
     def setUp(cls) -> None:
         cls.client = Client()
 
+    def tearDown(self) -> None:
+        # 테스트가 끝나면 DB가 롤백되므로 캐시된 휴가 현황도 버립니다.
+        invalidate_balance_cache()
+
 
 class TestVacationForm(TestCase):
     def test_is_valid(self):
@@ -156,6 +166,56 @@ class TestVacationListView(BaseTestCase):
         )
         self.assertEqual(set(expected_qs), set(response.context["vacation_list"]))
 
+    def test_balance_summary(self):
+        create_vacation_objects(user=self.user)
+        create_half_day_off(user=self.user)
+        self.client.login(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        url = reverse_lazy("vacation:list", kwargs={"user_id": self.user.id})
+        response = self.client.get(url, {"year": 2021})
+        self.assertEqual(
+            BalanceSummary(
+                total_days=15.0,
+                used_days=2.25,
+                on_hold_days=0.0,
+                available_days=12.75,
+                sick_days=0.0,
+                comp_days=0.0,
+            ),
+            response.context["balance"],
+        )
+
+    def test_rows_cached_until_vacation_changes(self):
+        create_vacation_objects(user=self.user)
+        vacation = create_half_day_off(user=self.user)
+        vacation.approval = str(VacationApproval.ON_HOLD.value)
+        vacation.save()
+        self.client.login(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        url = reverse_lazy("vacation:list", kwargs={"user_id": self.user.id})
+
+        reset_fragment_cache_stats()
+        first = self.client.get(url, {"year": 2021})
+        # 휴가 4행 + 휴가 현황 표
+        self.assertEqual({"misses": 5}, get_fragment_cache_stats())
+
+        reset_fragment_cache_stats()
+        second = self.client.get(url, {"year": 2021})
+        self.assertEqual({"hits": 5}, get_fragment_cache_stats())
+        self.assertEqual(first.context["balance"], second.context["balance"])
+        self.assertNotIn(CSRF_TOKEN_PLACEHOLDER, second.content.decode())
+        self.assertContains(second, "csrfmiddlewaretoken")
+
+        vacation.approval = str(VacationApproval.APPROVED.value)
+        vacation.save()
+        reset_fragment_cache_stats()
+        response = self.client.get(url, {"year": 2021})
+        self.assertEqual({"hits": 3, "misses": 2}, get_fragment_cache_stats())
+        self.assertEqual(2.75, response.context["balance"].used_days)
+        self.assertNotContains(response, "csrfmiddlewaretoken")
+
 
 class TestVacationCreateView(BaseTestCase):
     def test_status_code(self):
@@ -1,10 +1,20 @@
+import csv
 import datetime
+import io
+from unittest import skipUnless
 
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse, reverse_lazy
 
-from core.models import Profile
+from core.models import Attendance, Profile
+from core.templatetags.fragment_cache import (
+    get_fragment_cache_stats,
+    reset_fragment_cache_stats,
+)
 from vacation.constants import TestCaseCredentials, VacationApproval, VacationTypes
+from vacation.exports import openpyxl
 from vacation.forms import SickForm
 from vacation.models import Vacation
 from vacation.tests.test_integration import BaseTestCase
@@ -135,6 +145,155 @@ class TestMemberListView(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context["vacation_list"]), 1)
 
+    def test_keyset_pagination(self):
+        for day in (1, 1, 1, 2, 3):
+            Vacation.objects.create(
+                cat=str(VacationTypes.HALF_DAY_OFF.value),
+                user=self.user,
+                start_at=datetime.datetime(2021, 11, day, 9),
+                end_at=datetime.datetime(2021, 11, day, 13),
+                approval=str(VacationApproval.ON_HOLD.value),
+            )
+        expected_ids = list(
+            Vacation.objects.order_by("-start_at", "-id").values_list("id", flat=True)
+        )
+        self.client.login(
+            username=TestCaseCredentials.SUPERUSER_ID,
+            password=TestCaseCredentials.SUPERUSER_PW,
+        )
+        url = reverse_lazy("vacation:member_list")
+
+        pages = []
+        response = self.client.get(url, {"page_size": 2})
+        while True:
+            page = response.context["page_obj"]
+            pages.append([vacation.id for vacation in page])
+            if not page.has_next():
+                break
+            response = self.client.get(f"{url}{page.next_url}")
+        self.assertEqual(
+            [expected_ids[0:2], expected_ids[2:4], expected_ids[4:]], pages
+        )
+
+        response = self.client.get(f"{url}{page.previous_url}")
+        self.assertEqual(
+            expected_ids[2:4],
+            [vacation.id for vacation in response.context["page_obj"]],
+        )
+        self.assertTrue(response.context["page_obj"].has_next())
+
+        response = self.client.get(url, {"after": "invalid"})
+        self.assertEqual(404, response.status_code)
+
+    def test_rows_cached_until_member_name_changes(self):
+        create_half_day_off(user=self.user)
+        create_two_day_offs(user=self.user)
+        self.client.login(
+            username=TestCaseCredentials.SUPERUSER_ID,
+            password=TestCaseCredentials.SUPERUSER_PW,
+        )
+        url = reverse_lazy("vacation:member_list")
+        self.client.get(url)
+
+        reset_fragment_cache_stats()
+        self.client.get(url)
+        self.assertEqual({"hits": 2}, get_fragment_cache_stats())
+
+        self.user.first_name = "홍길동"
+        self.user.save()
+        reset_fragment_cache_stats()
+        response = self.client.get(url)
+        self.assertEqual({"misses": 2}, get_fragment_cache_stats())
+        self.assertContains(response, "홍길동", count=2)
+
+
+class TestExportView(BaseTestCase):
+    def login(self):
+        self.client.login(
+            username=TestCaseCredentials.SUPERUSER_ID,
+            password=TestCaseCredentials.SUPERUSER_PW,
+        )
+
+    def get_csv_rows(self, response):
+        content = b"".join(response.streaming_content).decode("utf-8-sig")
+        return list(csv.reader(io.StringIO(content)))
+
+    def test_status_code(self):
+        url = reverse("vacation:export", args=["vacation"])
+        self.client.login(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        self.assertEqual(403, self.client.get(url).status_code)
+
+        self.login()
+        self.assertEqual(
+            404, self.client.get(reverse("vacation:export", args=["x"])).status_code
+        )
+        self.assertEqual(400, self.client.get(url, {"start": "2021-13-01"}).status_code)
+        self.assertEqual(400, self.client.get(url, {"format": "pdf"}).status_code)
+
+    def test_export_vacations(self):
+        create_two_day_offs(user=self.user)
+        create_half_day_off(user=self.user)
+        self.login()
+
+        response = self.client.get(
+            reverse("vacation:export", args=["vacation"]),
+            {"start": "2021-12-31", "end": "2022-01-31"},
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.streaming)
+        self.assertIn(
+            "vacation_2021-12-31_2022-01-31.csv", response["Content-Disposition"]
+        )
+
+        header, *rows = self.get_csv_rows(response)
+        self.assertEqual("사용 일수", header[7])
+        self.assertEqual(1, len(rows))
+        self.assertEqual(
+            ["연차/휴가", "2021-12-30", "2021-12-31", "승인", "2.0"],
+            rows[0][3:8],
+        )
+
+    def test_export_attendances_in_chunks(self):
+        for day in range(1, 6):
+            Attendance.objects.create(
+                user=self.user,
+                date=datetime.date(2021, 7, day),
+                start_at=datetime.time(9),
+                end_at=datetime.time(18, 30) if day % 2 else None,
+                created_by=self.user,
+                ip_address="127.0.0.1",
+            )
+        self.login()
+
+        with self.settings(EXPORT_CHUNK_SIZE=2):
+            response = self.client.get(
+                reverse("vacation:export", args=["attendance"]),
+                {"start": "2021-07-02", "end": "2021-07-31"},
+            )
+            header, *rows = self.get_csv_rows(response)
+        self.assertEqual(
+            ["2021-07-02", "2021-07-03", "2021-07-04", "2021-07-05"],
+            [row[3] for row in rows],
+        )
+        self.assertEqual(["0.0", "9.5", "0.0", "9.5"], [row[6] for row in rows])
+
+    @skipUnless(openpyxl, "openpyxl이 설치되어 있지 않습니다.")
+    def test_export_xlsx(self):
+        create_two_day_offs(user=self.user)
+        self.login()
+
+        response = self.client.get(
+            reverse("vacation:export", args=["vacation"]), {"format": "xlsx"}
+        )
+        workbook = openpyxl.load_workbook(
+            io.BytesIO(b"".join(response.streaming_content)), read_only=True
+        )
+        rows = list(workbook.active.values)
+        self.assertEqual(2, len(rows))
+        self.assertEqual(2.0, rows[1][7])
+
 
 class TestSickCreateView(BaseTestCase):
     def test_status_code(self):
@@ -225,6 +384,38 @@ class TestUserVacationListView(BaseTestCase):
             user_profile = Profile.objects.get(user=user)
             self.assertEqual(user_profile.total_days, 15)
 
+    def test_annotated_vacation_days(self):
+        create_two_day_offs(user=self.user)
+        create_half_day_off(user=self.user)
+        Vacation.objects.create(
+            cat=str(VacationTypes.HALF_DAY_OFF.value),
+            user=self.user,
+            start_at=datetime.datetime(2021, 11, 1, 9),
+            end_at=datetime.datetime(2021, 11, 1, 13),
+            approval=str(VacationApproval.ON_HOLD.value),
+        )
+        self.client.login(
+            username=TestCaseCredentials.SUPERUSER_ID,
+            password=TestCaseCredentials.SUPERUSER_PW,
+        )
+        url = reverse_lazy("vacation:users_vacation")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path=url)
+        user = next(
+            user for user in response.context["user_list"] if user.id == self.user.id
+        )
+        self.assertEqual(
+            (15, 2, 0.5, 12.5),
+            (user.total_days, user.used_days, user.on_hold_days, user.available_days),
+        )
+
+        for i in range(5):
+            new_user = User.objects.create_user(username=f"user{i}", password="test")
+            Profile.objects.create(user=new_user)
+            create_two_day_offs(user=new_user)
+        with self.assertNumQueries(len(queries)):
+            self.client.get(path=url)
+
 
 class TestUserVacationDayUpdateView(BaseTestCase):
     def test_status_code(self):
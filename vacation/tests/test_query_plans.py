@@ -0,0 +1,135 @@
+import datetime
+import unittest
+from typing import List
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from core.models import Attendance
+from vacation.constants import (
+    SPECIAL_VACATION_TYPES,
+    TestCaseCredentials,
+    VacationApproval,
+    VacationTypes,
+)
+from vacation.models import Vacation
+from vacation.utils import get_overlapping_vacations
+
+
+def get_query_plan(queryset: QuerySet) -> List[str]:
+    """
+    SQLite의 EXPLAIN QUERY PLAN 결과(detail 컬럼)를 리턴합니다.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "SQLite의 실행 계획을 검사합니다.")
+class TestQueryPlans(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+
+    def assertUsesIndex(self, queryset: QuerySet, table: str, index: str = None):
+        plan = get_query_plan(queryset)
+        details = [detail for detail in plan if table in detail]
+        self.assertTrue(details, plan)
+        for detail in details:
+            # 인덱스 없이 테이블 전체를 읽으면 "SCAN <table>"만 남습니다.
+            self.assertIn("USING", detail, f"Full table scan: {plan}")
+            if index is not None:
+                self.assertIn(index, detail, plan)
+        self.assertFalse(
+            [detail for detail in plan if "TEMP B-TREE" in detail],
+            f"Sorted without an index: {plan}",
+        )
+
+    def test_user_vacations_by_approval_and_cat(self):
+        self.assertUsesIndex(
+            Vacation.objects.filter(
+                user=self.user,
+                approval=str(VacationApproval.APPROVED.value),
+                cat=str(VacationTypes.SICK_DAY.value),
+            ),
+            table="vacation_vacation",
+            index="vacation_user_approval_idx",
+        )
+        self.assertUsesIndex(
+            Vacation.objects.filter(
+                user=self.user, approval=str(VacationApproval.APPROVED.value)
+            ).exclude(cat__in=SPECIAL_VACATION_TYPES),
+            table="vacation_vacation",
+        )
+
+    def test_admin_pending_vacations(self):
+        self.assertUsesIndex(
+            Vacation.objects.select_related("user").filter(
+                approval=str(VacationApproval.ON_HOLD.value),
+                cat=str(VacationTypes.DAY_OFF.value),
+            ),
+            table="vacation_vacation",
+            index="vacation_approval_cat_idx",
+        )
+
+    def test_user_vacation_list(self):
+        self.assertUsesIndex(
+            Vacation.objects.filter(user=self.user).order_by("-start_at", "-id")[:51],
+            table="vacation_vacation",
+            index="vacation_user_start_idx",
+        )
+        self.assertUsesIndex(
+            Vacation.objects.filter(
+                user=self.user,
+                start_at__gte=datetime.date(2021, 1, 1),
+                start_at__lte=datetime.date(2021, 12, 31),
+            ).order_by("-start_at", "-id")[:51],
+            table="vacation_vacation",
+            index="vacation_user_start_idx",
+        )
+
+    def test_member_vacation_list(self):
+        self.assertUsesIndex(
+            Vacation.objects.order_by("-start_at", "-id")[:51],
+            table="vacation_vacation",
+            index="vacation_start_id_idx",
+        )
+        self.assertUsesIndex(
+            Vacation.objects.filter(
+                start_at__lt=datetime.datetime(2021, 7, 1)
+            ).order_by("-start_at", "-id")[:51],
+            table="vacation_vacation",
+            index="vacation_start_id_idx",
+        )
+
+    def test_vacation_overlap(self):
+        for vacation_type in VacationTypes:
+            self.assertUsesIndex(
+                get_overlapping_vacations(
+                    user=self.user,
+                    start=datetime.datetime(2021, 11, 1, 9),
+                    end=datetime.datetime(2021, 11, 1, 13),
+                    vacation_id=1,
+                    vacation_type=vacation_type.value,
+                ),
+                table="vacation_vacation",
+                index="vacation_user_cat_period_idx",
+            )
+
+    def test_latest_attendance(self):
+        self.assertUsesIndex(
+            Attendance.objects.filter(user=self.user).order_by("date").reverse()[:1],
+            table="core_attendance",
+            index="attendance_user_date_idx",
+        )
+
+    def test_attendance_list(self):
+        self.assertUsesIndex(
+            Attendance.objects.filter(user=self.user).order_by("-id")[:51],
+            table="core_attendance",
+        )
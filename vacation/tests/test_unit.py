@@ -1,12 +1,65 @@
 import datetime
+import os
+import tempfile
+import threading
+import time
+from io import StringIO
+from unittest import mock
 
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import CacheHandler, cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
-from core.models import Profile
-from vacation.constants import NUM_PRENOTICE_DAYS, TestCaseCredentials, VacationTypes
-from vacation.tests.utils import create_two_day_offs, create_vacation_objects
+from core.models import (
+    Attendance,
+    AttendanceDaily,
+    AttendanceMonthly,
+    LatestAttendance,
+    Profile,
+)
+from core.templatetags.templatehelpers import get_duration, get_vacation_duration
+from vacation.business_days import (
+    count_business_days,
+    count_business_days_between,
+    count_business_days_in_year,
+)
+from vacation.constants import (
+    NUM_PRENOTICE_DAYS,
+    TestCaseCredentials,
+    VacationApproval,
+    VacationTypes,
+)
+from vacation.benchmarks.cases import get_cases
+from vacation.benchmarks.datasets import create_dataset
+from vacation.benchmarks.runner import compare_results, run_cases
+from vacation.holidays import (
+    HOLIDAY_VERSION_KEY,
+    bump_holiday_version,
+    get_holiday_calendar,
+)
+from vacation.ledger import (
+    get_balance,
+    get_balance_cache_stats,
+    get_balance_summary,
+    get_cached_balance,
+    invalidate_balance_cache,
+    refresh_business_days,
+    reset_balance_cache_stats,
+)
+from vacation.models import Balance, BalanceHistory, Holiday, Vacation
+from vacation.tests.utils import (
+    create_half_day_off,
+    create_one_fourth_day_off,
+    create_two_day_offs,
+    create_vacation_objects,
+)
 from vacation.utils import (
+    VacationBalance,
+    calculate_vacation_days_by_type,
+    compute_vacation_balance,
     convert_date_to_datetime,
     convert_start_and_end_at,
     convert_str_to_datetime,
@@ -14,11 +67,74 @@ from vacation.utils import (
     get_end_at,
     get_start_and_end_at,
     get_total_used_days,
+    get_vacation_days_by_user,
+    get_valid_vacation_dates,
+    has_enough_vacation_days_left,
     is_category_day_off,
     is_vacation_prenotified,
+    save_vacation_balance,
 )
 
 
+class TestBusinessDays(TestCase):
+    def test_count_business_days(self):
+        starts = [datetime.datetime(2021, 9, 17), datetime.datetime(2021, 12, 30)]
+        ends = [datetime.datetime(2021, 9, 24), datetime.datetime(2022, 1, 3, 11, 0)]
+        # 9/20~9/22 추석 연휴와 주말 제외
+        self.assertEqual([3, 3], count_business_days(starts=starts, ends=ends).tolist())
+
+    def test_count_business_days_between(self):
+        self.assertEqual(
+            0,
+            count_business_days_between(
+                start=datetime.date(2021, 10, 2), end=datetime.date(2021, 10, 3)
+            ),
+        )
+        self.assertEqual(
+            0,
+            count_business_days_between(
+                start=datetime.date(2021, 7, 5), end=datetime.date(2021, 7, 2)
+            ),
+        )
+
+    def test_count_business_days_in_year(self):
+        starts = [
+            datetime.datetime(2020, 12, 28),
+            datetime.datetime(2021, 1, 4),
+            datetime.datetime(2021, 12, 30),
+        ]
+        ends = [
+            datetime.datetime(2021, 1, 5),
+            datetime.datetime(2021, 1, 6),
+            datetime.datetime(2022, 1, 3),
+        ]
+        # 2021/1/1~1/6 (겹치는 1/4, 1/5는 한 번만) + 2021/12/30~12/31
+        self.assertEqual(
+            6, count_business_days_in_year(starts=starts, ends=ends, year=2021)
+        )
+        self.assertEqual(0, count_business_days_in_year(starts=[], ends=[], year=2021))
+
+    def test_get_duration(self):
+        self.assertEqual(
+            "3 일",
+            get_duration(
+                datetime.datetime(2021, 9, 17), datetime.datetime(2021, 9, 24)
+            ),
+        )
+        self.assertEqual(
+            "1 일",
+            get_duration(
+                datetime.datetime(2021, 9, 17), datetime.datetime(2021, 9, 17)
+            ),
+        )
+        self.assertEqual(
+            "4 시간",
+            get_duration(
+                datetime.datetime(2021, 9, 17, 9), datetime.datetime(2021, 9, 17, 13)
+            ),
+        )
+
+
 class TestUtils(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -32,6 +148,120 @@ class TestUtils(TestCase):
         self.user.save()
         self.assertEqual(2.25, get_total_used_days(self.user_profile))
 
+    def test_compute_vacation_balance(self):
+        create_vacation_objects(user=self.user)
+        Vacation.objects.create(
+            cat=str(VacationTypes.HALF_DAY_OFF.value),
+            user=self.user,
+            start_at=datetime.datetime(2021, 9, 1, 9),
+            end_at=datetime.datetime(2021, 9, 1, 13),
+            approval=str(VacationApproval.ON_HOLD.value),
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                VacationBalance(used_days=2.25, on_hold_days=0.5),
+                compute_vacation_balance(user_id=self.user.id, year=2021),
+            )
+
+    def test_save_vacation_balance(self):
+        profile = Profile.objects.get(user=self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [], save_vacation_balance(profile, VacationBalance(used_days=0.0))
+            )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                ["used_days", "comp_days"],
+                save_vacation_balance(
+                    profile, VacationBalance(used_days=1.0, comp_days=2.0)
+                ),
+            )
+        profile.refresh_from_db()
+        self.assertEqual(
+            (1.0, 0.0, 2.0), (profile.used_days, profile.sick_days, profile.comp_days)
+        )
+
+    def test_has_enough_vacation_days_left_does_not_write(self):
+        create_vacation_objects(user=self.user)
+        Profile.objects.filter(user=self.user).update(total_days=3)
+        start_at = datetime.datetime(2021, 11, 1, 9)
+        end_at = datetime.datetime(2021, 11, 1, 13)
+        with self.assertNumQueries(2):
+            self.assertFalse(
+                has_enough_vacation_days_left(
+                    user=self.user,
+                    vacation_type=VacationTypes.HALF_DAY_OFF.value,
+                    start_at=start_at,
+                    end_at=end_at,
+                )
+            )
+        self.assertTrue(
+            has_enough_vacation_days_left(
+                user=self.user,
+                vacation_type=VacationTypes.DAY_OFF.value,
+                start_at=start_at,
+                end_at=start_at + datetime.timedelta(days=2),
+            )
+        )
+
+    def test_get_valid_vacation_dates(self):
+        create_two_day_offs(user=self.user)
+        self.assertEqual(
+            [datetime.date(2021, 12, 30), datetime.date(2021, 12, 31)],
+            get_valid_vacation_dates(
+                vacation_list=Vacation.objects.filter(user=self.user), year=2021
+            ),
+        )
+        self.assertEqual(
+            [],
+            get_valid_vacation_dates(
+                vacation_list=Vacation.objects.filter(user=self.user), year=2022
+            ),
+        )
+
+    def test_calculate_vacation_days_by_type(self):
+        create_vacation_objects(user=self.user)
+        create_half_day_off(user=self.user)
+        vacation_list = Vacation.objects.filter(
+            user=self.user, approval=str(VacationApproval.APPROVED.value)
+        ).order_by("-start_at")
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                2.25,
+                calculate_vacation_days_by_type(vacation_list=vacation_list, year=2021),
+            )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                0,
+                calculate_vacation_days_by_type(vacation_list=vacation_list, year=2020),
+            )
+
+    def test_get_vacation_days_by_user(self):
+        create_vacation_objects(user=self.user)
+        Vacation.objects.create(
+            cat=str(VacationTypes.SICK_DAY.value),
+            user=self.user,
+            start_at=datetime.datetime(2021, 9, 17),
+            end_at=datetime.datetime(2021, 9, 24),
+            approval=str(VacationApproval.APPROVED.value),
+        )
+        self.assertEqual(
+            {self.user.id: (2.25, 3, 0)}, get_vacation_days_by_user(year=2021)
+        )
+        self.assertEqual({}, get_vacation_days_by_user(year=2022))
+
+    def test_update_vacation_days_command(self):
+        other_user = User.objects.create_user(username="other", password="other")
+        other_profile = Profile.objects.create(user=other_user, used_days=3.0)
+        create_vacation_objects(user=self.user)
+
+        call_command("update_vacation_days", "--year", "2021", stdout=StringIO())
+
+        self.user_profile.refresh_from_db()
+        other_profile.refresh_from_db()
+        self.assertEqual(2.25, self.user_profile.used_days)
+        self.assertEqual(0.0, other_profile.used_days)
+
     def test_convert_date_to_datetime(self):
         original_date = datetime.date(2021, 7, 21)
         self.assertEqual(
@@ -49,6 +279,58 @@ class TestUtils(TestCase):
         end = datetime.datetime(2021, 12, 31, 11, 00)
         self.assertTrue(does_vacation_overlap(user=self.user, start=start, end=end))
 
+    def test_does_vacation_overlap_with_partial_day_offs(self):
+        Vacation.objects.create(
+            cat=str(VacationTypes.DAY_OFF.value),
+            user=self.user,
+            start_at=datetime.datetime(2021, 12, 30),
+            end_at=datetime.datetime(2021, 12, 31),
+            approval=str(VacationApproval.APPROVED.value),
+        )
+        half_day_off = create_half_day_off(user=self.user)
+
+        # 연차 마지막 날의 반차
+        start = datetime.datetime(2021, 12, 31, 14, 00)
+        end = datetime.datetime(2021, 12, 31, 18, 00)
+        self.assertTrue(
+            does_vacation_overlap(
+                user=self.user,
+                start=start,
+                end=end,
+                vacation_type=VacationTypes.HALF_DAY_OFF.value,
+            )
+        )
+
+        # 거부된 반차와 같은 날의 연차
+        day = datetime.datetime(2021, 7, 30)
+        self.assertFalse(
+            does_vacation_overlap(
+                user=self.user,
+                start=day,
+                end=day,
+                vacation_type=VacationTypes.DAY_OFF.value,
+            )
+        )
+        half_day_off.approval = str(VacationApproval.APPROVED.value)
+        half_day_off.save()
+        self.assertTrue(
+            does_vacation_overlap(
+                user=self.user,
+                start=day,
+                end=day,
+                vacation_type=VacationTypes.DAY_OFF.value,
+            )
+        )
+        self.assertFalse(
+            does_vacation_overlap(
+                user=self.user,
+                start=day,
+                end=day,
+                vacation_id=half_day_off.id,
+                vacation_type=VacationTypes.DAY_OFF.value,
+            )
+        )
+
     def test_is_category_day_off(self):
         self.assertTrue(is_category_day_off(vacation_type=VacationTypes.DAY_OFF.value))
         self.assertTrue(is_category_day_off(vacation_type=VacationTypes.SICK_DAY.value))
@@ -158,3 +440,548 @@ class TestUtils(TestCase):
                 vacation_type=VacationTypes.ONE_FOURTH_DAY_OFF.value,
             ),
         )
+
+
+class TestLedger(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        cls.user_profile = Profile.objects.create(user=cls.user)
+
+    def get_balance_values(self, year: int = 2021):
+        balance = Balance.objects.get(user=self.user, year=year)
+        return (
+            balance.used_days,
+            balance.on_hold_days,
+            balance.sick_days,
+            balance.comp_days,
+        )
+
+    def test_vacation_save_and_delete(self):
+        vacation = create_two_day_offs(user=self.user)
+        create_one_fourth_day_off(user=self.user)
+        self.assertEqual((2.25, 0, 0, 0), self.get_balance_values())
+
+        vacation.approval = str(VacationApproval.ON_HOLD.value)
+        vacation.save()
+        self.assertEqual((0.25, 2, 0, 0), self.get_balance_values())
+
+        vacation.cat = str(VacationTypes.SICK_DAY.value)
+        vacation.approval = str(VacationApproval.APPROVED.value)
+        vacation.save()
+        self.assertEqual((0.25, 0, 2, 0), self.get_balance_values())
+
+        vacation.delete()
+        self.assertEqual((0.25, 0, 0, 0), self.get_balance_values())
+
+    def test_vacation_across_years(self):
+        Vacation.objects.create(
+            cat=str(VacationTypes.DAY_OFF.value),
+            user=self.user,
+            start_at=datetime.datetime(2021, 12, 30),
+            end_at=datetime.datetime(2022, 1, 4),
+            approval=str(VacationApproval.APPROVED.value),
+        )
+        self.assertEqual((2, 0, 0, 0), self.get_balance_values(year=2021))
+        self.assertEqual((2, 0, 0, 0), self.get_balance_values(year=2022))
+
+    def test_business_days_filled_on_save(self):
+        vacation = Vacation.objects.create(
+            cat=str(VacationTypes.DAY_OFF.value),
+            user=self.user,
+            start_at=datetime.datetime(2021, 12, 24),
+            end_at=datetime.datetime(2022, 1, 3),
+            approval=str(VacationApproval.APPROVED.value),
+        )
+        self.assertEqual((28, 4), (vacation.business_days, vacation.year_split_days))
+        self.assertEqual({2021: 6, 2022: 1}, vacation.get_days_by_year())
+        self.assertEqual("7 일", get_vacation_duration(vacation))
+        self.assertEqual(1, create_one_fourth_day_off(user=self.user).business_days)
+
+    def test_holiday_change_refreshes_business_days(self):
+        vacation = Vacation.objects.create(
+            cat=str(VacationTypes.DAY_OFF.value),
+            user=self.user,
+            start_at=datetime.datetime(2021, 11, 1),
+            end_at=datetime.datetime(2021, 11, 5),
+            approval=str(VacationApproval.APPROVED.value),
+        )
+        self.assertEqual((5, 0, 0, 0), self.get_balance_values())
+
+        holiday = Holiday.objects.create(date=datetime.date(2021, 11, 3))
+        self.addCleanup(bump_holiday_version)
+        vacation.refresh_from_db()
+        self.assertEqual(16, vacation.business_days)
+        self.assertEqual((4, 0, 0, 0), self.get_balance_values())
+
+        holiday.delete()
+        vacation.refresh_from_db()
+        self.assertEqual(20, vacation.business_days)
+        self.assertEqual((5, 0, 0, 0), self.get_balance_values())
+
+    def test_update_business_days_command(self):
+        vacation = create_two_day_offs(user=self.user)
+        Vacation.objects.filter(pk=vacation.pk).update(business_days=0)
+
+        call_command("update_business_days", stdout=StringIO())
+        vacation.refresh_from_db()
+        self.assertEqual(8, vacation.business_days)
+        self.assertEqual((2, 0, 0, 0), self.get_balance_values())
+
+    def test_get_balance_builds_missing_rows(self):
+        create_vacation_objects(user=self.user)
+        Balance.objects.all().delete()
+
+        self.assertEqual(2.25, get_balance(user_id=self.user.id, year=2021).used_days)
+        self.assertEqual(0, get_balance(user_id=self.user.id, year=2020).used_days)
+
+    def test_rebuild_balances_command(self):
+        create_vacation_objects(user=self.user)
+        Balance.objects.filter(user=self.user, year=2021).update(used_days=10)
+
+        call_command("rebuild_balances", "--year", "2021", stdout=StringIO())
+        self.assertEqual((2.25, 0, 0, 0), self.get_balance_values())
+
+
+class TestHolidays(TestCase):
+    def tearDown(self):
+        # 테스트가 끝나면 DB가 롤백되므로 캐시된 공휴일 달력도 버립니다.
+        bump_holiday_version()
+
+    def import_holidays_from(self, content: str, suffix: str, *args):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=suffix, delete=False, encoding="utf-8"
+        ) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        call_command("import_holidays", file.name, *args, stdout=StringIO())
+
+    def test_holiday_calendar(self):
+        calendar = get_holiday_calendar()
+        self.assertTrue(calendar.is_holiday(datetime.date(2021, 9, 20)))
+        self.assertIn(datetime.datetime(2021, 12, 25, 11, 0), calendar)
+        self.assertFalse(calendar.is_holiday(datetime.date(2021, 9, 23)))
+        self.assertIs(calendar, get_holiday_calendar())
+
+    def test_holiday_calendar_queries(self):
+        start, end = datetime.date(2021, 9, 17), datetime.date(2021, 9, 24)
+        count_business_days_between(start=start, end=end)
+        # 공유 캐시의 버전은 HOLIDAY_VERSION_CHECK_INTERVAL초에 한 번만 확인합니다.
+        with self.assertNumQueries(0):
+            for _ in range(200):
+                self.assertEqual(3, count_business_days_between(start=start, end=end))
+
+    def test_holiday_change_invalidates_calendar(self):
+        start, end = datetime.date(2022, 1, 31), datetime.date(2022, 2, 4)
+        self.assertEqual(5, count_business_days_between(start=start, end=end))
+
+        holiday = Holiday.objects.create(date=datetime.date(2022, 2, 1), name="설날")
+        self.assertEqual(4, count_business_days_between(start=start, end=end))
+
+        holiday.delete()
+        self.assertEqual(5, count_business_days_between(start=start, end=end))
+
+    def test_holiday_change_from_other_process(self):
+        calendar = get_holiday_calendar()
+        self.assertFalse(calendar.is_holiday(datetime.date(2022, 2, 1)))
+
+        # 다른 프로세스(다른 캐시 연결)에서 공휴일을 바꾸고 버전을 올립니다.
+        Holiday.objects.bulk_create(
+            [Holiday(date=datetime.date(2022, 2, 1), name="설날")]
+        )
+        other_cache = CacheHandler()["default"]
+        self.assertIsNot(cache, other_cache)
+        other_cache.set(HOLIDAY_VERSION_KEY, time.time_ns(), timeout=None)
+
+        # 확인 주기가 지나기 전에는 이전 달력을 쓰고, 지나면 새 버전을 읽습니다.
+        with override_settings(HOLIDAY_VERSION_CHECK_INTERVAL=60):
+            self.assertIs(calendar, get_holiday_calendar())
+            with mock.patch(
+                "vacation.holidays.time.monotonic", return_value=time.monotonic() + 60
+            ):
+                calendar = get_holiday_calendar()
+        self.assertTrue(calendar.is_holiday(datetime.date(2022, 2, 1)))
+
+    def test_import_holidays_from_csv(self):
+        self.import_holidays_from(
+            "date,name\n2022-01-31,설날\n2022-02-01,설날\n2022-02-02,설날\n",
+            suffix=".csv",
+        )
+        self.assertEqual(3, Holiday.objects.filter(date__year=2022, name="설날").count())
+        self.assertTrue(get_holiday_calendar().is_holiday(datetime.date(2022, 2, 2)))
+
+    def test_import_holidays_replace(self):
+        user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        self.import_holidays_from(
+            "2022-01-31,설날\n2022-02-01,설날\n2022-12-26,대체공휴일\n", suffix=".csv"
+        )
+        vacation = Vacation.objects.create(
+            cat=str(VacationTypes.DAY_OFF.value),
+            user=user,
+            start_at=datetime.datetime(2022, 12, 26),
+            end_at=datetime.datetime(2022, 12, 30),
+            approval=str(VacationApproval.APPROVED.value),
+        )
+        self.assertEqual(16, vacation.business_days)
+
+        # 지우는 공휴일마다 signal을 보내지 않고, 버전과 사용 일수는 한 번에 갱신합니다.
+        with mock.patch(
+            "vacation.signals.bump_holiday_version"
+        ) as bump_on_signal, mock.patch(
+            "vacation.signals.refresh_business_days"
+        ) as refresh_on_signal, mock.patch(
+            "vacation.management.commands.import_holidays.refresh_business_days",
+            wraps=refresh_business_days,
+        ) as refresh:
+            self.import_holidays_from(
+                "2022-01-31,설날\n2022-02-01,설날\n", ".csv", "--replace"
+            )
+        bump_on_signal.assert_not_called()
+        refresh_on_signal.assert_not_called()
+        refresh.assert_called_once_with(
+            start=datetime.date(2022, 1, 1), end=datetime.date(2022, 12, 31)
+        )
+        self.assertEqual(2, Holiday.objects.filter(date__year=2022).count())
+        self.assertFalse(get_holiday_calendar().is_holiday(datetime.date(2022, 12, 26)))
+        vacation.refresh_from_db()
+        self.assertEqual(20, vacation.business_days)
+
+    def test_import_holidays_from_ics(self):
+        self.import_holidays_from(
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\n"
+            "DTSTART;VALUE=DATE:20220131\r\n"
+            "DTEND;VALUE=DATE:20220203\r\n"
+            "SUMMARY:설\r\n"
+            " 날\r\n"
+            "END:VEVENT\r\n"
+            "BEGIN:VEVENT\r\n"
+            "DTSTART;VALUE=DATE:20220301\r\n"
+            "SUMMARY:삼일절\r\n"
+            "END:VEVENT\r\n"
+            "END:VCALENDAR\r\n",
+            suffix=".ics",
+        )
+        self.assertEqual(
+            [
+                (datetime.date(2022, 1, 31), "설날"),
+                (datetime.date(2022, 2, 1), "설날"),
+                (datetime.date(2022, 2, 2), "설날"),
+                (datetime.date(2022, 3, 1), "삼일절"),
+            ],
+            list(Holiday.objects.filter(date__year=2022).values_list("date", "name")),
+        )
+
+
+class TestImportHRData(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        cls.user_profile = Profile.objects.create(user=cls.user)
+
+    def import_hr_data(self, kind: str, content: str, suffix: str) -> StringIO:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=suffix, delete=False, encoding="utf-8"
+        ) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        stderr = StringIO()
+        call_command(
+            "import_hr_data",
+            kind,
+            file.name,
+            "--chunk-size",
+            "2",
+            stdout=StringIO(),
+            stderr=stderr,
+        )
+        return stderr
+
+    def test_import_vacations(self):
+        create_two_day_offs(user=self.user)
+        stderr = self.import_hr_data(
+            "vacation",
+            "username,cat,start_at,end_at,approval\n"
+            "user,1,2021-08-02,2021-08-04,\n"
+            "user,반차,2021-08-05 09:00,,승인\n"
+            "user,1,2021-08-04,2021-08-06,\n"
+            "user,9,2021-08-09,2021-08-09,\n"
+            "nobody,1,2021-08-09,2021-08-09,\n"
+            "user,2,2021-08-11,2021-08-10,\n"
+            "user,1,2021-12-31,2021-12-31,\n",
+            suffix=".csv",
+        )
+
+        # 오류 행은 "경로:줄 번호: 메시지"로 알려줍니다.
+        self.assertEqual(
+            ["4", "5", "6", "7", "8"],
+            [
+                line.split(": ", 1)[0].rsplit(":", 1)[1]
+                for line in stderr.getvalue().splitlines()
+            ],
+        )
+        day_off = Vacation.objects.get(start_at=datetime.datetime(2021, 8, 2))
+        self.assertEqual(datetime.datetime(2021, 8, 4), day_off.end_at)
+        self.assertEqual(12, day_off.business_days)
+        half_day_off = Vacation.objects.get(cat=str(VacationTypes.HALF_DAY_OFF.value))
+        self.assertEqual(datetime.datetime(2021, 8, 5, 13), half_day_off.end_at)
+
+        # 기존 휴가 2일 + 연차 3일 + 반차
+        self.assertEqual(5.5, Balance.objects.get(user=self.user, year=2021).used_days)
+        self.assertEqual(5.5, Profile.objects.get(user=self.user).used_days)
+
+    def test_import_attendances(self):
+        self.import_hr_data(
+            "attendance",
+            '{"username": "user", "date": "2021-07-01", "start_at": "09:00", "end_at": "18:00"}\n'
+            '{"username": "user", "date": "2021-07-02", "start_at": "10:30:00", "end_at": "19:00"}\n'
+            '{"username": "user", "date": "2021-07-01", "start_at": "09:00"}\n'
+            '{"username": "user", "date": "2021-07-05", "start_at": "09:00", "ip_address": "x"}\n'
+            "\n",
+            suffix=".jsonl",
+        )
+
+        self.assertEqual(2, Attendance.objects.filter(user=self.user).count())
+        self.assertEqual(2, AttendanceDaily.objects.filter(user=self.user).count())
+        monthly = AttendanceMonthly.objects.get(user=self.user, year=2021, month=7)
+        self.assertEqual(
+            (2, int(17.5 * 3600), 1),
+            (monthly.days, monthly.worked_seconds, monthly.late_days),
+        )
+        self.assertEqual(
+            datetime.date(2021, 7, 2),
+            LatestAttendance.objects.get(user=self.user).attendance.date,
+        )
+
+    def test_import_profiles(self):
+        self.import_hr_data(
+            "profile",
+            "username,first_name,total_days,slack_channel\n"
+            "user,,20,\n"
+            "newbie,신입,10,general\n"
+            "broken,,-1,\n",
+            suffix=".csv",
+        )
+
+        self.user_profile.refresh_from_db()
+        self.assertEqual(20, self.user_profile.total_days)
+        newbie = User.objects.get(username="newbie")
+        self.assertEqual("신입", newbie.first_name)
+        self.assertFalse(newbie.has_usable_password())
+        self.assertEqual(
+            (10, "general"),
+            (newbie.profile.total_days, newbie.profile.slack_channel),
+        )
+        self.assertFalse(User.objects.filter(username="broken").exists())
+
+
+class TestRollover(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        cls.user_profile = Profile.objects.create(user=cls.user, total_days=15.0)
+        create_two_day_offs(user=cls.user)
+        Vacation.objects.create(
+            cat=str(VacationTypes.DAY_OFF.value),
+            user=cls.user,
+            start_at=datetime.datetime(2022, 1, 3),
+            end_at=datetime.datetime(2022, 1, 3),
+            approval=str(VacationApproval.APPROVED.value),
+        )
+
+    def rollover(self, *args):
+        call_command("rollover", "--year", "2021", *args, stdout=StringIO())
+
+    def test_rollover(self):
+        for _ in range(2):
+            # 다시 실행해도 처음 마감한 총 휴가를 기준으로 합니다.
+            self.rollover("--total-days", "20", "--carry-over", "5")
+
+            history = BalanceHistory.objects.get(user=self.user, year=2021)
+            self.assertEqual(
+                (15.0, 2.0, 13.0, 25.0),
+                (
+                    history.total_days,
+                    history.used_days,
+                    history.remaining_days,
+                    history.next_total_days,
+                ),
+            )
+            self.user_profile.refresh_from_db()
+            self.assertEqual(
+                (25.0, 1.0), (self.user_profile.total_days, self.user_profile.used_days)
+            )
+        self.assertEqual(1, BalanceHistory.objects.count())
+        self.assertEqual(1.0, Balance.objects.get(user=self.user, year=2022).used_days)
+
+    def test_rollover_keeps_total_days_by_default(self):
+        self.rollover("--shard-size", "1")
+        self.user_profile.refresh_from_db()
+        self.assertEqual(15.0, self.user_profile.total_days)
+
+    def test_dry_run(self):
+        self.rollover("--total-days", "20", "--dry-run")
+        self.assertFalse(BalanceHistory.objects.exists())
+        self.user_profile.refresh_from_db()
+        self.assertEqual(15.0, self.user_profile.total_days)
+
+
+class TestBalanceCache(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=TestCaseCredentials.USER_ID, password=TestCaseCredentials.USER_PW
+        )
+        cls.user_profile = Profile.objects.create(user=cls.user)
+
+    def setUp(self):
+        create_two_day_offs(user=self.user)
+        reset_balance_cache_stats()
+
+    def tearDown(self):
+        # 테스트가 끝나면 DB가 롤백되므로 캐시된 휴가 현황도 버립니다.
+        invalidate_balance_cache()
+
+    def get_cached_balance(self):
+        return get_cached_balance(user_id=self.user.id, year=2021)
+
+    def test_repeat_read_hits_cache(self):
+        self.assertEqual(VacationBalance(used_days=2.0), self.get_cached_balance())
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(VacationBalance(used_days=2.0), self.get_cached_balance())
+            get_balance_summary(self.user_profile, year=2021)
+        # 공유 캐시(DB 캐시)를 읽는 쿼리 말고는 원장이나 휴가를 읽지 않습니다.
+        self.assertEqual(
+            [],
+            [query["sql"] for query in queries if "django_cache" not in query["sql"]],
+        )
+        self.assertEqual(
+            {"hits": 2, "misses": 1, "computations": 1}, get_balance_cache_stats()
+        )
+
+    def test_vacation_changes_invalidate_cache(self):
+        self.get_cached_balance()
+        # 거부된 휴가는 원장을 바꾸지 않으므로 캐시도 그대로 씁니다.
+        vacation = create_half_day_off(user=self.user)
+        self.assertEqual(VacationBalance(used_days=2.0), self.get_cached_balance())
+        self.assertEqual(1, get_balance_cache_stats()["hits"])
+
+        vacation.approval = str(VacationApproval.APPROVED.value)
+        vacation.save()
+        self.assertEqual(VacationBalance(used_days=2.5), self.get_cached_balance())
+
+        vacation.approval = str(VacationApproval.ON_HOLD.value)
+        vacation.save()
+        self.assertEqual(
+            VacationBalance(used_days=2.0, on_hold_days=0.5), self.get_cached_balance()
+        )
+
+        vacation.delete()
+        self.assertEqual(VacationBalance(used_days=2.0), self.get_cached_balance())
+
+        Balance.objects.filter(user=self.user, year=2021).update(used_days=10)
+        call_command("rebuild_balances", "--year", "2021", stdout=StringIO())
+        self.assertEqual(VacationBalance(used_days=2.0), self.get_cached_balance())
+        self.assertEqual(5, get_balance_cache_stats()["misses"])
+
+    def test_generation_bump_from_other_process(self):
+        self.assertEqual(VacationBalance(used_days=2.0), self.get_cached_balance())
+
+        # 다른 프로세스(다른 캐시 연결)에서 원장을 바꾸고 세대를 올립니다.
+        Balance.objects.filter(user=self.user, year=2021).update(used_days=3)
+        other_cache = CacheHandler()["default"]
+        self.assertIsNot(cache, other_cache)
+        with mock.patch("vacation.ledger.cache", other_cache):
+            invalidate_balance_cache([self.user.id])
+
+        self.assertEqual(VacationBalance(used_days=3.0), self.get_cached_balance())
+
+    # 다른 스레드는 테스트 DB 연결을 쓸 수 없으므로 이 테스트만 프로세스 캐시로 잠금을 확인합니다.
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-balance-cache",
+            }
+        }
+    )
+    def test_concurrent_misses_compute_once(self):
+        balance = Balance.objects.get(user=self.user, year=2021)
+        started = threading.Event()
+
+        def slow_get_balance(**kwargs):
+            # 다른 스레드는 테스트 DB 연결을 쓸 수 없으므로 미리 읽은 원장을 돌려줍니다.
+            started.set()
+            time.sleep(0.2)
+            return balance
+
+        results = []
+        with mock.patch(
+            "vacation.ledger.get_balance", side_effect=slow_get_balance
+        ) as get_balance_mock:
+            thread = threading.Thread(
+                target=lambda: results.append(self.get_cached_balance())
+            )
+            thread.start()
+            started.wait()
+            results.append(self.get_cached_balance())
+            thread.join()
+
+        self.assertEqual([VacationBalance(used_days=2.0)] * 2, results)
+        self.assertEqual(1, get_balance_mock.call_count)
+        self.assertEqual(
+            {"misses": 2, "computations": 1, "waits": 1}, get_balance_cache_stats()
+        )
+
+
+class TestBenchmarks(TestCase):
+    def tearDown(self):
+        invalidate_balance_cache()
+
+    def test_run_cases(self):
+        dataset = create_dataset(num_users=5, vacations_per_user=3)
+        self.assertEqual(5, len(dataset.users))
+        self.assertEqual(15, dataset.num_vacations)
+        self.assertFalse(Vacation.objects.filter(business_days=0).exists())
+
+        results = run_cases(get_cases(dataset), suffix="@5", repeat=2, warmup=0)
+        self.assertIn("AttendanceCreate[checkout]@5", results)
+        self.assertEqual(0, results["get_duration@5"]["queries"])
+        self.assertEqual(1, results["does_vacation_overlap@5"]["queries"])
+        # 직원 3명이 체크인하고, 같은 3명이 체크아웃했습니다.
+        self.assertEqual(dataset.num_attendances + 3, Attendance.objects.count())
+        self.assertFalse(Attendance.objects.filter(end_at__isnull=True).exists())
+
+    def test_compare_results(self):
+        def report(**results):
+            return {
+                "results": {
+                    name: {"median_ms": median_ms, "queries": queries}
+                    for name, (median_ms, queries) in results.items()
+                }
+            }
+
+        comparisons = compare_results(
+            report(same=(10.0, 2), slower=(10.0, 2), more_queries=(1.0, 2), old=(1, 1)),
+            report(same=(11.0, 2), slower=(13.0, 2), more_queries=(1.0, 3), new=(1, 1)),
+        )
+        self.assertEqual(
+            ["more_queries", "slower"],
+            [comparison.name for comparison in comparisons if comparison.regression],
+        )
+        self.assertEqual(
+            {"new": None, "old": 1},
+            {
+                comparison.name: comparison.baseline_ms
+                for comparison in comparisons
+                if comparison.current_ms is None or comparison.baseline_ms is None
+            },
+        )
@@ -17,6 +17,7 @@ urlpatterns = [
         name="admin_update",
     ),
     path("admin/users", views.MemberListView.as_view(), name="member_list"),
+    path("admin/export/<str:kind>", views.ExportView.as_view(), name="export"),
     path("admin/register/sick", views.SickCreateView.as_view(), name="sick"),
     path(
         "admin/users/vacation",
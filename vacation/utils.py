@@ -1,77 +1,181 @@
 from datetime import datetime, date, timedelta
-from typing import Any, Dict, List, Tuple, Set
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 from dateutil import parser
 from django.contrib.auth.models import User
+from django.db.models import (
+    Case,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Q,
+    QuerySet,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from core.models import Profile
 
+from vacation.business_days import (
+    get_business_dates_in_year,
+    get_business_day_units,
+    to_day_array,
+)
 from vacation.constants import (
-    HOLIDAY_LIST,
+    BUSINESS_DAY_UNITS,
+    DAY_OFF_TYPES,
     NUM_PRENOTICE_DAYS,
+    PARTIAL_DAY_OFF_TYPES,
     VacationTypes,
     VacationApproval,
     SPECIAL_VACATION_TYPES,
 )
 from vacation.models import Vacation
 
+PROFILE_BALANCE_FIELDS = ["used_days", "sick_days", "comp_days"]
+
 
-def get_dates_in_range(start: datetime, end: datetime) -> Set:
+def get_valid_vacation_dates(
+    vacation_list: Any, year: int = datetime.today().year
+) -> List[date]:
     """
-    start와 end 사이에 있는 모든 날짜를 set으로 리턴합니다.
+    지정한 년도에 쓰인 연차/휴가 중 중복되는 휴가를 삭제하고, 주말과 공휴일을 제외한 후 List로 리턴합니다.
     """
-    delta = end - start
-    return set([start.date() + timedelta(days=i) for i in range(delta.days + 1)])
+    starts, ends = get_vacation_ranges(vacation_list=vacation_list)
+    return get_business_dates_in_year(starts=starts, ends=ends, year=year).tolist()
 
 
-def get_valid_vacation_dates(
-    vacation_list: Any, year: int = datetime.today().year
-) -> List:
+def get_vacation_ranges(vacation_list: Any) -> Tuple[np.ndarray, np.ndarray]:
     """
-    지정한 년도에 쓰인 연차/휴가 중 중복되는 휴가를 삭제하고, 주말을 제외한 후 List로 리턴합니다.
+    휴가 리스트의 시작일과 종료일을 각각 numpy 배열로 리턴합니다. QuerySet이면 모델 객체를 만들지 않고 값만 읽습니다.
     """
-    year_dates = get_dates_in_range(datetime(year, 1, 1), datetime(year, 12, 31))
+    if isinstance(vacation_list, QuerySet):
+        ranges = list(vacation_list.values_list("start_at", "end_at"))
+    else:
+        ranges = [(vacation.start_at, vacation.end_at) for vacation in vacation_list]
+    starts = to_day_array(start_at for start_at, _ in ranges)
+    ends = to_day_array(end_at for _, end_at in ranges)
+    return starts, ends
+
+
+def get_units_in_year(year: int, prefix: str = "") -> Case:
+    """
+    휴가 한 건이 지정한 년도에 차지하는 사용 일수(1/4일 단위)를 저장된 값으로 계산하는 SQL 식입니다.
+    다른 모델에서 join 해서 쓰는 경우 prefix에 관계 이름(예: "vacation__")을 넘깁니다.
+    """
+    start_year = {f"{prefix}start_at__year": year}
+    end_year = {f"{prefix}end_at__year": year}
+    business_days = F(f"{prefix}business_days")
+    year_split_days = F(f"{prefix}year_split_days")
+    return Case(
+        When(**start_year, **end_year, then=business_days),
+        When(**start_year, then=business_days - year_split_days),
+        When(**end_year, then=year_split_days),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+
+def get_vacation_day_sums(year: int, approval_filter: Q = Q()) -> Dict[str, Sum]:
+    """
+    쓰인 휴가(연차, 반차, 반반차), 병가, 대체 휴가의 합계(1/4일 단위)를 구하는 SQL 집계 식입니다.
+    """
+    units = get_units_in_year(year)
+    return {
+        "used_units": Sum(
+            units, filter=approval_filter & ~Q(cat__in=SPECIAL_VACATION_TYPES)
+        ),
+        "sick_units": Sum(
+            units, filter=approval_filter & Q(cat=str(VacationTypes.SICK_DAY.value))
+        ),
+        "comp_units": Sum(
+            units, filter=approval_filter & Q(cat=str(VacationTypes.COMP_DAY.value))
+        ),
+    }
+
+
+def to_days(units: Optional[int]) -> float:
+    """
+    1/4일 단위 합계를 일수로 바꿉니다. 합계할 휴가가 없으면(None) 0을 리턴합니다.
+    """
+    return (units or 0) / BUSINESS_DAY_UNITS
 
-    total_day_off_list = list()
-    for day_off in vacation_list:
-        day_off_dates = get_dates_in_range(day_off.start_at, day_off.end_at)
-        day_off_in_same_year = year_dates & day_off_dates
-        if len(day_off_in_same_year) > 0:
-            total_day_off_list.extend(
-                pd.bdate_range(
-                    start=min(day_off_in_same_year), end=max(day_off_in_same_year)
-                ).to_list()
-            )
 
-    return total_day_off_list
+def filter_vacations_in_year(vacation_list: QuerySet, year: int) -> QuerySet:
+    """
+    지정한 년도에 걸친 휴가만 남깁니다.
+    """
+    year_start, year_end = get_year_range(year)
+    return vacation_list.filter(start_at__lte=year_end, end_at__gte=year_start)
 
 
-def calculate_vacation_days_by_type(vacation_list: Any, year: int) -> float:
+def calculate_vacation_days_by_type(vacation_list: QuerySet, year: int) -> float:
     """
-    주어진 휴가 리스트를 가지고 쓰인 총 연차, 반차, 반반차의 수를 더해 계산합니다.
+    주어진 휴가 리스트를 가지고 쓰인 총 연차, 반차, 반반차(병가, 대체휴가 포함)의 수를 저장된 사용 일수의 SUM 한 번으로 계산합니다.
     """
-    day_off_list = vacation_list.filter(
-        cat__in=[
-            VacationTypes.DAY_OFF.value,
-            VacationTypes.SICK_DAY.value,
-            VacationTypes.COMP_DAY.value,
-        ]
+    units = (
+        filter_vacations_in_year(vacation_list=vacation_list, year=year)
+        .order_by()
+        .aggregate(units=Sum(get_units_in_year(year)))["units"]
     )
-    total_day_off_list = get_valid_vacation_dates(vacation_list=day_off_list, year=year)
-    num_half_day_offs = len(
-        vacation_list.filter(cat=str(VacationTypes.HALF_DAY_OFF.value))
+    return to_days(units)
+
+
+class VacationBalance(NamedTuple):
+    """
+    DB에 저장하지 않고 계산만 한 사용자의 휴가 현황입니다.
+    """
+
+    used_days: float = 0.0
+    on_hold_days: float = 0.0
+    sick_days: float = 0.0
+    comp_days: float = 0.0
+
+
+def compute_vacation_balance(
+    user_id: int, year: int = datetime.today().year
+) -> VacationBalance:
+    """
+    사용자의 승인된/대기 중인 휴가를 한 번의 집계 쿼리로 읽어 휴가 현황을 계산합니다. DB에 쓰지 않습니다.
+    """
+    approved = Q(approval=str(VacationApproval.APPROVED.value))
+    on_hold = Q(approval=str(VacationApproval.ON_HOLD.value))
+    sums = filter_vacations_in_year(
+        vacation_list=Vacation.objects.filter(user_id=user_id), year=year
+    ).aggregate(
+        on_hold_units=Sum(
+            get_units_in_year(year),
+            filter=on_hold & ~Q(cat__in=SPECIAL_VACATION_TYPES),
+        ),
+        **get_vacation_day_sums(year=year, approval_filter=approved),
     )
-    num_one_fourth_day_offs = len(
-        vacation_list.filter(cat=str(VacationTypes.ONE_FOURTH_DAY_OFF.value))
+    return VacationBalance(
+        used_days=to_days(sums["used_units"]),
+        on_hold_days=to_days(sums["on_hold_units"]),
+        sick_days=to_days(sums["sick_units"]),
+        comp_days=to_days(sums["comp_units"]),
     )
 
-    total_used_days = (
-        len(set(total_day_off_list) - set(HOLIDAY_LIST))
-        + num_half_day_offs * 0.5
-        + num_one_fourth_day_offs * 0.25
-    )
-    return total_used_days
+
+def save_vacation_balance(user_profile: Profile, balance: VacationBalance) -> List[str]:
+    """
+    계산한 휴가 현황을 Profile에 씁니다. 값이 바뀐 필드만 update_fields로 저장하고, 바뀐 필드 목록을 리턴합니다.
+    """
+    changed_fields = []
+    for field in PROFILE_BALANCE_FIELDS:
+        value = getattr(balance, field)
+        if getattr(user_profile, field) != value:
+            setattr(user_profile, field, value)
+            changed_fields.append(field)
+
+    if changed_fields:
+        user_profile.save(update_fields=changed_fields)
+    return changed_fields
 
 
 def get_total_used_days(
@@ -80,73 +184,210 @@ def get_total_used_days(
     year: int = datetime.today().year,
 ) -> float:
     """
-    User profile을 가지고 쓰인 총 휴가(연차, 반차, 반반차)의 수를 계산합니다.
+    User profile을 가지고 쓰인 총 휴가(연차, 반차, 반반차)의 수를 계산합니다. DB에 쓰지 않습니다.
     """
     vacation_list = Vacation.objects.exclude(cat__in=SPECIAL_VACATION_TYPES).filter(
         user_id=user_profile.user_id,
         approval__in=approval,
     )
-    total_used_days = calculate_vacation_days_by_type(
-        vacation_list=vacation_list, year=year
-    )
-    user_profile.used_days = total_used_days
-    user_profile.save()
-
-    return total_used_days
+    return calculate_vacation_days_by_type(vacation_list=vacation_list, year=year)
 
 
 def get_total_sick_days(
     user_profile: Profile, year: int = datetime.today().year
 ) -> float:
     """
-    User profile을 가지고 쓰인 총 병가의 수를 계산합니다.
+    User profile을 가지고 쓰인 총 병가의 수를 계산합니다. DB에 쓰지 않습니다.
     """
     vacation_list = Vacation.objects.filter(
         approval=str(VacationApproval.APPROVED.value),
         user_id=user_profile.user_id,
         cat=str(VacationTypes.SICK_DAY.value),
     )
-    total_sick_day_list = get_valid_vacation_dates(
-        vacation_list=vacation_list, year=year
-    )
-    total_sick_days = len(set(total_sick_day_list) - set(HOLIDAY_LIST))
-    user_profile.sick_days = total_sick_days
-    user_profile.save()
-
-    return total_sick_days
+    return calculate_vacation_days_by_type(vacation_list=vacation_list, year=year)
 
 
 def get_total_comp_days(
     user_profile: Profile, year: int = datetime.today().year
 ) -> float:
     """
-    User profile을 가지고 쓰인 총 대체 휴가의 수를 계산합니다.
+    User profile을 가지고 쓰인 총 대체 휴가의 수를 계산합니다. DB에 쓰지 않습니다.
     """
     vacation_list = Vacation.objects.filter(
         approval=str(VacationApproval.APPROVED.value),
         user_id=user_profile.user_id,
         cat=str(VacationTypes.COMP_DAY.value),
     )
-    total_comp_day_list = get_valid_vacation_dates(
-        vacation_list=vacation_list, year=year
-    )
-    total_comp_days = len(set(total_comp_day_list) - set(HOLIDAY_LIST))
-    user_profile.comp_days = total_comp_days
-    user_profile.save()
-
-    return total_comp_days
+    return calculate_vacation_days_by_type(vacation_list=vacation_list, year=year)
 
 
 def get_vacation_days(
     user_profile: Profile, year: int = datetime.today().year
 ) -> Tuple[float, float, float]:
     """
-    User profile을 가지고 쓰인 총 휴가, 병가, 대체 휴가의 수를 계산합니다.
+    User profile을 가지고 쓰인 총 휴가, 병가, 대체 휴가의 수를 계산하고, 바뀐 값만 Profile에 저장합니다.
+    """
+    balance = compute_vacation_balance(user_id=user_profile.user_id, year=year)
+    save_vacation_balance(user_profile=user_profile, balance=balance)
+    return balance.used_days, balance.sick_days, balance.comp_days
+
+
+def annotate_vacation_days(
+    user_list: QuerySet, year: int = datetime.today().year
+) -> QuerySet:
+    """
+    사용자 QuerySet에 총 휴가(total_days), 쓰인 휴가(used_days), 승인 예정 휴가(on_hold_days),
+    신청 가능 휴가(available_days)를 SQL 집계로 붙입니다. 사용자 수와 상관없이 한 번의 쿼리로 읽습니다.
+    """
+    units = get_units_in_year(year=year, prefix="vacation__")
+    not_special = ~Q(vacation__cat__in=SPECIAL_VACATION_TYPES)
+
+    def to_days_expression(approval: VacationApproval) -> ExpressionWrapper:
+        return ExpressionWrapper(
+            Coalesce(
+                Sum(
+                    units,
+                    filter=Q(vacation__approval=str(approval.value)) & not_special,
+                ),
+                Value(0),
+            )
+            / Value(float(BUSINESS_DAY_UNITS)),
+            output_field=FloatField(),
+        )
+
+    return user_list.annotate(
+        total_days=Coalesce(F("profile__total_days"), Value(0.0)),
+        used_days=to_days_expression(VacationApproval.APPROVED),
+        on_hold_days=to_days_expression(VacationApproval.ON_HOLD),
+    ).annotate(
+        available_days=ExpressionWrapper(
+            F("total_days") - F("used_days") - F("on_hold_days"),
+            output_field=FloatField(),
+        )
+    )
+
+
+def set_business_days(vacation: Vacation) -> None:
+    """
+    휴가의 사용 일수와 종료 년도 사용 일수를 계산해 채웁니다. 저장은 하지 않습니다.
+    """
+    units, split_units = get_business_day_units(
+        cats=[vacation.cat], starts=[vacation.start_at], ends=[vacation.end_at]
+    )
+    vacation.business_days = int(units[0])
+    vacation.year_split_days = int(split_units[0])
+
+
+def update_business_days(
+    vacation_list: QuerySet, batch_size: int = 500
+) -> List[Vacation]:
     """
-    used_days = get_total_used_days(user_profile=user_profile, year=year)
-    sick_days = get_total_sick_days(user_profile=user_profile, year=year)
-    comp_days = get_total_comp_days(user_profile=user_profile, year=year)
-    return used_days, sick_days, comp_days
+    휴가들의 사용 일수를 한 번에 다시 계산해, 값이 바뀐 휴가만 저장하고 리턴합니다.
+    """
+    vacations = list(
+        vacation_list.only(
+            "id",
+            "user_id",
+            "cat",
+            "start_at",
+            "end_at",
+            "business_days",
+            "year_split_days",
+        )
+    )
+    units, split_units = get_business_day_units(
+        cats=(vacation.cat for vacation in vacations),
+        starts=(vacation.start_at for vacation in vacations),
+        ends=(vacation.end_at for vacation in vacations),
+    )
+
+    updated_at = timezone.now()
+    changed_vacations = []
+    for vacation, business_days, year_split_days in zip(
+        vacations, units.tolist(), split_units.tolist()
+    ):
+        if (vacation.business_days, vacation.year_split_days) != (
+            business_days,
+            year_split_days,
+        ):
+            vacation.business_days = business_days
+            vacation.year_split_days = year_split_days
+            # 목록 화면의 행 캐시가 수정일을 키로 쓰므로 함께 바꿉니다.
+            vacation.updated_at = updated_at
+            changed_vacations.append(vacation)
+
+    Vacation.objects.bulk_update(
+        changed_vacations,
+        ["business_days", "year_split_days", "updated_at"],
+        batch_size=batch_size,
+    )
+    return changed_vacations
+
+
+def get_year_range(year: int) -> Tuple[datetime, datetime]:
+    """
+    지정한 년도의 시작 시각과 끝 시각을 리턴합니다.
+    """
+    return datetime(year, 1, 1), datetime(year, 12, 31, 23, 59, 59, 999999)
+
+
+def get_vacation_days_by_user(
+    year: int = datetime.today().year,
+    user_ids: Iterable[int] = None,
+    approval: str = str(VacationApproval.APPROVED.value),
+) -> Dict[int, Tuple[float, float, float]]:
+    """
+    승인된(또는 지정한 상태의) 모든 휴가를 사용자별로 한 번에 집계해 총 휴가, 병가, 대체 휴가의 수를 계산합니다.
+    """
+    vacation_list = filter_vacations_in_year(
+        vacation_list=Vacation.objects.filter(approval=approval), year=year
+    )
+    if user_ids is not None:
+        vacation_list = vacation_list.filter(user_id__in=user_ids)
+
+    rows = (
+        vacation_list.order_by()
+        .values("user_id")
+        .annotate(**get_vacation_day_sums(year=year))
+    )
+    return {
+        row["user_id"]: (
+            to_days(row["used_units"]),
+            to_days(row["sick_units"]),
+            to_days(row["comp_units"]),
+        )
+        for row in rows
+    }
+
+
+def update_vacation_days(
+    year: int = datetime.today().year,
+    user_ids: Iterable[int] = None,
+    batch_size: int = 500,
+    vacation_days: Dict[int, Tuple[float, float, float]] = None,
+) -> int:
+    """
+    모든 사용자(또는 지정한 사용자)의 Profile에 쓰인 휴가, 병가, 대체 휴가의 수를 한 번에 저장합니다.
+    값이 바뀐 Profile만 저장하고, 저장한 Profile의 수를 리턴합니다.
+    """
+    if vacation_days is None:
+        vacation_days = get_vacation_days_by_user(year=year, user_ids=user_ids)
+
+    profiles = Profile.objects.only("user_id", "used_days", "sick_days", "comp_days")
+    if user_ids is not None:
+        profiles = profiles.filter(user_id__in=user_ids)
+
+    changed_profiles = []
+    for profile in profiles:
+        values = vacation_days.get(profile.user_id, (0.0, 0.0, 0.0))
+        if (profile.used_days, profile.sick_days, profile.comp_days) != values:
+            profile.used_days, profile.sick_days, profile.comp_days = values
+            changed_profiles.append(profile)
+
+    Profile.objects.bulk_update(
+        changed_profiles, PROFILE_BALANCE_FIELDS, batch_size=batch_size
+    )
+    return len(changed_profiles)
 
 
 def get_end_at(vacation_type: int, start_at: Any) -> datetime:
@@ -216,22 +457,55 @@ def is_vacation_prenotified(date: datetime) -> bool:
     return (date - datetime.now()).days >= NUM_PRENOTICE_DAYS
 
 
+def get_overlapping_vacations(
+    user: User,
+    start: datetime,
+    end: datetime,
+    vacation_id: int = None,
+    vacation_type: int = None,
+) -> QuerySet:
+    """
+    기간이 겹치는 휴가(거부된 휴가 제외)를 찾는 쿼리입니다.
+    (user, cat, start_at, end_at) 인덱스를 타도록 사용자와 종류(cat IN)부터 거릅니다.
+    """
+    if vacation_type is not None and is_category_day_off(vacation_type=vacation_type):
+        # 연차/병가/대체휴가는 종료일 하루 전체를 사용합니다.
+        end = datetime.combine(end.date(), datetime.max.time())
+    start_of_day = datetime.combine(start.date(), datetime.min.time())
+
+    # 연차/병가/대체휴가의 end_at은 마지막 날 0시이므로 그 날의 시작과 비교합니다.
+    overlapping_end = Q(cat__in=DAY_OFF_TYPES, end_at__gte=start_of_day) | Q(
+        cat__in=PARTIAL_DAY_OFF_TYPES, end_at__gte=start
+    )
+    return (
+        Vacation.objects.filter(
+            user=user,
+            cat__in=DAY_OFF_TYPES + PARTIAL_DAY_OFF_TYPES,
+            start_at__lte=end,
+        )
+        .filter(overlapping_end)
+        .exclude(approval=str(VacationApproval.DENIED.value))
+        .exclude(id=vacation_id)
+    )
+
+
 def does_vacation_overlap(
-    user: User, start: datetime, end: datetime, vacation_id: int = None
+    user: User,
+    start: datetime,
+    end: datetime,
+    vacation_id: int = None,
+    vacation_type: int = None,
 ) -> bool:
     """
-    휴가 신청 시 겹치는 휴가가 이미 존재하는지 확인합니다.
+    휴가 신청 시 겹치는 휴가(거부된 휴가 제외)가 이미 존재하는지 하나의 EXISTS 쿼리로 확인합니다.
     """
-    vacation_list = Vacation.objects.exclude(id=vacation_id).filter(
-        user=user, cat=str(VacationTypes.DAY_OFF.value)
-    )
-    for vac in vacation_list:
-        latest_start = max(vac.start_at, start)
-        earliest_end = min(vac.end_at, end)
-        delta = (earliest_end - latest_start).days + 1
-        if max(0, delta) > 0:
-            return True
-    return False
+    return get_overlapping_vacations(
+        user=user,
+        start=start,
+        end=end,
+        vacation_id=vacation_id,
+        vacation_type=vacation_type,
+    ).exists()
 
 
 def has_enough_vacation_days_left(
@@ -250,8 +524,10 @@ def has_enough_vacation_days_left(
     elif vacation_type == VacationTypes.ONE_FOURTH_DAY_OFF.value:
         vacation_days = 0.25
 
-    if user_profile.total_days >= vacation_days + get_total_used_days(
-        user_profile=user_profile, approval=["0", "1"]
+    balance = compute_vacation_balance(user_id=user.id, year=start_at.year)
+    if (
+        user_profile.total_days
+        >= vacation_days + balance.used_days + balance.on_hold_days
     ):
         return False
     return True
@@ -5,20 +5,25 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.db.models import Q
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import render
 from django.urls import reverse, reverse_lazy
+from django.utils.functional import cached_property
 from django.views.generic import (
     CreateView,
     DeleteView,
     ListView,
     TemplateView,
     UpdateView,
+    View,
 )
 from django.views.generic.edit import BaseUpdateView, ModelFormMixin
 from django_slack import slack_message
 
 from core.models import Profile
+from core.pagination import KeysetPaginationMixin
 from isds.exception import print_exception
 from vacation.constants import (
     DATE_FORMAT,
@@ -27,6 +32,7 @@ from vacation.constants import (
     VacationMessages,
     VacationTypes,
 )
+from vacation.exports import EXPORTS, FORMATS, openpyxl
 from vacation.forms import (
     AdminUpdateForm,
     SickForm,
@@ -35,17 +41,21 @@ from vacation.forms import (
     VacationForm,
     VacationYearSelectForm,
 )
+from vacation.ledger import (
+    get_balance_cache_key,
+    get_balance_summary,
+    get_cached_balance,
+)
 from vacation.mixins import IsSuperuserMixin
 from vacation.models import Vacation
 from vacation.utils import (
+    annotate_vacation_days,
     convert_start_and_end_at,
     does_vacation_overlap,
     get_start_and_end_at,
-    get_total_used_days,
     has_enough_vacation_days_left,
     is_category_day_off,
     is_vacation_prenotified,
-    get_vacation_days,
 )
 
 logging.root.setLevel(logging.INFO)
@@ -59,25 +69,20 @@ class VacationManagementView(LoginRequiredMixin, TemplateView):
     template_name = "vacation/admin_index.html"
 
 
-class VacationListView(LoginRequiredMixin, ListView, ModelFormMixin):
+class VacationListView(
+    LoginRequiredMixin, KeysetPaginationMixin, ListView, ModelFormMixin
+):
     template_name = "vacation/user/list.html"
     context_object_name = "vacation_list"
     form_class = VacationYearSelectForm
+    keyset_ordering = ("-start_at", "-id")
 
     def get_queryset(self):
         if self.start is not None and self.end is not None:
-            return (
-                Vacation.objects.select_related("user")
-                .filter(
-                    user=self.user, start_at__gte=self.start, start_at__lte=self.end
-                )
-                .order_by("-start_at")
-            )
-        return (
-            Vacation.objects.select_related("user")
-            .filter(user=self.user)
-            .order_by("-start_at")
-        )
+            return Vacation.objects.filter(
+                user=self.user, start_at__gte=self.start, start_at__lte=self.end
+            ).order_by(*self.keyset_ordering)
+        return Vacation.objects.filter(user=self.user).order_by(*self.keyset_ordering)
 
     def get(self, request, *args, **kwargs):
         year = request.GET.get("year")
@@ -90,10 +95,14 @@ class VacationListView(LoginRequiredMixin, ListView, ModelFormMixin):
         self.start = datetime.date(int(year), 1, 1) if year is not None else None
         self.end = datetime.date(int(year), 12, 31) if year is not None else None
         self.object = None
-        profile = Profile.objects.get_or_create(user_id=user_id)[0]
-        get_vacation_days(user_profile=profile)
+        self.year = int(year) if year is not None else datetime.date.today().year
+        self.user_profile, _ = Profile.objects.get_or_create(user_id=user_id)
         return ListView.get(self, request, *args, **kwargs)
 
+    @cached_property
+    def balance_summary(self):
+        return get_balance_summary(user_profile=self.user_profile, year=self.year)
+
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super(VacationListView, self).get_context_data(**kwargs)
         if self.request.GET.get("year") is not None:
@@ -101,6 +110,11 @@ class VacationListView(LoginRequiredMixin, ListView, ModelFormMixin):
                 "year"
             ).initial = self.request.GET.get("year")
         context["form"] = self.get_form(self.form_class)
+        context["balance"] = self.balance_summary
+        # 휴가 현황 표의 조각 캐시 키입니다. 휴가가 바뀌면 원장 캐시와 함께 바뀝니다.
+        context["balance_cache_key"] = get_balance_cache_key(
+            user_id=self.user_profile.user_id, year=self.year
+        )
         return context
 
 
@@ -122,6 +136,7 @@ class VacationCreateView(LoginRequiredMixin, CreateView):
     def form_invalid(self, form):
         return super().form_invalid(form)
 
+    @transaction.atomic
     def form_valid(self, form):
         form.instance.user = self.request.user
         start_at, end_at = get_start_and_end_at(
@@ -145,7 +160,12 @@ class VacationCreateView(LoginRequiredMixin, CreateView):
             messages.error(self.request, VacationMessages.START_GREATER_THAN_END)
             return super().form_invalid(form)
 
-        if does_vacation_overlap(user=self.request.user, start=start_at, end=end_at):
+        if does_vacation_overlap(
+            user=self.request.user,
+            start=start_at,
+            end=end_at,
+            vacation_type=int(form.instance.cat),
+        ):
             messages.error(self.request, VacationMessages.OVERLAPPED_VACATION)
             return super().form_invalid(form)
 
@@ -161,8 +181,6 @@ class VacationCreateView(LoginRequiredMixin, CreateView):
 
         vacation = form.save(commit=False)
         vacation.save()
-        user_profile = Profile.objects.get(user_id=form.instance.user.id)
-        get_vacation_days(user_profile=user_profile)
 
         channel = getattr(settings, "SLACK_VACATION_CHANNEL", None)
         try:
@@ -223,6 +241,7 @@ class VacationUpdateView(LoginRequiredMixin, UpdateView):
             start=start_at,
             end=end_at,
             vacation_id=form.instance.id,
+            vacation_type=int(form.instance.cat),
         ):
             messages.error(self.request, VacationMessages.OVERLAPPED_VACATION)
             return super().form_invalid(form)
@@ -245,6 +264,7 @@ class VacationDeleteView(LoginRequiredMixin, DeleteView):
     def get(self, request, *args, **kwargs):
         return self.delete(request, *args, **kwargs)
 
+    @transaction.atomic
     def delete(self, request, *args, **kwargs):
         channel = getattr(settings, "SLACK_VACATION_CHANNEL", None)
         vacation = self.get_object()
@@ -310,6 +330,7 @@ class AdminVacationUpdateView(IsSuperuserMixin, UpdateView):
             start=start_at,
             end=end_at,
             vacation_id=form.instance.id,
+            vacation_type=int(form.instance.cat),
         ):
             messages.error(self.request, VacationMessages.OVERLAPPED_VACATION)
             return super().form_invalid(form)
@@ -321,25 +342,26 @@ class AdminVacationUpdateView(IsSuperuserMixin, UpdateView):
         return super().form_invalid(form)
 
 
-class MemberListView(IsSuperuserMixin, ListView):
+class MemberListView(IsSuperuserMixin, KeysetPaginationMixin, ListView):
     template_name = "vacation/admin/member_list.html"
     context_object_name = "vacation_list"
+    keyset_ordering = ("-start_at", "-id")
 
     def get_queryset(self):
         member_name = self.request.GET.get("member_name")
         if member_name is None:
             return Vacation.objects.select_related("user").order_by(
-                "-start_at", "approval"
+                *self.keyset_ordering
             )
         else:
             try:
                 user = User.objects.get(first_name=member_name)
             except User.DoesNotExist:
-                return User.objects.none()
+                return Vacation.objects.none()
             return (
                 Vacation.objects.select_related("user")
                 .filter(user=user)
-                .order_by("-start_at", "approval")
+                .order_by(*self.keyset_ordering)
             )
 
 
@@ -375,7 +397,12 @@ class SickCreateView(IsSuperuserMixin, CreateView):
             messages.error(self.request, VacationMessages.START_GREATER_THAN_END)
             return super().form_invalid(form)
 
-        if does_vacation_overlap(user=form.instance.user, start=start_at, end=end_at):
+        if does_vacation_overlap(
+            user=form.instance.user,
+            start=start_at,
+            end=end_at,
+            vacation_type=int(form.instance.cat),
+        ):
             messages.error(self.request, VacationMessages.OVERLAPPED_VACATION)
             return super().form_invalid(form)
 
@@ -387,18 +414,21 @@ class SickCreateView(IsSuperuserMixin, CreateView):
 
         vacation = form.save(commit=False)
         vacation.save()
-        user_profile = Profile.objects.get(user_id=form.instance.user.id)
-        get_vacation_days(user_profile=user_profile)
 
         messages.success(self.request, VacationMessages.SUCCESSFUL_SUBMISSION)
         return super().form_valid(form)
 
 
 class UserVacationListView(IsSuperuserMixin, ListView):
-    queryset = User.objects.filter(is_active=True)
     template_name = "vacation/admin/change.html"
     context_object_name = "user_list"
 
+    def get_queryset(self):
+        return annotate_vacation_days(
+            user_list=User.objects.filter(is_active=True).order_by("id"),
+            year=datetime.date.today().year,
+        )
+
 
 class UserVacationDayUpdateView(IsSuperuserMixin, BaseUpdateView):
     queryset = Profile.objects.all()
@@ -444,7 +474,9 @@ class VacationApprovalView(IsSuperuserMixin, BaseUpdateView):
         vacation.approval = instance.approval
         vacation.save()
         user_profile = Profile.objects.get(user_id=instance.user.id)
-        used_days = get_total_used_days(user_profile=user_profile)
+        used_days = get_cached_balance(
+            user_id=vacation.user_id, year=vacation.start_at.year
+        ).used_days
 
         if user_profile.total_days - used_days < 0:
             instance.approval = VacationApproval.ON_HOLD.value
@@ -470,3 +502,42 @@ class VacationApprovalView(IsSuperuserMixin, BaseUpdateView):
         )
 
         return super().form_valid(form)
+
+
+class ExportView(IsSuperuserMixin, View):
+    """
+    기간(start ~ end, 기본값: 올해)의 휴가 또는 출근기록을 CSV(format=xlsx이면 XLSX)로 내려받습니다.
+    행을 나눠 읽으면서 바로 보내므로 기록이 많아도 메모리를 더 쓰지 않습니다.
+    """
+
+    def get(self, request, kind):
+        if kind not in EXPORTS:
+            raise Http404("내보낼 수 없는 항목입니다.")
+
+        file_format = request.GET.get("format", "csv")
+        if file_format not in FORMATS:
+            return HttpResponseBadRequest("지원하지 않는 파일 형식입니다.")
+        if file_format == "xlsx" and openpyxl is None:
+            return HttpResponseBadRequest("XLSX로 내보내려면 openpyxl을 설치해야 합니다.")
+
+        year = datetime.datetime.now().year
+        try:
+            start = datetime.date.fromisoformat(
+                request.GET.get("start") or f"{year}-01-01"
+            )
+            end = datetime.date.fromisoformat(request.GET.get("end") or f"{year}-12-31")
+        except ValueError:
+            return HttpResponseBadRequest(VacationMessages.INVALID_DATES)
+
+        header, get_rows = EXPORTS[kind]
+        content_type, stream = FORMATS[file_format]
+        rows = get_rows(
+            start, end, chunk_size=getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        )
+        response = StreamingHttpResponse(
+            stream(header, rows), content_type=content_type
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="{kind}_{start}_{end}.{file_format}"'
+        return response